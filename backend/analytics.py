@@ -0,0 +1,167 @@
+"""
+상품별 가격 통계 (main.py /api/analytics용)
+- 데이터셋별 스냅샷 데이터에서 (상품, 시각, 가격)을 뽑아 pandas로 한 번에 계산
+  - ram_price / ram_new: trends의 상품별 점
+  - compuzone: price_history의 "카테고리 용량" 별 price
+  - dram_exchange: price_history의 상품별 session_average
+- 일별 종가(그날 마지막 값)로 맞춘 뒤 빈 날은 직전 값으로 채워 계산
+  (상품의 마지막 관측 이후는 채우지 않음 → 수집이 끊긴 상품의 최근 N일 통계는 null)
+  - ma_7d / ma_30d / ma_90d: 최근 N일 이동평균
+  - volatility_30d: 최근 30일 일간 변동률(%)의 표준편차
+  - change_7d / change_30d / change_90d: N일 전 대비 변동률(%), change_all: 첫 값 대비
+  - min / max (+ 날짜): 전체 기간 (원본 시점 기준), min_30d / max_30d / min_90d / max_90d: 데이터셋 최신 시점 기준 최근 N일
+- 결과는 데이터셋별로 (상품, 시각, 가격) 행의 지문과 함께 캐시 → 내용이 바뀔 때만 다시 계산
+  (스케줄러가 꺼져 요청마다 새 dict를 로드하는 Vercel에서도 같은 내용이면 적중, 같은 객체면 행 추출도 생략)
+- pandas는 import만 수백 ms라 처음 계산할 때 import (main.py의 yfinance와 같은 이유)
+"""
+
+import threading
+
+from timeseries import points
+
+WINDOWS = (7, 30, 90)
+VOLATILITY_WINDOW = 30
+DECIMALS = 4
+
+# 응답 키 → 스냅샷 이름
+DATASETS = {
+    "ram_price": "ram-data",
+    "ram_new": "ram-new-data",
+    "compuzone": "compuzone-data",
+    "dram_exchange": "dramexchange-data",
+}
+
+
+# ============================================
+# (상품, 시각, 가격) 추출
+# ============================================
+def _trend_rows(data):
+    for product, series in (data.get("trends") or {}).items():
+        for point in series:
+            yield product, point["date"], point["price"]
+
+def _compuzone_rows(data):
+    for key, category, capacity, price in points(data.get("price_history") or {}, "capacity", "price"):
+        if capacity is not None:
+            yield f"{category} {capacity}", key, price
+
+def _dram_rows(data):
+    for key, _, product, price in points(data.get("price_history") or {}, "product", "session_average"):
+        if product is not None:
+            yield product, key, price
+
+ROWS = {
+    "ram_price": _trend_rows,
+    "ram_new": _trend_rows,
+    "compuzone": _compuzone_rows,
+    "dram_exchange": _dram_rows,
+}
+
+
+# ============================================
+# 계산
+# ============================================
+def compute(rows):
+    """[(상품, 시각 문자열, 가격)] → {"as_of": 최신 시각, "products": {상품: {통계}}}"""
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame(list(rows), columns=["product", "time", "price"])
+    df["price"] = pd.to_numeric(df["price"], errors="coerce")
+    # 0/음수는 수집 실패 값 (DRAMeXchange 빈 칸 등) → 변동률 계산에서 제외
+    df = df[df["price"] > 0]
+    if df.empty:
+        return {"as_of": None, "products": {}}
+    df["time"] = pd.to_datetime(df["time"], format="ISO8601")
+    df = df.sort_values("time", kind="stable")
+    as_of = df["time"].iloc[-1]
+
+    # 일별 종가 (상품 × 날짜), 빈 날은 직전 값 (첫 관측 이전 / 마지막 관측 이후는 NaN 유지)
+    daily = df.groupby(["product", df["time"].dt.floor("D")])["price"].last().unstack(0)
+    last_day = daily.apply(lambda column: column.last_valid_index())
+    daily = daily.reindex(pd.date_range(daily.index[0], daily.index[-1], freq="D")).ffill()
+    daily = daily.where(daily.index.values[:, None] <= last_day.values[None, :])
+    latest = daily.iloc[-1]
+
+    stats = pd.DataFrame(index=daily.columns)
+    stats["last"] = df.groupby("product")["price"].last()
+    stats["last_time"] = df.groupby("product")["time"].last().dt.strftime("%Y-%m-%d %H:%M")
+    stats["first_time"] = df.groupby("product")["time"].first().dt.strftime("%Y-%m-%d %H:%M")
+    stats["count"] = df.groupby("product")["price"].size()
+    for n in WINDOWS:
+        stats[f"ma_{n}d"] = daily.tail(n).mean()
+    returns = daily.pct_change(fill_method=None).tail(VOLATILITY_WINDOW)
+    stats[f"volatility_{VOLATILITY_WINDOW}d"] = returns.std() * 100
+    for n in WINDOWS:
+        before = daily.shift(n).iloc[-1]
+        stats[f"change_{n}d"] = (latest / before - 1) * 100
+    first = daily.bfill().iloc[0]
+    stats["change_all"] = (latest / first - 1) * 100
+
+    grouped = df.groupby("product")
+    stats["min"] = grouped["price"].min()
+    stats["max"] = grouped["price"].max()
+    stats["min_time"] = df.loc[grouped["price"].idxmin(), ["product", "time"]].set_index("product")["time"].dt.strftime("%Y-%m-%d %H:%M")
+    stats["max_time"] = df.loc[grouped["price"].idxmax(), ["product", "time"]].set_index("product")["time"].dt.strftime("%Y-%m-%d %H:%M")
+    for n in WINDOWS[1:]:
+        recent = df[df["time"] >= as_of - pd.Timedelta(days=n)].groupby("product")["price"]
+        stats[f"min_{n}d"] = recent.min()
+        stats[f"max_{n}d"] = recent.max()
+
+    numeric = stats.select_dtypes(include="number").columns
+    stats[numeric] = stats[numeric].replace([np.inf, -np.inf], np.nan).round(DECIMALS)
+    # NaN → None (응답 직렬화는 allow_nan=False)
+    stats = stats.astype(object).where(stats.notna(), None)
+    products = {product: {key: _plain(value) for key, value in row.items()}
+                for product, row in stats.to_dict("index").items()}
+    return {"as_of": as_of.strftime("%Y-%m-%d %H:%M"), "products": products}
+
+def _plain(value):
+    # numpy 스칼라 → 파이썬 기본 타입 (json 직렬화용)
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+# ============================================
+# 캐시 (데이터셋별 - 스냅샷 데이터가 바뀔 때만 다시 계산)
+# ============================================
+def fingerprint(rows):
+    """계산 입력 행의 지문 (프로세스 안 캐시 비교용)"""
+    return len(rows), hash(tuple(rows))
+
+
+class AnalyticsCache:
+    def __init__(self):
+        # 데이터셋 → (마지막 data 객체, 행 지문, 결과). 객체를 같이 들고 있어 is 비교가 안전
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, dataset, data):
+        """data에 대한 통계 (같은 객체 또는 같은 내용이면 캐시) → (결과, 캐시 적중 여부)"""
+        entry = self._entries.get(dataset)
+        if entry and entry[0] is data:
+            return entry[2], True
+        with self._lock:
+            entry = self._entries.get(dataset)
+            if entry and entry[0] is data:
+                return entry[2], True
+            rows = list(ROWS[dataset](data))
+            key = fingerprint(rows)
+            if entry and entry[1] == key:
+                self._entries[dataset] = (data, key, entry[2])
+                return entry[2], True
+            result = compute(rows)
+            self._entries[dataset] = (data, key, result)
+            return result, False
+
+    def on_snapshot(self, prev, snapshot):
+        """Scheduler 리스너 - 교체된 스냅샷의 캐시를 버림 (이전 데이터를 붙잡고 있지 않도록)"""
+        for dataset, name in DATASETS.items():
+            if name == snapshot.name:
+                self._entries.pop(dataset, None)
+
+
+cache = AnalyticsCache()
@@ -0,0 +1,102 @@
+"""
+카페 시세 글 일괄 파싱 (과거 글 백필용)
+- JSONL 아카이브({"date", "time", "text"} 한 줄에 하나)를 프로세스 풀에서 파싱 (CLI)
+  API(/api/admin/batch-parse)는 서버리스에서 돌 수 있어 현재 프로세스에서 파싱
+- 파싱 로그 없이 결과만 모아 price_history / price_data 형식으로 병합
+- 결과 파일은 ram_price_junggo.json 과 같은 구조라 그대로 가져다 쓸 수 있음
+
+사용법: cd backend && python batch_parse.py posts.jsonl -o merged.json [--workers 4] [--base ram_price_junggo.json]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+from price_parser import parse_price_data
+from price_store import PriceStore
+
+# 이보다 적은 글은 프로세스 생성 비용이 더 커서 현재 프로세스에서 파싱
+POOL_THRESHOLD = 32
+
+def history_key(post):
+    return f"{post['date']} {post.get('time', '')}".strip()
+
+def parse_posts(posts, workers=None):
+    """글 목록 → [(history_key, parsed), ...] (입력 순서 유지)"""
+    texts = [post["text"] for post in posts]
+    parsed = None
+    if len(texts) >= POOL_THRESHOLD and workers != 1:
+        parsed = _parse_in_pool(texts, workers)
+    if parsed is None:
+        parsed = [parse_price_data(text) for text in texts]
+    return [(history_key(post), result) for post, result in zip(posts, parsed)]
+
+def _parse_in_pool(texts, workers):
+    """프로세스 풀에서 파싱. 풀을 쓸 수 없는 환경(/dev/shm 세마포어가 없는 서버리스 등)이면 None"""
+    # main.py가 import할 때 multiprocessing까지 끌어오지 않도록 여기서 import
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(texts) // (workers * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(parse_price_data, texts, chunksize=chunksize))
+    except (OSError, NotImplementedError, BrokenProcessPool) as e:
+        print(f"⚠️ 프로세스 풀 사용 불가, 현재 프로세스에서 파싱: {e}", file=sys.stderr)
+        return None
+
+def merge_parsed(results, base=None):
+    """파싱 결과를 시점 순서대로 price_history / price_data 에 병합
+
+    반환: (병합된 데이터, 제품이 하나도 없어 건너뛴 history_key 목록)
+    """
+    store = PriceStore.from_json(base)
+    updates = [(key, parsed) for key, parsed in results if parsed]
+    skipped = sorted(key for key, parsed in results if not parsed)
+
+    # 최신 시세는 가장 늦은 시점 값이 남도록 기존 히스토리까지 시점 순서대로 반영
+    for key, parsed in updates:
+        store.history[key] = parsed
+    store.apply_many(list(store.history.items()))
+
+    return store.to_json(), skipped
+
+def read_archive(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("archive", help="JSONL 아카이브 ({\"date\", \"time\", \"text\"})")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSON 경로 (기본: 표준출력)")
+    parser.add_argument("--base", help="병합할 기존 데이터 파일 (예: ram_price_junggo.json)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    start = time.time()
+    posts = read_archive(args.archive)
+
+    base = None
+    if args.base:
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+
+    results = parse_posts(posts, workers=args.workers)
+    merged, skipped = merge_parsed(results, base)
+
+    if args.output == "-":
+        json.dump(merged, sys.stdout, ensure_ascii=False, indent=2)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(merged, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ 글 {len(posts)}개 파싱 ({len(posts) - len(skipped)}개 반영, {len(skipped)}개 제품 없음) "
+          f"- {time.time() - start:.2f}초", file=sys.stderr)
+    for key in skipped:
+        print(f"  ⚠️ 제품 없음: {key}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+API 엔드포인트 벤치마크 (GitHub / Yahoo 접속 없이)
+- DATA_DIR=backend 로 커밋된 JSON 파일을 데이터 소스로 사용
+- yfinance.download 는 기록해 둔 응답(fixtures/yfinance_<기간>_<봉>.csv.gz)으로 대체
+  기록이 없으면 시세 엔드포인트를 측정하지 않고 종료 (--record로 기록)
+  --synthetic-market 이면 고정 시드로 같은 모양의 합성 데이터 사용 (결과에 market: synthetic으로 표시)
+- uvicorn 서버를 별도 프로세스로 띄우고 엔드포인트마다 동시 접속 N개로 요청
+- 처리량, p50/p95/p99 지연, 서버 최대 RSS, 응답 크기를 보고
+- 결과는 results/bench_api.jsonl 에 누적 → --compare 로 같은 설정의 직전 실행과 비교
+
+사용법: cd backend && python benchmarks/bench_api.py [--concurrency 8] [--requests 200] [--gzip] [--compare]
+        python benchmarks/bench_api.py --record   (실제 yfinance 응답을 fixtures에 기록, 네트워크 필요)
+        python benchmarks/bench_api.py --synthetic-market   (기록 없이 합성 시세로 측정)
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import socket
+import argparse
+import threading
+import subprocess
+import http.client
+from datetime import datetime
+from urllib.parse import quote
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(BENCH_DIR, '..'))
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+RESULTS_PATH = os.path.join(BENCH_DIR, "results", "bench_api.jsonl")
+
+sys.path.insert(0, BACKEND_DIR)
+
+ENDPOINTS = [
+    "/api/ram-data",
+    "/api/ram-data?days=30",
+    "/api/ram-new-data",
+    "/api/compuzone-data",
+    "/api/dramexchange-data",
+    "/api/dramexchange-data?days=14",
+    f"/api/market-data?period={quote('1개월')}",
+    "/api/dashboard",
+]
+# 시세(yfinance)를 쓰는 엔드포인트 - 기록한 응답이 있어야 측정
+MARKET_ENDPOINTS = ("/api/market-data", "/api/dashboard")
+
+SNAPSHOT_SOURCES = ["ram-data", "ram-new-data", "compuzone-data", "dramexchange-data"]
+
+# ============================================
+# yfinance 대역
+# ============================================
+# main.get_period_str 결과 → 행 수 (대략 실제 거래일/봉 수)
+PERIOD_ROWS = {("5d", "90m"): 25, ("1mo", "1d"): 22, ("6mo", "1d"): 126, ("1y", "1d"): 252}
+
+BASE_PRICES = {
+    "^KS11": 2600, "^DJI": 39000, "^GSPC": 5200, "^IXIC": 16000, "CL=F": 80, "GC=F": 2300,
+    "^VIX": 15, "HG=F": 4.5, "KRW=X": 1380, "JPYKRW=X": 9.0, "DX-Y.NYB": 105, "ZT=F": 102,
+    "^TNX": 4.3, "CNY=X": 7.2,
+}
+
+def fixture_path(period, interval):
+    return os.path.join(FIXTURE_DIR, f"yfinance_{period}_{interval}.csv.gz")
+
+def synthetic_download(symbols, period, interval):
+    """yf.download(group_by='ticker')와 같은 MultiIndex 컬럼 (종목, 필드) 데이터프레임"""
+    import numpy as np
+    import pandas as pd
+
+    rows = PERIOD_ROWS.get((period, interval), 252)
+    freq = "90min" if interval == "90m" else "B"
+    index = pd.date_range(end="2026-08-21 16:00", periods=rows, freq=freq)
+    frames = {}
+    for symbol in symbols:
+        rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+        base = BASE_PRICES.get(symbol, 100)
+        close = base * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+        spread = np.abs(rng.normal(0, 0.005, rows)) * close
+        frames[symbol] = pd.DataFrame({
+            "Open": close - spread / 2, "High": close + spread, "Low": close - spread,
+            "Close": close, "Volume": rng.integers(1_000, 1_000_000, rows),
+        }, index=index)
+    return pd.concat(frames, axis=1)
+
+def missing_fixtures():
+    return [fixture_path(period, interval) for period, interval in PERIOD_ROWS
+            if not os.path.exists(fixture_path(period, interval))]
+
+def stub_download(symbols, period="1y", interval="1d", **kwargs):
+    import pandas as pd
+
+    if os.environ.get("BENCH_SYNTHETIC_MARKET") == "1":
+        return synthetic_download(symbols, period, interval)
+    path = fixture_path(period, interval)
+    if not os.path.exists(path):
+        # 합성 데이터로 조용히 대체하지 않음 (측정 결과가 실제 응답과 달라짐)
+        raise FileNotFoundError(f"기록한 yfinance 응답 없음: {path} (--record 또는 --synthetic-market)")
+    return pd.read_csv(path, header=[0, 1], index_col=0, parse_dates=True)
+
+def install_yfinance_stub():
+    import yfinance
+    yfinance.download = stub_download
+
+def record_fixtures():
+    """실제 yfinance 응답을 기간별로 저장 (main.build_market_data와 같은 인자)"""
+    import yfinance as yf
+    from main import MARKET_PERIODS, get_period_str
+
+    symbols = list(BASE_PRICES)
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for label in MARKET_PERIODS:
+        period, interval = get_period_str(label)
+        df = yf.download(symbols, period=period, interval=interval, progress=False, group_by='ticker')
+        path = fixture_path(period, interval)
+        df.to_csv(path, compression="gzip")
+        print(f"📼 {label}: {len(df)}행 → {os.path.relpath(path, BACKEND_DIR)}")
+
+# ============================================
+# 서버
+# ============================================
+SERVER = r'''
+import sys
+sys.path.insert(0, {backend!r}); sys.path.insert(0, {bench!r})
+import bench_api
+bench_api.install_yfinance_stub()
+import uvicorn
+from main import app
+uvicorn.run(app, host="127.0.0.1", port={port}, log_level="warning")
+'''
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(port, scheduler, metrics_enabled, synthetic_market):
+    env = dict(os.environ,
+               DATA_DIR=BACKEND_DIR,
+               SCHEDULER_ENABLED="1" if scheduler else "0",
+               METRICS_ENABLED="1" if metrics_enabled else "0",
+               BENCH_SYNTHETIC_MARKET="1" if synthetic_market else "0")
+    env.pop("VERCEL", None)
+    code = SERVER.format(backend=BACKEND_DIR, bench=BENCH_DIR, port=port)
+    return subprocess.Popen([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env)
+
+def get(port, path, timeout=5):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+    try:
+        conn.request("GET", path)
+        res = conn.getresponse()
+        return res.status, res.read()
+    finally:
+        conn.close()
+
+def wait_ready(proc, port, scheduler, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("서버 프로세스 종료됨")
+        try:
+            status, body = get(port, "/api/metrics" if scheduler else "/")
+        except OSError:
+            time.sleep(0.2)
+            continue
+        if not scheduler or status == 404:
+            return
+        # 스케줄러가 데이터 스냅샷을 모두 올릴 때까지 대기
+        text = body.decode()
+        if all(f'source="{name}"' in text for name in SNAPSHOT_SOURCES):
+            return
+        time.sleep(0.2)
+    raise RuntimeError("서버 준비 시간 초과")
+
+def read_peak_rss_mb(pid):
+    """/proc/<pid>/status 의 VmHWM (Linux 전용, 없으면 None)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def reset_peak_rss(pid):
+    # "5" = 최대 RSS 초기화 (Linux 4.0+). 실패하면 누적 최대값으로 보고
+    try:
+        with open(f"/proc/{pid}/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+# ============================================
+# 부하
+# ============================================
+def worker(port, path, count, headers, samples, errors):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            res = conn.getresponse()
+            body = res.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(1)
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+            continue
+        elapsed = time.perf_counter() - start
+        if res.status != 200:
+            errors.append(res.status)
+        samples.append((elapsed, len(body)))
+    conn.close()
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+def run_endpoint(proc, port, path, total, concurrency, headers, warmup):
+    for _ in range(warmup):
+        worker(port, path, 1, headers, [], [])
+    reset_peak_rss(proc.pid)
+
+    samples, errors = [], []
+    per_worker = [total // concurrency + (1 if i < total % concurrency else 0) for i in range(concurrency)]
+    threads = [threading.Thread(target=worker, args=(port, path, n, headers, samples, errors))
+               for n in per_worker if n]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    latencies = sorted(s[0] * 1000 for s in samples)
+    sizes = [s[1] for s in samples]
+    return {
+        "endpoint": path,
+        "requests": len(samples),
+        "errors": len(errors),
+        "throughput_rps": round(len(samples) / wall, 1) if wall else 0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "peak_rss_mb": read_peak_rss_mb(proc.pid),
+        "response_bytes": max(sizes) if sizes else 0,
+    }
+
+# ============================================
+# 결과 저장 / 비교
+# ============================================
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=BACKEND_DIR).stdout.strip() or None
+    except OSError:
+        return None
+
+def load_previous(config):
+    if not os.path.exists(RESULTS_PATH):
+        return None
+    previous = None
+    with open(RESULTS_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry.get("config") == config:
+                previous = entry
+    return previous
+
+def save_run(entry):
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+def pct_change(new, old):
+    return f"{(new - old) / old * 100:+.1f}%" if old else "-"
+
+def print_results(results, previous=None):
+    prev = {r["endpoint"]: r for r in previous["results"]} if previous else {}
+    print(f"{'엔드포인트':<38} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'RSS MB':>7} {'크기':>10}  오류")
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.0f}" if r["peak_rss_mb"] else "-"
+        print(f"{r['endpoint']:<38} {r['throughput_rps']:>8.1f} {r['p50_ms']:>6.1f}ms {r['p95_ms']:>6.1f}ms "
+              f"{r['p99_ms']:>6.1f}ms {rss:>7} {r['response_bytes']:>10,}  {r['errors']}")
+        old = prev.get(r["endpoint"])
+        if old:
+            print(f"{'  └ 직전 대비':<38} {pct_change(r['throughput_rps'], old['throughput_rps']):>8} "
+                  f"{pct_change(r['p50_ms'], old['p50_ms']):>8} {pct_change(r['p95_ms'], old['p95_ms']):>8} "
+                  f"{pct_change(r['p99_ms'], old['p99_ms']):>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="엔드포인트별 요청 수")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--gzip", action="store_true", help="Accept-Encoding: gzip 로 요청")
+    parser.add_argument("--no-scheduler", action="store_true",
+                        help="스케줄러 끄기 (미리 렌더링한 파일 / 요청 시 로드 경로 측정)")
+    parser.add_argument("--no-metrics", action="store_true", help="METRICS_ENABLED=0 으로 실행")
+    parser.add_argument("--endpoint", action="append", help="측정할 엔드포인트 (여러 번 지정 가능)")
+    parser.add_argument("--compare", action="store_true", help="같은 설정의 직전 실행과 비교")
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    parser.add_argument("--record", action="store_true", help="yfinance 응답 기록 후 종료")
+    parser.add_argument("--synthetic-market", action="store_true",
+                        help="기록한 yfinance 응답 대신 합성 시세 사용 (실제 응답과 크기/모양이 다름)")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return
+
+    endpoints = args.endpoint or ENDPOINTS
+    uses_market = any(path.startswith(MARKET_ENDPOINTS) for path in endpoints)
+    if uses_market and not args.synthetic_market:
+        missing = missing_fixtures()
+        if missing:
+            print("❌ 기록한 yfinance 응답이 없습니다:")
+            for path in missing:
+                print(f"   {os.path.relpath(path, BACKEND_DIR)}")
+            print("   → python benchmarks/bench_api.py --record 로 기록하거나 (네트워크 필요)")
+            print("     --synthetic-market 으로 합성 시세를 쓰거나, --endpoint로 시세 엔드포인트를 빼고 실행")
+            sys.exit(1)
+    if uses_market and args.synthetic_market:
+        print("⚠️ 합성 시세로 측정 - market-data / dashboard 결과는 실제 응답 기준과 비교할 수 없음")
+
+    config = {
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "gzip": args.gzip,
+        "scheduler": not args.no_scheduler,
+        "metrics": not args.no_metrics,
+        "endpoints": endpoints,
+        "market": ("synthetic" if args.synthetic_market else "recorded") if uses_market else None,
+    }
+    headers = {"Accept-Encoding": "gzip"} if args.gzip else {"Accept-Encoding": "identity"}
+    previous = load_previous(config) if args.compare else None
+
+    port = free_port()
+    proc = start_server(port, config["scheduler"], config["metrics"], args.synthetic_market)
+    try:
+        wait_ready(proc, port, config["scheduler"] and config["metrics"])
+        results = [run_endpoint(proc, port, path, args.requests, args.concurrency, headers, args.warmup)
+                   for path in config["endpoints"]]
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    print_results(results, previous)
+    if previous:
+        print(f"(비교 대상: {previous['timestamp']} / {previous.get('commit')})")
+
+    if not args.no_save:
+        save_run({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "config": config,
+            "results": results,
+        })
+        print(f"💾 {os.path.relpath(RESULTS_PATH, BACKEND_DIR)}")
+
+if __name__ == "__main__":
+    main()
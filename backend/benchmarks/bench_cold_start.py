@@ -0,0 +1,166 @@
+"""
+API 콜드 스타트 측정
+- 엔드포인트마다 새 파이썬 프로세스(python -X importtime)에서 main을 import하고 첫 요청을 처리
+- import 시간을 "main import" / "첫 요청 중 추가 import" 두 구간으로 나눠 기록
+- 무거운 모듈(yfinance, pandas, numpy, requests ...)이 어느 시점에 로드되는지 표시
+- 빈 FastAPI 앱 import 시간을 기준으로 --budget-ms 초과 시 종료 코드 1 (market-data 제외)
+
+사용법: cd backend && python benchmarks/bench_cold_start.py [--repeat 3] [--budget-ms 100] [--endpoint /api/ram-data]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+ENDPOINTS = [
+    "/",
+    "/api/ram-data",
+    "/api/ram-new-data",
+    "/api/compuzone-data",
+    "/api/dramexchange-data",
+    "/api/dashboard?sections=ram,ram_new,compuzone,dramexchange",
+    "/api/market-data",
+]
+
+# 예산 검사에서 제외 (yfinance/pandas가 필요한 엔드포인트)
+BUDGET_EXEMPT = ("/api/market-data",)
+
+HEAVY_MODULES = ["yfinance", "pandas", "numpy", "requests", "urllib3", "multiprocessing", "httpx"]
+
+PHASE_MARKER = "@@phase"
+
+# 자식 프로세스: main import → 마커 → ASGI 앱을 직접 호출 (TestClient/httpx import 없이)
+CHILD = r'''
+import sys, time, json, asyncio
+sys.path.insert(0, {backend!r})
+path, _, query = {endpoint!r}.partition("?")
+
+t0 = time.perf_counter()
+{import_stmt}
+t1 = time.perf_counter()
+after_import = set(sys.modules)
+sys.stderr.write("{marker} request\n"); sys.stderr.flush()
+
+status = None
+if {call!r}:
+    async def call():
+        global status
+        scope = {{"type": "http", "asgi": {{"version": "3.0"}}, "http_version": "1.1", "method": "GET",
+                  "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+                  "query_string": query.encode(), "headers": [], "client": ("127.0.0.1", 1),
+                  "server": ("127.0.0.1", 80)}}
+        requested = False
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {{"type": "http.request", "body": b"", "more_body": False}}
+            # 응답이 끝날 때까지 연결 유지 (FileResponse는 끊김 감지용으로 receive를 계속 기다림)
+            await asyncio.Event().wait()
+        async def send(message):
+            global status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+        await app(scope, receive, send)
+    asyncio.run(call())
+t2 = time.perf_counter()
+
+heavy = {heavy!r}
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "request_ms": (t2 - t1) * 1000,
+    "status": status,
+    "heavy_at_import": [m for m in heavy if m in after_import],
+    "heavy_after_request": [m for m in heavy if m in sys.modules],
+}}))
+'''
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → 구간별 최상위 import 누적 시간(ms)"""
+    phases = {"import": 0.0, "request": 0.0}
+    phase = "import"
+    for line in stderr.splitlines():
+        if line.startswith(PHASE_MARKER):
+            phase = line.split()[1]
+            continue
+        m = IMPORTTIME_RE.match(line)
+        # 들여쓰기 1칸(최상위)만 더해야 중첩 import가 두 번 세지지 않음
+        if m and len(m.group(3)) == 1:
+            phases[phase] += int(m.group(2)) / 1000
+    return phases
+
+def run_child(endpoint, bare=False):
+    code = CHILD.format(
+        backend=BACKEND_DIR,
+        endpoint=endpoint,
+        import_stmt="from fastapi import FastAPI; app = FastAPI()" if bare else "from main import app",
+        call=not bare,
+        marker=PHASE_MARKER,
+        heavy=HEAVY_MODULES,
+    )
+    env = dict(os.environ, SCHEDULER_ENABLED="0", PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, cwd=BACKEND_DIR, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{endpoint}: 자식 프로세스 실패\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result.update({f"importtime_{k}_ms": v for k, v in parse_importtime(proc.stderr).items()})
+    return result
+
+def best_of(endpoint, repeat, bare=False):
+    runs = [run_child(endpoint, bare=bare) for _ in range(repeat)]
+    best = min(runs, key=lambda r: r["importtime_import_ms"] + r["importtime_request_ms"])
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="엔드포인트별 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="빈 FastAPI 대비 허용 import 시간 (ms)")
+    parser.add_argument("--endpoint", action="append", help="측정할 엔드포인트 (여러 번 지정 가능)")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    bare = best_of("/", args.repeat, bare=True)
+    baseline = bare["importtime_import_ms"]
+    print(f"빈 FastAPI import: {baseline:.0f}ms (기준)")
+    print(f"{'엔드포인트':<55} {'main import':>11} {'요청 중 import':>13} {'기준 대비':>9}  무거운 모듈")
+
+    results = []
+    over = []
+    for endpoint in args.endpoint or ENDPOINTS:
+        r = best_of(endpoint, args.repeat)
+        total = r["importtime_import_ms"] + r["importtime_request_ms"]
+        r.update({"endpoint": endpoint, "over_baseline_ms": total - baseline})
+        results.append(r)
+
+        heavy = ", ".join(m for m in r["heavy_after_request"]) or "-"
+        late = set(r["heavy_after_request"]) - set(r["heavy_at_import"])
+        if late:
+            heavy += f" (요청 시 로드: {', '.join(sorted(late))})"
+        exempt = endpoint.startswith(BUDGET_EXEMPT)
+        flag = "" if exempt or r["over_baseline_ms"] <= args.budget_ms else "  ❌"
+        if flag:
+            over.append(endpoint)
+        print(f"{endpoint:<55} {r['importtime_import_ms']:>9.0f}ms {r['importtime_request_ms']:>11.0f}ms "
+              f"{r['over_baseline_ms']:>+7.0f}ms  {heavy}{flag}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"baseline_ms": baseline, "budget_ms": args.budget_ms, "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+    if over:
+        print(f"❌ 예산({args.budget_ms:.0f}ms) 초과: {', '.join(over)}")
+        sys.exit(1)
+    print(f"✅ JSON 엔드포인트 모두 예산({args.budget_ms:.0f}ms) 이내")
+
+if __name__ == "__main__":
+    main()
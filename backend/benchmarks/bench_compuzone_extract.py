@@ -0,0 +1,145 @@
+"""
+컴퓨존 검색 페이지 추출 회귀 벤치마크
+- 저장된 검색 페이지(기본: fixtures/compuzone_search.html)를 headless Chrome으로 열고
+- 로딩 대기 조건(page_source 폴링 vs 셀렉터 확인)과
+- 추출 스크립트(기존 전체 DOM 스캔 vs 제품 목록 범위 한정)의 실행 시간을 비교
+- 컨테이너 셀렉터가 옵션 없는 요소에 맞는 경우(페이지 구조 변경)에도 페이지의 체크박스 행만으로 같은 옵션을 추출하는지 확인
+- fixtures/compuzone_search.html은 합성 페이지 (컨테이너 id가 PRODUCT_LIST_SELECTORS에 맞춰져 있음)
+  → 셀렉터가 실제 페이지에 맞는지는 브라우저에서 "다른 이름으로 저장"한 검색 페이지를 --html로 넘겨 확인
+
+사용법: cd backend && python benchmarks/bench_compuzone_extract.py [--html 저장된페이지.html] [--repeat 10]
+"""
+
+import os
+import sys
+import time
+import argparse
+import pathlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from crawler_compuzone import setup_driver, READY_JS, EXTRACT_OPTIONS_JS, PRODUCT_LIST_SELECTORS
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "compuzone_search.html")
+
+# 기존 extract_products의 스크립트 (비교용)
+LEGACY_EXTRACT_JS = """
+    var results = [];
+
+    // 모든 제품 블록을 찾기 (제품명 + 옵션)
+    var allText = document.body.innerText;
+
+    // 제품 제목과 옵션을 포함하는 영역 찾기
+    // 방법 1: 체크박스 input의 부모 행에서 추출
+    var checkboxes = document.querySelectorAll('input[type="checkbox"]');
+    var optionRows = [];
+
+    checkboxes.forEach(function(cb) {
+        var row = cb.closest('tr') || cb.closest('li') || cb.closest('div');
+        if (row) {
+            var text = row.innerText || row.textContent || '';
+            // [8GB] (5600) ... 179,000원 패턴 확인
+            if (text.match(/\\[\\d+GB\\]/)) {
+                optionRows.push(text.trim());
+            }
+        }
+    });
+
+    // 방법 2: 테이블 행에서 추출
+    if (optionRows.length === 0) {
+        var rows = document.querySelectorAll('tr, li, .opt_item, .option_item');
+        rows.forEach(function(row) {
+            var text = row.innerText || row.textContent || '';
+            if (text.match(/\\[\\d+GB\\]/) && text.match(/[\\d,]+원/)) {
+                optionRows.push(text.trim());
+            }
+        });
+    }
+
+    // 방법 3: 모든 텍스트 노드에서 GB와 원이 근접한 것 찾기
+    if (optionRows.length === 0) {
+        var allElements = document.querySelectorAll('*');
+        allElements.forEach(function(el) {
+            if (el.children.length === 0 || el.children.length < 5) {
+                var text = el.innerText || '';
+                if (text.match(/\\[\\d+GB\\]/) && text.match(/[\\d,]+원/) && text.length < 500) {
+                    optionRows.push(text.trim());
+                }
+            }
+        });
+    }
+
+    return {
+        optionRows: optionRows,
+        // 제품 제목도 추출
+        titles: Array.from(document.querySelectorAll('a, span, div')).filter(function(el) {
+            var t = el.innerText || '';
+            return t.indexOf('[삼성전자]') >= 0 && t.indexOf('DDR5') >= 0 && t.indexOf('PC5-44800') >= 0 && t.length < 200;
+        }).map(function(el) { return el.innerText.trim(); }).filter(function(v, i, a) { return a.indexOf(v) === i; })
+    };
+"""
+
+def legacy_ready(driver):
+    source = driver.page_source
+    return "DDR5" in source and "원" in source
+
+def ready(driver):
+    return driver.execute_script(READY_JS, PRODUCT_LIST_SELECTORS)
+
+def legacy_extract(driver):
+    return driver.execute_script(LEGACY_EXTRACT_JS)
+
+def extract(driver):
+    return driver.execute_script(EXTRACT_OPTIONS_JS, PRODUCT_LIST_SELECTORS)
+
+def measure(driver, fn, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(driver)
+        times.append(time.perf_counter() - start)
+    return result, min(times), sum(times) / len(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--html", default=FIXTURE, help="저장된 컴퓨존 검색 페이지")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if os.path.abspath(args.html) == FIXTURE:
+        print("⚠️ 합성 픽스처로 측정 - 실제 페이지의 셀렉터 적중 여부는 --html 저장된페이지.html 로 확인")
+
+    driver = setup_driver()
+    try:
+        driver.get(pathlib.Path(args.html).resolve().as_uri())
+
+        print(f"{'단계':<28} {'최소(ms)':>10} {'평균(ms)':>10}")
+        for label, fn in [("대기 조건: page_source", legacy_ready),
+                          ("대기 조건: 셀렉터 확인", ready),
+                          ("추출: 전체 DOM", legacy_extract),
+                          ("추출: 제품 목록 한정", extract)]:
+            _, best, avg = measure(driver, fn, args.repeat)
+            print(f"{label:<28} {best*1000:>10.1f} {avg*1000:>10.1f}")
+
+        old = legacy_extract(driver)
+        new = extract(driver)
+        print(f"옵션 행: 기존 {len(old['optionRows'])}개 / 신규 {len(new['optionRows'])}개")
+        print(f"제목 후보: 기존 {len(old['titles'])}개 / 신규 {len(new['titles'])}개")
+        print(f"추출 범위: {new.get('scope')}")
+        if old["optionRows"] != new["optionRows"]:
+            print("⚠️ 옵션 행 결과가 다릅니다")
+            sys.exit(1)
+
+        # 셀렉터가 옵션 없는 요소에 맞는 경우 → 체크박스 행만으로 추출해 같은 결과여야 함
+        wrong = ["head"]
+        fallback = driver.execute_script(EXTRACT_OPTIONS_JS, wrong)
+        if not driver.execute_script(READY_JS, wrong) or fallback["optionRows"] != old["optionRows"]:
+            print(f"⚠️ 빈 컨테이너에서 체크박스 행으로 대체하지 못함 (옵션 행 {len(fallback['optionRows'])}개)")
+            sys.exit(1)
+        print(f"빈 컨테이너 대체: {fallback['scope']} / 옵션 행 {len(fallback['optionRows'])}개")
+    finally:
+        driver.quit()
+
+if __name__ == "__main__":
+    main()
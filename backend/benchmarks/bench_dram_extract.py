@@ -0,0 +1,104 @@
+"""
+DRAM Exchange 테이블 추출 벤치마크
+- fixtures/dramexchange_home.html 을 headless Chrome으로 열고
+- 기존 방식(행/셀마다 find_elements + .text)과 단일 execute_script 방식을 비교
+
+사용법: cd backend && python benchmarks/bench_dram_extract.py [--repeat 5]
+"""
+
+import os
+import sys
+import time
+import argparse
+import pathlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from selenium.webdriver.common.by import By
+
+from dram_exchange_crawler import setup_driver, extract_table_rows, parse_dram_rows, NON_NUMERIC
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "dramexchange_home.html")
+
+def legacy_extract(driver):
+    """기존 crawl_dram_exchange의 셀 단위 추출 루프"""
+    results = {}
+    rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+    if not rows:
+        rows = driver.find_elements(By.CSS_SELECTOR, "tr")
+    for row in rows:
+        try:
+            cells = row.find_elements(By.TAG_NAME, "td")
+            if not cells or len(cells) < 3: continue
+            product_cell = cells[0].text.strip()
+            current_category = None
+            if "DDR5" in product_cell: current_category = "DDR5"
+            elif "DDR4" in product_cell: current_category = "DDR4"
+            elif "DDR3" in product_cell: current_category = "DDR3"
+            if not current_category: continue
+            results.setdefault(current_category, []).append({
+                "product": product_cell,
+                "daily_high": float(NON_NUMERIC.sub('', cells[1].text)) if len(cells) > 1 else 0,
+                "daily_low": float(NON_NUMERIC.sub('', cells[2].text)) if len(cells) > 2 else 0,
+                "session_high": float(NON_NUMERIC.sub('', cells[3].text)) if len(cells) > 3 else 0,
+                "session_low": float(NON_NUMERIC.sub('', cells[4].text)) if len(cells) > 4 else 0,
+                "session_average": float(NON_NUMERIC.sub('', cells[5].text)) if len(cells) > 5 else 0,
+                "session_change": cells[6].text.strip() if len(cells) > 6 else "N/A",
+            })
+        except Exception: continue
+    return results
+
+def single_pass_extract(driver):
+    return parse_dram_rows(extract_table_rows(driver))
+
+def count_commands(driver):
+    """driver.execute 호출 수(= WebDriver HTTP 왕복 수)를 세는 래퍼 설치"""
+    counter = {"n": 0}
+    original = driver.execute
+
+    def execute(*args, **kwargs):
+        counter["n"] += 1
+        return original(*args, **kwargs)
+
+    driver.execute = execute
+    return counter
+
+def run(driver, fn, counter, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        counter["n"] = 0
+        start = time.perf_counter()
+        result = fn(driver)
+        times.append(time.perf_counter() - start)
+    return result, min(times), sum(times) / len(times), counter["n"]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--html", default=FIXTURE, help="측정할 저장된 페이지 (기본: fixture)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("GITHUB_ACTIONS", "true")  # setup_driver의 headless 옵션 사용
+    driver = setup_driver()
+    try:
+        driver.get(pathlib.Path(args.html).resolve().as_uri())
+        counter = count_commands(driver)
+
+        legacy, legacy_best, legacy_avg, legacy_calls = run(driver, legacy_extract, counter, args.repeat)
+        single, single_best, single_avg, single_calls = run(driver, single_pass_extract, counter, args.repeat)
+
+        print(f"{'방식':<12} {'최소(ms)':>10} {'평균(ms)':>10} {'왕복 수':>8}")
+        print(f"{'셀 단위':<12} {legacy_best*1000:>10.1f} {legacy_avg*1000:>10.1f} {legacy_calls:>8}")
+        print(f"{'단일 스크립트':<12} {single_best*1000:>10.1f} {single_avg*1000:>10.1f} {single_calls:>8}")
+        print(f"속도 향상: x{legacy_avg / single_avg:.1f}")
+
+        if legacy != single:
+            print("❌ 결과 불일치")
+            sys.exit(1)
+        print(f"✅ 결과 일치 ({sum(len(v) for v in single.values())}개 행)")
+    finally:
+        driver.quit()
+
+if __name__ == "__main__":
+    main()
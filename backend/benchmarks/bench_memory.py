@@ -0,0 +1,132 @@
+"""
+크롤러 데이터 스냅샷의 메모리 사용량 벤치마크 (COMPACT_HISTORY=0 vs 1)
+- 모드마다 새 자식 프로세스에서 main.py를 import하고 (스케줄러 끔, DATA_DIR 지정)
+  yfinance를 쓰지 않는 4개 스냅샷(ram / ram-new / compuzone / dramexchange)을 갱신
+- rss: 갱신 전후 VmRSS 차이 (gc 후, /proc/self/status)
+- retained: 별도 자식 프로세스에서 tracemalloc으로 측정한 갱신 후 남은 할당량
+  (tracemalloc 자체가 RSS를 키우므로 rss 측정과 분리)
+- render: 스냅샷별 render_json 시간 (repeat회 중 최솟값) - 압축 표현의 직렬화 비용 확인용
+- --scale N 이면 synth_history로 현재 이력의 N배 파일을 임시 디렉토리에 만들어 측정
+
+사용법: cd backend && python benchmarks/bench_memory.py [--data-dir .] [--scale 10] [--repeat 5]
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SNAPSHOTS = ["ram-data", "ram-new-data", "compuzone-data", "dramexchange-data"]
+MODES = {"dict": "0", "compact": "1"}
+
+
+def rss_bytes():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def child(measure, repeat):
+    """자식 프로세스: 스냅샷 갱신 후 측정값을 JSON 한 줄로 출력"""
+    import main
+    from views import render_json
+
+    gc.collect()
+    if measure == "trace":
+        tracemalloc.start()
+    before = rss_bytes()
+    for name in SNAPSHOTS:
+        main.scheduler.refresh(name)
+    gc.collect()
+    result = {"rss": rss_bytes() - before}
+    if measure == "trace":
+        result["retained"] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(json.dumps(result))
+        return
+
+    for name in SNAPSHOTS:
+        snapshot = main.scheduler.get(name)
+        if snapshot is None:
+            continue
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            body = render_json(snapshot.data)
+            best = min(best, time.perf_counter() - start)
+        result[name] = {"render_ms": best * 1000, "bytes": len(body)}
+    print(json.dumps(result))
+
+
+def run_child(mode, measure, data_dir, repeat):
+    env = {**os.environ, "DATA_DIR": data_dir, "SCHEDULER_ENABLED": "0",
+           "METRICS_ENABLED": "0", "COMPACT_HISTORY": MODES[mode]}
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", measure, "--repeat", str(repeat)],
+                          cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"[{mode}] 자식 프로세스 실패:\n{proc.stderr}")
+    # 갱신 로그(🔄 ...) 다음의 마지막 줄이 결과
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def prepare_scaled(scale, out_dir):
+    import synth_history
+    for dataset in synth_history.DATASETS:
+        count = max(1, round(synth_history.seed_length(dataset) * scale))
+        path = synth_history.write(dataset, count, out_dir)
+        print(f"📄 {os.path.basename(path)}: {count:,}개 시점, {os.path.getsize(path) / 1e6:.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=BACKEND_DIR, help="크롤러 JSON 디렉토리 (기본: backend)")
+    parser.add_argument("--scale", type=float, help="synth_history로 현재 이력의 N배 데이터 생성 후 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="render 시간 측정 반복 (최솟값 사용)")
+    parser.add_argument("--child", choices=["rss", "trace"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir
+        if args.scale:
+            prepare_scaled(args.scale, tmp)
+            data_dir = tmp
+
+        results = {}
+        for mode in MODES:
+            print(f"⏱️ {mode} 측정 중...")
+            results[mode] = run_child(mode, "rss", data_dir, args.repeat)
+            results[mode]["retained"] = run_child(mode, "trace", data_dir, args.repeat)["retained"]
+
+    print(f"\n{'':<24}" + "".join(f"{mode:>14}" for mode in MODES))
+    print(f"{'rss (MB)':<24}" + "".join(f"{results[mode]['rss'] / 1e6:>14.1f}" for mode in MODES))
+    print(f"{'retained (MB)':<24}" + "".join(f"{results[mode]['retained'] / 1e6:>14.1f}" for mode in MODES))
+    for name in SNAPSHOTS:
+        if all(name in results[mode] for mode in MODES):
+            print(f"{name + ' (ms)':<24}" + "".join(f"{results[mode][name]['render_ms']:>14.1f}" for mode in MODES))
+
+    for name in SNAPSHOTS:
+        sizes = {results[mode].get(name, {}).get("bytes") for mode in MODES}
+        if len(sizes) > 1:
+            print(f"⚠️ [{name}] 모드별 응답 크기가 다름: {sizes}")
+    saved = results["dict"]["retained"] - results["compact"]["retained"]
+    print(f"\n✅ 압축 표현으로 {saved / 1e6:.1f}MB 절약 "
+          f"({saved / max(results['dict']['retained'], 1) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
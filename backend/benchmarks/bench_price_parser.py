@@ -0,0 +1,190 @@
+"""
+카페 시세 글 파서 벤치마크
+- 기존 parse_price_data(줄마다 정규식 16개 + 리스트 중복 검사)와
+  price_parser.parse_price_data(사전 컴파일 + 키워드 필터 + 통합 정규식)를 비교
+- 말뭉치: --corpus 로 JSONL 아카이브({"date", "time", "text"} 한 줄에 하나)를 주거나,
+  없으면 ram_price_junggo.json 의 price_history를 카페 글 형식으로 재구성해서 사용
+
+사용법: cd backend && python benchmarks/bench_price_parser.py [--corpus posts.jsonl] [--repeat 5]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from price_parser import parse_price_data
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# ============================================
+# 기존 구현 (main.py에 있던 버전, 출력만 제거)
+# ============================================
+def legacy_parse_price_data(price_text):
+    prices = {}
+    current_category = None
+    current_mem_type = "데스크탑"
+
+    category_patterns = [
+        (r'데스크탑\s*용?\s*DDR5', 'DDR5 RAM (데스크탑)'),
+        (r'데스크탑\s*용?\s*DDR4', 'DDR4 RAM (데스크탑)'),
+        (r'데스크탑\s*용?\s*DDR3', 'DDR3 RAM (데스크탑)'),
+        (r'데스크탑\s+DDR5', 'DDR5 RAM (데스크탑)'),
+        (r'데스크탑\s+DDR4', 'DDR4 RAM (데스크탑)'),
+        (r'데스크탑\s+DDR3', 'DDR3 RAM (데스크탑)'),
+        (r'노트북\s*용?\s*DDR5', 'DDR5 RAM (노트북)'),
+        (r'노트북\s*용?\s*DDR4', 'DDR4 RAM (노트북)'),
+        (r'노트북\s*용?\s*DDR3', 'DDR3 RAM (노트북)'),
+        (r'노트북\s+DDR5', 'DDR5 RAM (노트북)'),
+        (r'노트북\s+DDR4', 'DDR4 RAM (노트북)'),
+        (r'노트북\s+DDR3', 'DDR3 RAM (노트북)'),
+    ]
+
+    product_patterns = [
+        (r'삼성\s*D5\s*(\d+G)\s*[,\-]?\s*(\d{4,5})\s*(?:\[?\d*\]?)?\s*-\s*([\d,\.]+)\s*원', 'DDR5'),
+        (r'삼성\s*(\d+G)\s*PC4[\s\-]*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
+        (r'삼성\s*(\d+G)\s*-?\s*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
+        (r'삼성\s*(\d+G)\s*PC3[\s\-]*(\d{5})\s*-?\s*([\d,\.]+)\s*원', 'DDR3'),
+    ]
+
+    for line in price_text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        for pattern, cat_name in category_patterns:
+            if re.search(pattern, line, re.IGNORECASE):
+                current_category = cat_name
+                current_mem_type = "노트북" if '노트북' in cat_name else "데스크탑"
+                break
+
+        if current_category is None:
+            continue
+
+        for pattern, ddr_type in product_patterns:
+            match = re.search(pattern, line)
+            if match:
+                try:
+                    capacity, speed, price_str = match.groups()
+                    price_clean = price_str.replace(',', '')
+                    if '.' in price_clean:
+                        parts = price_clean.split('.')
+                        if len(parts) == 2 and len(parts[1]) == 3:
+                            price = int(parts[0]) * 1000
+                        else:
+                            price = int(float(price_clean))
+                    else:
+                        price = int(price_clean)
+
+                    if ddr_type == 'DDR5':
+                        product_name = f"삼성 DDR5 {capacity} {speed}MHz"
+                    elif ddr_type == 'DDR4':
+                        product_name = f"삼성 DDR4 {capacity} PC4-{speed}"
+                    else:
+                        product_name = f"삼성 DDR3 {capacity} PC3-{speed}"
+
+                    if current_mem_type == "노트북":
+                        product_name += " (노트북)"
+
+                    if current_category not in prices:
+                        prices[current_category] = []
+
+                    existing = [p['product'] for p in prices[current_category]]
+                    if product_name not in existing:
+                        prices[current_category].append({
+                            "product": product_name,
+                            "price": price,
+                            "price_formatted": f"{price:,}원"
+                        })
+                    break
+                except Exception:
+                    continue
+
+    return prices
+
+# ============================================
+# 말뭉치
+# ============================================
+NOISE_HEAD = [
+    "안녕하세요 베스트코리아컴입니다.",
+    "매입 시세는 매일 변동되며 아래 가격은 정상 작동 제품 기준입니다.",
+    "택배 매입 가능 / 방문 매입 가능 (용산 선인상가)",
+    "문의: 010-0000-0000 (카톡 bkc)",
+    "",
+    "※ 대량 매입은 별도 문의 바랍니다 ※",
+]
+NOISE_TAIL = [
+    "",
+    "그래픽카드 / CPU / SSD 도 매입합니다.",
+    "지포스 RTX 4090 - 시세 문의",
+    "인텔 i9-14900K - 400.000원",
+    "라이젠 7800X3D - 350.000원",
+    "영업시간 평일 10:00 ~ 19:00 / 토요일 10:00 ~ 15:00",
+    "감사합니다.",
+]
+
+def render_post(snapshot):
+    """price_history 한 시점을 카페 글 형식 텍스트로 재구성"""
+    lines = list(NOISE_HEAD)
+    for category, items in snapshot.items():
+        ddr, kind = re.match(r'(DDR\d) RAM \((.+)\)', category).groups()
+        lines += ["", f"■ {kind}용 {ddr} ■"]
+        for item in items:
+            name = item["product"].replace(" (노트북)", "")
+            price = f"{item['price']:,}".replace(",", ".") + "원"
+            parts = name.split()
+            if len(parts) != 4:
+                continue  # 수동 입력된 다른 형식의 제품명
+            if ddr == "DDR5":
+                lines.append(f"삼성 D5 {parts[2]} {parts[3].replace('MHz', '')} - {price}")
+            else:
+                lines.append(f"삼성 {parts[2]} {parts[3]} - {price}")
+    return "\n".join(lines + NOISE_TAIL)
+
+def load_corpus(path=None):
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line)["text"] for line in f if line.strip()]
+    with open(os.path.join(BASE_DIR, "ram_price_junggo.json"), "r", encoding="utf-8") as f:
+        history = json.load(f)["price_history"]
+    return [render_post(history[key]) for key in sorted(history)]
+
+def measure(fn, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="JSONL 아카이브 ({\"date\", \"time\", \"text\"})")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    lines = sum(text.count("\n") + 1 for text in corpus)
+    print(f"말뭉치: 글 {len(corpus)}개, {lines:,}줄")
+
+    mismatches = sum(1 for text in corpus if legacy_parse_price_data(text) != parse_price_data(text))
+
+    legacy = measure(legacy_parse_price_data, corpus, args.repeat)
+    shared = measure(parse_price_data, corpus, args.repeat)
+    print(f"기존:   {legacy*1000:8.1f} ms ({lines / legacy:,.0f} 줄/초)")
+    print(f"공용:   {shared*1000:8.1f} ms ({lines / shared:,.0f} 줄/초)")
+    print(f"속도 향상: x{legacy / shared:.1f}")
+
+    if mismatches:
+        print(f"❌ 결과 불일치: {mismatches}개 글")
+        sys.exit(1)
+    print("✅ 모든 글에서 결과 일치")
+
+if __name__ == "__main__":
+    main()
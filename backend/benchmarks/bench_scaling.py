@@ -0,0 +1,163 @@
+"""
+이력 길이에 따른 저장/API 계층 스케일링 벤치마크
+- synth_history로 현재 이력 길이의 1x, 10x, 100x 파일을 만들어 엔드포인트가 하는 일을 그대로 측정
+  - load: LocalSource.load (파일 읽기 + json 파싱)
+  - transform: ram → build_trend_data, compuzone / dramexchange → limit_days(30일)
+  - serialize: 기본 응답(days 없음)을 JSONResponse와 같은 방식으로 직렬화
+- 메모리: 시간 측정과 별도로 tracemalloc을 켜고 한 번 더 돌려
+  로드 후 남는 크기(retained)와 세 단계 중 최대 사용량(peak)을 기록
+- 결과는 CSV (표준 출력 또는 --csv), matplotlib이 있으면 --plot 으로 그래프 저장
+
+사용법: cd backend && python benchmarks/bench_scaling.py [--scales 1 10 100] [--dataset compuzone] [--csv out.csv] [--plot out.png]
+"""
+
+import os
+import sys
+import csv
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synth_history
+from data_sources import LocalSource
+from views import build_trend_data, limit_days, render_json
+
+# 데이터셋 → (엔드포인트, transform 단계)
+ENDPOINTS = {
+    "ram_price": ("/api/ram-data", build_trend_data),
+    "ram_new": ("/api/ram-new-data", build_trend_data),
+    "compuzone": ("/api/compuzone-data", lambda data: limit_days(data, 30)),
+    "dram_exchange": ("/api/dramexchange-data", lambda data: limit_days(data, 30)),
+}
+
+COLUMNS = ["dataset", "endpoint", "scale", "entries", "file_mb", "load_ms", "transform_ms",
+           "serialize_ms", "response_mb", "retained_mb", "peak_mb"]
+
+
+def run_phases(path, transform):
+    """(data, 변환 결과, 직렬화 bytes, 단계별 초) - 매번 새 LocalSource라 캐시 없이 파싱"""
+    source = LocalSource(os.path.dirname(path))
+    times = {}
+
+    start = time.perf_counter()
+    data = source.load(os.path.basename(path))
+    times["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    transformed = transform(data)
+    times["transform"] = time.perf_counter() - start
+
+    # ram은 변환 결과가 응답, compuzone/dramexchange 기본 응답은 파일 내용 그대로
+    response = transformed if transform is build_trend_data else data
+    start = time.perf_counter()
+    body = render_json(response)
+    times["serialize"] = time.perf_counter() - start
+    return data, transformed, body, times
+
+def measure_memory(path, transform):
+    """(로드 후 남는 MB, 전체 최대 MB)"""
+    tracemalloc.start()
+    try:
+        source = LocalSource(os.path.dirname(path))
+        data = source.load(os.path.basename(path))
+        retained = tracemalloc.get_traced_memory()[0]
+        transformed = transform(data)
+        render_json(transformed if transform is build_trend_data else data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return retained / 1e6, peak / 1e6
+
+def bench(dataset, scale, repeat, work_dir):
+    endpoint, transform = ENDPOINTS[dataset]
+    entries = max(1, int(synth_history.seed_length(dataset) * scale))
+    path = synth_history.write(dataset, entries, os.path.join(work_dir, f"{dataset}-{scale}"))
+
+    best = {}
+    body = b""
+    for _ in range(repeat):
+        _, _, body, times = run_phases(path, transform)
+        for phase, elapsed in times.items():
+            best[phase] = min(best.get(phase, elapsed), elapsed)
+    retained, peak = measure_memory(path, transform)
+
+    row = {
+        "dataset": dataset,
+        "endpoint": endpoint,
+        "scale": scale,
+        "entries": entries,
+        "file_mb": round(os.path.getsize(path) / 1e6, 2),
+        "load_ms": round(best["load"] * 1000, 1),
+        "transform_ms": round(best["transform"] * 1000, 1),
+        "serialize_ms": round(best["serialize"] * 1000, 1),
+        "response_mb": round(len(body) / 1e6, 2),
+        "retained_mb": round(retained, 1),
+        "peak_mb": round(peak, 1),
+    }
+    os.remove(path)
+    return row
+
+def plot(rows, path):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("⚠️ matplotlib이 없어 그래프는 건너뜀 (pip install matplotlib)", file=sys.stderr)
+        return
+
+    datasets = sorted({row["dataset"] for row in rows})
+    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    for dataset in datasets:
+        series = sorted((r for r in rows if r["dataset"] == dataset), key=lambda r: r["entries"])
+        x = [r["entries"] for r in series]
+        for phase, style in (("load_ms", "-"), ("transform_ms", ":"), ("serialize_ms", "--")):
+            axes[0].plot(x, [r[phase] for r in series], style, marker="o", label=f"{dataset} {phase[:-3]}")
+        axes[1].plot(x, [r["peak_mb"] for r in series], marker="o", label=f"{dataset} peak")
+        axes[1].plot(x, [r["retained_mb"] for r in series], ":", marker="o", label=f"{dataset} retained")
+    axes[0].set(xscale="log", yscale="log", xlabel="history entries", ylabel="ms", title="time")
+    axes[1].set(xscale="log", yscale="log", xlabel="history entries", ylabel="MB", title="memory (tracemalloc)")
+    for ax in axes:
+        ax.legend(fontsize=7)
+        ax.grid(True, which="both", alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    print(f"📈 {path}", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=float, nargs="+", default=[1, 10, 100], help="현재 이력 길이의 배수")
+    parser.add_argument("--dataset", action="append", choices=list(ENDPOINTS), help="기본: 전부")
+    parser.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 (최솟값 사용)")
+    parser.add_argument("--csv", help="CSV 저장 경로 (기본: 표준 출력)")
+    parser.add_argument("--plot", help="그래프 저장 경로 (.png, matplotlib 필요)")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="synth-") as work_dir:
+        for dataset in args.dataset or list(ENDPOINTS):
+            for scale in args.scales:
+                row = bench(dataset, scale, args.repeat, work_dir)
+                rows.append(row)
+                print(f"⏱️ {dataset} x{scale:g}: 이력 {row['entries']:,}개 ({row['file_mb']}MB) "
+                      f"load {row['load_ms']}ms / transform {row['transform_ms']}ms / "
+                      f"serialize {row['serialize_ms']}ms, peak {row['peak_mb']}MB", file=sys.stderr)
+
+    out = open(args.csv, "w", newline="", encoding="utf-8") if args.csv else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    finally:
+        if args.csv:
+            out.close()
+
+    if args.plot:
+        plot(rows, args.plot)
+
+if __name__ == "__main__":
+    main()
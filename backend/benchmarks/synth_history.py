@@ -0,0 +1,206 @@
+"""
+스케일링 테스트용 가격 이력 생성기
+- 크롤러가 저장하는 것과 같은 스키마로 ram_price / ram_new / compuzone / dram_exchange 파일을 원하는 길이만큼 생성
+- 상품 구성(카테고리, 상품명, 부가 필드)과 상품별 등장 비율은 커밋된 실제 파일의 이력에서 가져오고
+  가격만 고정 시드 랜덤워크로 만듦 → 키 구성/문자열 길이/항목당 상품 수가 실제와 같음
+- 시각은 실제 파일의 마지막 시각에서 실제 평균 간격만큼 거슬러 올라가며 생성 (오름차순 저장)
+
+사용법: cd backend && python benchmarks/synth_history.py --scale 10 --out /tmp/synth
+        python benchmarks/synth_history.py --entries 20000 --dataset compuzone --out /tmp/synth
+"""
+
+import os
+import sys
+import json
+import copy
+import math
+import random
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# 데이터셋 → 원본 파일 (ram_new는 접두사 - 가장 최근 파일)
+DATASETS = {
+    "ram_price": "ram_price_junggo.json",
+    "ram_new": "ram_new_",
+    "compuzone": "compuzone_data.json",
+    "dram_exchange": "dram_exchange_data.json",
+}
+
+
+def seed_path(dataset):
+    prefix = DATASETS[dataset]
+    if prefix.endswith(".json"):
+        return os.path.join(BASE_DIR, prefix)
+    names = sorted(n for n in os.listdir(BASE_DIR) if n.startswith(prefix) and n.endswith(".json"))
+    return os.path.join(BASE_DIR, names[-1])
+
+def load_seed(dataset):
+    with open(seed_path(dataset), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def seed_length(dataset):
+    return len(load_seed(dataset).get("price_history", {}))
+
+def parse_time(key):
+    # 예전 ram_price 항목은 날짜만 있음 ("2026-01-30")
+    return datetime.strptime(key[:16], TIME_FORMAT) if len(key) > 10 else datetime.strptime(key, "%Y-%m-%d")
+
+def timestamps(history, count, rng):
+    """원본 이력의 평균 간격으로 마지막 시각에서 거슬러 올라간 count개 시각 (오름차순)"""
+    times = sorted(parse_time(key) for key in history)
+    step = (times[-1] - times[0]) / max(1, len(times) - 1) if len(times) > 1 else timedelta(minutes=30)
+    step_minutes = max(1, int(step.total_seconds() // 60))
+    jitter = max(1, step_minutes // 10)
+    result = []
+    for i in range(count - 1, -1, -1):
+        t = times[-1] - timedelta(minutes=step_minutes * i)
+        if i:
+            t += timedelta(minutes=rng.randint(-jitter, jitter))
+        result.append(t.strftime(TIME_FORMAT))
+    return result
+
+def walk(rng, start, count, sigma=0.01):
+    """start에서 끝나는 길이 count의 기하 랜덤워크 (마지막 값 = start)"""
+    values = [start]
+    for _ in range(count - 1):
+        values.append(values[-1] * math.exp(rng.gauss(0, sigma)))
+    return values[::-1]
+
+def krw(price, unit=1000):
+    return max(unit, int(round(price / unit)) * unit)
+
+def priced(item, price):
+    item = dict(item)
+    item["price"] = price
+    item["price_formatted"] = f"{price:,}원"
+    return item
+
+
+# ============================================
+# 데이터셋별 생성
+# ============================================
+def catalog(history, ident):
+    """원본 이력 → {카테고리: {식별값: [마지막 항목, 등장 비율]}} (카테고리/상품 순서는 등장 순)
+
+    항목마다 일부 상품만 저장되는 경우(컴퓨존 등)가 있어 등장 비율대로 빠지게 생성해야 크기가 실제와 맞음
+    """
+    result = {}
+    for entry in history.values():
+        for cat, items in entry.items():
+            products = result.setdefault(cat, {})
+            for item in items:
+                slot = products.setdefault(item[ident], [item, 0])
+                slot[0] = item
+                slot[1] += 1
+    total = max(1, len(history))
+    for products in result.values():
+        for slot in products.values():
+            slot[1] /= total
+    return result
+
+def product_history(seed_history, keys, rng, ident, value, make_row, sigma=0.01):
+    """상품별 랜덤워크 → {시각: {카테고리: [항목]}}
+
+    value(항목) → 워크 시작값, make_row(항목, 값, 이전 값) → 저장할 항목
+    """
+    products = catalog(seed_history, ident)
+    walks = {(cat, name): walk(rng, value(slot[0]), len(keys), sigma)
+             for cat, items in products.items() for name, slot in items.items()}
+    history = {}
+    for n, key in enumerate(keys):
+        entry = {}
+        for cat, items in products.items():
+            rows = [make_row(item, walks[(cat, name)][n], walks[(cat, name)][max(n - 1, 0)])
+                    for name, (item, presence) in items.items() if rng.random() < presence]
+            if rows:
+                entry[cat] = rows
+        history[key] = entry
+    return history
+
+def _krw_row(unit):
+    return lambda item, price, prev: priced(item, krw(price, unit))
+
+def generate_ram_price(count, rng):
+    seed = load_seed("ram_price")
+    keys = timestamps(seed["price_history"], count, rng)
+    history = product_history(seed["price_history"], keys, rng, "product", lambda i: i["price"], _krw_row(1000))
+    return {"price_data": copy.deepcopy(history[keys[-1]]), "price_history": history}
+
+def generate_ram_new(count, rng):
+    seed = load_seed("ram_new")
+    keys = timestamps(seed["price_history"], count, rng)
+    history = product_history(seed["price_history"], keys, rng, "product", lambda i: i["price"], _krw_row(1000))
+    return {"price_data": copy.deepcopy(history[keys[-1]]), "price_history": history}
+
+def generate_compuzone(count, rng):
+    seed = load_seed("compuzone")
+    keys = timestamps(seed["price_history"], count, rng)
+    history = product_history(seed["price_history"], keys, rng, "capacity", lambda i: i["price"], _krw_row(100))
+    products = copy.deepcopy(seed["products"])
+    for cat, product in products.items():
+        latest = {row["capacity"]: row for row in history[keys[-1]].get(cat, [])}
+        product["options"] = [priced(opt, latest[opt["capacity"]]["price"]) if opt["capacity"] in latest else opt
+                              for opt in product["options"]]
+    return {"products": products, "price_history": history, "last_updated": keys[-1]}
+
+def _dram_row(item, average, prev):
+    spread = abs(item["daily_high"] - item["daily_low"]) / max(item["session_average"], 0.1)
+    high = round(average * (1 + spread / 2), 1)
+    low = round(average * (1 - spread / 2), 1)
+    change = (average - prev) / prev * 100 if prev else 0.0
+    return {**item, "daily_high": high, "daily_low": low, "session_high": high, "session_low": low,
+            "session_average": round(average, 1), "session_change": f"{change:.2f} %"}
+
+def generate_dram_exchange(count, rng):
+    seed = load_seed("dram_exchange")
+    keys = timestamps(seed["price_history"], count, rng)
+    history = product_history(seed["price_history"], keys, rng, "product", lambda i: i["session_average"],
+                              _dram_row, sigma=0.005)
+    return {"last_updated": keys[-1], "current_data": copy.deepcopy(history[keys[-1]]), "price_history": history}
+
+GENERATORS = {
+    "ram_price": generate_ram_price,
+    "ram_new": generate_ram_new,
+    "compuzone": generate_compuzone,
+    "dram_exchange": generate_dram_exchange,
+}
+
+def generate(dataset, count, seed=0):
+    """dataset의 이력 count개짜리 파일 내용 (dict)"""
+    return GENERATORS[dataset](max(1, count), random.Random(f"{dataset}:{seed}"))
+
+def filename(dataset):
+    """원본과 같은 파일명 (LocalSource / main.py가 그대로 읽을 수 있게)"""
+    return os.path.basename(seed_path(dataset))
+
+def write(dataset, count, out_dir, seed=0):
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, filename(dataset))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate(dataset, count, seed), f, ensure_ascii=False, indent=2)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="출력 디렉토리 (DATA_DIR로 그대로 사용 가능)")
+    parser.add_argument("--dataset", action="append", choices=list(DATASETS), help="기본: 전부")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", type=float, default=1.0, help="현재 이력 길이의 배수 (기본 1)")
+    size.add_argument("--entries", type=int, help="이력 항목 수 (직접 지정)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for dataset in args.dataset or list(DATASETS):
+        count = args.entries or int(seed_length(dataset) * args.scale)
+        path = write(dataset, count, args.out, args.seed)
+        print(f"✅ {dataset}: 이력 {count:,}개 → {path} ({os.path.getsize(path) / 1e6:.1f}MB)")
+
+if __name__ == "__main__":
+    main()
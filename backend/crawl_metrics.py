@@ -0,0 +1,294 @@
+"""
+크롤러 실행 프로파일 (구간별 소요 시간 + Chrome 최대 메모리)
+- start(이름) → phase("navigation") 등으로 감싼 구간 시간을 실행 단위로 합산
+  (구간이 중첩되면 안쪽 구간 시간은 바깥 구간에서 빠짐 → 구간 합 ≤ 전체)
+- sleep(초): 고정 대기도 "wait" 구간으로 기록
+- watch_driver(driver): chromedriver 아래 Chrome 프로세스 트리의 RSS 합을 주기적으로 재서 최대값 기록
+  (Linux /proc 기준, 공유 메모리가 중복 합산되므로 실제보다 약간 큼)
+- finish(결과): crawl_metrics/<이름>.jsonl 에 실행 한 줄 추가 (최근 MAX_RUNS개만 유지)
+- 워크플로우는 이 파일을 actions/cache로 실행 간 이어 붙이고, 데이터가 바뀐 실행에서 함께 커밋
+
+리포트: python crawl_metrics.py [이름...] [--last 100] [--days 14]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone, timedelta
+
+import crawl_state
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+METRICS_DIR = os.path.join(BASE_DIR, "crawl_metrics")
+KST = timezone(timedelta(hours=9))
+
+# 표준 구간 (크롤러마다 "login" 같은 구간을 더 써도 됨)
+PHASES = ["driver_startup", "navigation", "wait", "extraction", "parsing", "save"]
+
+MAX_RUNS = 1000          # 파일당 보관할 실행 수
+SAMPLE_INTERVAL = 0.5    # Chrome 메모리 측정 주기 (초)
+
+_current = None
+
+
+# ============================================
+# Chrome 메모리 측정
+# ============================================
+def _process_tree(root_pid):
+    """root_pid와 모든 하위 프로세스 pid (/proc의 ppid로 구성)"""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 프로세스 이름에 공백/괄호가 있을 수 있어 마지막 ')' 이후를 필드로 사용
+        ppid = int(stat[stat.rindex(b")") + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+def _rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+class _ChromeSampler(threading.Thread):
+    def __init__(self, root_pid):
+        super().__init__(daemon=True)
+        self.root_pid = root_pid
+        self.peak = 0
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        total = sum(_rss_bytes(pid) for pid in _process_tree(self.root_pid))
+        self.peak = max(self.peak, total)
+
+    def run(self):
+        while True:
+            try:
+                self.sample()
+            except OSError:
+                pass
+            if self._stop_event.wait(SAMPLE_INTERVAL):
+                return
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=2)
+
+
+# ============================================
+# 실행 프로파일
+# ============================================
+class RunProfile:
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.now(KST)
+        self.start = time.perf_counter()
+        self.phases = {}
+        self._stack = []      # [[구간 이름, 시작 시각]]
+        self._samplers = []
+
+    def _add(self, name, elapsed):
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def phase(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            # 바깥 구간은 여기까지 기록하고 멈춤
+            outer = self._stack[-1]
+            self._add(outer[0], now - outer[1])
+        frame = [name, now]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._add(name, now - frame[1])
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def watch_driver(self, driver):
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None or not os.path.isdir("/proc"):
+            return
+        sampler = _ChromeSampler(process.pid)
+        sampler.start()
+        self._samplers.append(sampler)
+
+    def record(self, result):
+        total = time.perf_counter() - self.start
+        for sampler in self._samplers:
+            sampler.stop()
+        phases = {name: round(elapsed, 2) for name, elapsed in self.phases.items()}
+        phases["other"] = round(max(0.0, total - sum(self.phases.values())), 2)
+        record = {
+            "at": self.started_at.strftime("%Y-%m-%d %H:%M"),
+            "result": "unchanged" if result == crawl_state.UNCHANGED else "ok" if result else "fail",
+            "total": round(total, 2),
+            "phases": phases,
+        }
+        peak = max((s.peak for s in self._samplers), default=0)
+        if peak:
+            record["chrome_peak_mb"] = round(peak / 1e6, 1)
+        if os.environ.get("GITHUB_RUN_ID"):
+            record["run_id"] = os.environ["GITHUB_RUN_ID"]
+        return record
+
+
+def start(name):
+    """실행 프로파일 시작 (main() 맨 앞에서 호출)"""
+    global _current
+    _current = RunProfile(name)
+    return _current
+
+def phase(name):
+    """with phase("navigation"): ... - start() 전에는 아무것도 하지 않음"""
+    if _current is None:
+        return nullcontext()
+    return _current.phase(name)
+
+def sleep(seconds):
+    """time.sleep + "wait" 구간 기록"""
+    with phase("wait"):
+        time.sleep(seconds)
+
+def watch_driver(driver):
+    if _current is not None:
+        _current.watch_driver(driver)
+
+def _metrics_path(name):
+    return os.path.join(METRICS_DIR, f"{name}.jsonl")
+
+def load_runs(name):
+    try:
+        with open(_metrics_path(name), "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return []
+
+def finish(result):
+    """실행 기록 추가 후 요약 출력. 기록 실패가 크롤러 종료 코드에 영향 주지 않도록 예외는 삼킴"""
+    global _current
+    if _current is None:
+        return None
+    profile, _current = _current, None
+    record = profile.record(result)
+
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        lines = [json.dumps(run, ensure_ascii=False, separators=(",", ":"))
+                 for run in load_runs(profile.name)[-(MAX_RUNS - 1):] + [record]]
+        tmp = _metrics_path(profile.name) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, _metrics_path(profile.name))
+    except OSError as e:
+        print(f"⚠️ 실행 프로파일 저장 실패: {e}", flush=True)
+
+    phases = ", ".join(f"{name} {elapsed:.1f}s" for name, elapsed in record["phases"].items())
+    memory = f", Chrome 최대 {record['chrome_peak_mb']:.0f}MB" if "chrome_peak_mb" in record else ""
+    print(f"⏱️ 실행 프로파일: 총 {record['total']:.1f}s ({phases}){memory}", flush=True)
+    return record
+
+
+# ============================================
+# 리포트
+# ============================================
+def _percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round((len(values) - 1) * p / 100)))]
+
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+def report(name, last=100, days=14):
+    all_runs = load_runs(name)
+    if not all_runs:
+        print(f"📊 {name}: 기록 없음\n")
+        return
+    runs = all_runs[-last:]
+    totals = [run["total"] for run in runs]
+    results = {}
+    for run in runs:
+        results[run["result"]] = results.get(run["result"], 0) + 1
+
+    print(f"📊 {name} (최근 {len(runs)}회 / 전체 {len(all_runs)}회, {runs[0]['at']} ~ {runs[-1]['at']})")
+    print(f"  결과: {', '.join(f'{k} {v}' for k, v in sorted(results.items()))}")
+    print(f"  총 소요: 중앙값 {_percentile(totals, 50):.1f}s, p90 {_percentile(totals, 90):.1f}s, "
+          f"합계 {sum(totals) / 60:.1f}분")
+
+    names = [p for p in PHASES + sorted({p for run in runs for p in run["phases"]}) if
+             any(p in run["phases"] for run in runs)]
+    names = list(dict.fromkeys(names))
+    recent, before = runs[-10:], runs[-20:-10]
+    print(f"  {'구간':<16}{'중앙값':>9}{'p90':>9}{'비중':>8}  추세(최근 10회 평균 vs 그 전 10회)")
+    for phase_name in names:
+        values = [run["phases"].get(phase_name, 0.0) for run in runs]
+        share = sum(values) / sum(totals) * 100 if sum(totals) else 0
+        old = _mean([run["phases"].get(phase_name, 0.0) for run in before])
+        new = _mean([run["phases"].get(phase_name, 0.0) for run in recent])
+        trend = f"{(new - old) / old * 100:+.0f}%" if before and old else "-"
+        print(f"  {phase_name:<16}{_percentile(values, 50):>8.2f}s{_percentile(values, 90):>8.2f}s"
+              f"{share:>7.1f}%  {trend}")
+
+    peaks = [run["chrome_peak_mb"] for run in runs if "chrome_peak_mb" in run]
+    if peaks:
+        print(f"  Chrome 최대 메모리: 중앙값 {_percentile(peaks, 50):.0f}MB, 최대 {max(peaks):.0f}MB")
+
+    # 일별 러너 사용 시간 (가장 오래 걸린 구간)
+    by_day = {}
+    for run in all_runs:
+        by_day.setdefault(run["at"][:10], []).append(run)
+    print(f"  {'날짜':<12}{'실행':>5}{'소요(분)':>10}  최대 구간")
+    for day in sorted(by_day)[-days:]:
+        day_runs = by_day[day]
+        phase_sums = {}
+        for run in day_runs:
+            for phase_name, elapsed in run["phases"].items():
+                phase_sums[phase_name] = phase_sums.get(phase_name, 0.0) + elapsed
+        top = max(phase_sums, key=phase_sums.get) if phase_sums else "-"
+        print(f"  {day:<12}{len(day_runs):>5}{sum(r['total'] for r in day_runs) / 60:>10.1f}  {top}")
+    print()
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 실행 프로파일 리포트")
+    parser.add_argument("names", nargs="*", help="크롤러 이름 (기본: crawl_metrics/ 전부)")
+    parser.add_argument("--last", type=int, default=100, help="구간 통계에 쓸 최근 실행 수")
+    parser.add_argument("--days", type=int, default=14, help="일별 표에 보일 날짜 수")
+    args = parser.parse_args()
+
+    names = args.names
+    if not names:
+        try:
+            names = sorted(n[:-6] for n in os.listdir(METRICS_DIR) if n.endswith(".jsonl"))
+        except OSError:
+            names = []
+    if not names:
+        print("기록된 실행 없음")
+        return
+    for name in names:
+        report(name, args.last, args.days)
+
+if __name__ == "__main__":
+    main()
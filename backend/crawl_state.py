@@ -0,0 +1,56 @@
+"""
+크롤러 변경 감지
+- 가져온 원본의 지문(본문/추출 결과 해시)을 crawl_state/<이름>.json 에 기록
+- 지난 실행과 같으면 파싱/저장을 건너뛰고 EXIT_UNCHANGED 로 종료
+- 워크플로우는 종료 코드로 커밋/배포 단계를 생략
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime, timezone, timedelta
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_DIR = os.path.join(BASE_DIR, "crawl_state")
+KST = timezone(timedelta(hours=9))
+
+# main()이 반환하는 "변경 없음" 결과와 그 종료 코드
+UNCHANGED = "unchanged"
+EXIT_UNCHANGED = 3
+
+# CRAWL_FORCE=1 이면 지문이 같아도 저장
+FORCE = os.environ.get("CRAWL_FORCE") == "1"
+
+def fingerprint(data):
+    """문자열이나 JSON 직렬화 가능한 값의 sha256 지문"""
+    if not isinstance(data, str):
+        data = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+def _state_path(name):
+    return os.path.join(STATE_DIR, f"{name}.json")
+
+def load_fingerprint(name):
+    try:
+        with open(_state_path(name), "r", encoding="utf-8") as f:
+            return json.load(f).get("fingerprint")
+    except (OSError, ValueError):
+        return None
+
+def is_unchanged(name, fp):
+    return not FORCE and load_fingerprint(name) == fp
+
+def save_fingerprint(name, fp):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    state = {
+        "fingerprint": fp,
+        "updated": datetime.now(KST).strftime("%Y-%m-%d %H:%M"),
+    }
+    with open(_state_path(name), "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+def exit_code(result):
+    """main() 결과 → 프로세스 종료 코드 (성공 0, 실패 1, 변경 없음 3)"""
+    if result == UNCHANGED:
+        return EXIT_UNCHANGED
+    return 0 if result else 1
@@ -5,11 +5,9 @@
 """
 
 import os
-import json
 import sys
 import traceback
 import re
-import time
 import glob
 from datetime import datetime, timezone, timedelta
 from selenium import webdriver
@@ -18,8 +16,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 
+import crawl_state
+import crawl_metrics
+from price_store import PriceStore
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 KST = timezone(timedelta(hours=9))
+STATE_NAME = "danawa"
 
 # ============================================
 # 검색 대상
@@ -67,15 +70,17 @@ def search_danawa(driver, query):
     search_url = f"https://search.danawa.com/dsearch.php?query={query.replace(' ', '+')}"
     log(f"  검색: {query}")
 
-    driver.get(search_url)
+    with crawl_metrics.phase("navigation"):
+        driver.get(search_url)
 
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".prod_main_info"))
-        )
+        with crawl_metrics.phase("wait"):
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".prod_main_info"))
+            )
     except:
         log("  ⚠️ 로딩 대기 타임아웃, 추가 대기...", "WARN")
-        time.sleep(3)
+        crawl_metrics.sleep(3)
 
     # 방법 1: 구조화된 셀렉터
     try:
@@ -166,31 +171,15 @@ def save_data(parsed_data, date_str, time_str):
     log(f"데이터 저장 시작: {date_str} {time_str}")
     data_path = get_data_file()
 
-    full = {"price_data": {}, "price_history": {}}
-    if os.path.exists(data_path):
-        try:
-            with open(data_path, "r", encoding="utf-8") as f:
-                full = json.load(f)
-        except:
-            pass
+    store = PriceStore()
+    try:
+        store = PriceStore.load(data_path)
+    except:
+        pass
 
     history_key = f"{date_str} {time_str}"
-    full["price_history"][history_key] = parsed_data
-
-    for category, items in parsed_data.items():
-        if category not in full["price_data"]:
-            full["price_data"][category] = []
-
-        existing = {item["product"]: idx for idx, item in enumerate(full["price_data"][category])}
-        for new_item in items:
-            name = new_item["product"]
-            if name in existing:
-                full["price_data"][category][existing[name]] = new_item
-            else:
-                full["price_data"][category].append(new_item)
-
-    with open(data_path, "w", encoding="utf-8") as f:
-        json.dump(full, f, ensure_ascii=False, indent=2)
+    store.apply(history_key, parsed_data)
+    store.save(data_path)
 
     log(f"✅ 저장 완료: {history_key}")
 
@@ -214,9 +203,12 @@ def main():
     log(f"📂 작업 디렉토리: {BASE_DIR}")
     log("=" * 60)
 
+    crawl_metrics.start(STATE_NAME)
     driver = None
     try:
-        driver = setup_driver()
+        with crawl_metrics.phase("driver_startup"):
+            driver = setup_driver()
+        crawl_metrics.watch_driver(driver)
 
         # 기존 형식에 맞춰서 수집: { "카테고리": [{"product": ..., "price": ...}] }
         parsed_data = {}
@@ -230,7 +222,9 @@ def main():
                 query = item["query"]
                 label = item["label"]
 
-                result = search_danawa(driver, query)
+                # 이동/대기를 뺀 나머지(셀렉터 조회 + 텍스트 패턴 매칭)가 extraction
+                with crawl_metrics.phase("extraction"):
+                    result = search_danawa(driver, query)
 
                 if result:
                     parsed_data[category].append({
@@ -242,16 +236,27 @@ def main():
                         "link": result["link"],
                     })
 
-                time.sleep(2)
+                crawl_metrics.sleep(2)
 
         total = sum(len(v) for v in parsed_data.values())
         if total == 0:
             log("❌ 수집된 데이터 없음", "ERROR")
             return False
 
+        # 가격이 지난 실행과 같으면 저장 생략
+        prices_fp = crawl_state.fingerprint({
+            cat: [[item["product"], item["price"]] for item in items]
+            for cat, items in parsed_data.items()
+        })
+        if crawl_state.is_unchanged(STATE_NAME, prices_fp):
+            log("ℹ️ 가격 변경 없음 - 저장 생략")
+            return crawl_state.UNCHANGED
+
         today = now.strftime("%Y-%m-%d")
         time_slot = get_current_time_slot()
-        save_data(parsed_data, today, time_slot)
+        with crawl_metrics.phase("save"):
+            save_data(parsed_data, today, time_slot)
+            crawl_state.save_fingerprint(STATE_NAME, prices_fp)
 
         log("=" * 60)
         log(f"✅ 완료! {total}개 제품 수집")
@@ -272,5 +277,6 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    result = main()
+    crawl_metrics.finish(result)
+    sys.exit(crawl_state.exit_code(result))
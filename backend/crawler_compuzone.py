@@ -17,8 +17,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 
+import crawl_state
+import crawl_metrics
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 KST = timezone(timedelta(hours=9))
+STATE_NAME = "compuzone"
 
 TARGETS = [
     {
@@ -37,6 +41,115 @@ TARGETS = [
     },
 ]
 
+# ============================================
+# 제품 목록 추출 스크립트
+# ============================================
+# 검색 결과 제품 목록 컨테이너 후보 (앞에서부터 우선)
+# 실제 페이지 구조가 바뀌어 다른(빈) 요소에 맞아 옵션을 못 찾으면 페이지의 체크박스 행만 훑음
+# (body 전체 텍스트 직렬화 / 모든 div·span 순회는 하지 않음 - 대체 경로는 WARN 로그)
+PRODUCT_LIST_SELECTORS = [
+    "#product_list_zone",
+    "#productList",
+    ".product_list",
+    ".prd_list",
+]
+
+# 옵션 체크박스가 렌더링됐는지만 확인 (page_source 전송 없음)
+# 컨테이너 안에 체크박스가 있으면 바로 완료, 컨테이너가 없거나 비어 있으면 체크박스 행 중 [XGB] 옵션이 있는지로 판단
+READY_JS = """
+    var selectors = arguments[0];
+    for (var i = 0; i < selectors.length; i++) {
+        var root = document.querySelector(selectors[i]);
+        if (root && root.querySelector('input[type="checkbox"]')) return true;
+    }
+    var boxes = document.querySelectorAll('input[type="checkbox"]');
+    for (var j = 0; j < boxes.length; j++) {
+        var row = boxes[j].closest('tr') || boxes[j].closest('li') || boxes[j].closest('div');
+        if (row && (row.textContent || '').indexOf('GB]') >= 0) return true;
+    }
+    return false;
+"""
+
+# 컴퓨존 옵션은 체크박스 행으로 되어있음
+# 각 행에서 [XGB] 텍스트와 가격을 함께 추출
+# textContent(레이아웃 불필요)로 먼저 거르고, 후보에만 innerText 사용
+# 제품 목록 컨테이너 후보에서 차례로 추출하고, 모두 비면 페이지의 체크박스 행만 추출 (scope: checkbox-rows)
+EXTRACT_OPTIONS_JS = """
+    var selectors = arguments[0];
+
+    // 방법 1: 체크박스 input의 부모 행에서 추출
+    function checkboxRows(root) {
+        var optionRows = [];
+        root.querySelectorAll('input[type="checkbox"]').forEach(function(cb) {
+            var row = cb.closest('tr') || cb.closest('li') || cb.closest('div');
+            if (row && (row.textContent || '').indexOf('GB]') >= 0) {
+                var text = row.innerText || row.textContent || '';
+                // [8GB] (5600) ... 179,000원 패턴 확인
+                if (text.match(/\\[\\d+GB\\]/)) {
+                    optionRows.push(text.trim());
+                }
+            }
+        });
+        return optionRows;
+    }
+
+    function extractFrom(root) {
+        var optionRows = checkboxRows(root);
+        function looksLikeOption(el) {
+            var t = el.textContent || '';
+            return t.indexOf('GB]') >= 0 && t.indexOf('원') >= 0;
+        }
+
+        // 방법 2: 테이블 행에서 추출
+        if (optionRows.length === 0) {
+            root.querySelectorAll('tr, li, .opt_item, .option_item').forEach(function(row) {
+                if (!looksLikeOption(row)) return;
+                var text = row.innerText || row.textContent || '';
+                if (text.match(/\\[\\d+GB\\]/) && text.match(/[\\d,]+원/)) {
+                    optionRows.push(text.trim());
+                }
+            });
+        }
+
+        // 방법 3: 목록 컨테이너 안의 작은 블록에서 GB와 원이 근접한 것 찾기
+        if (optionRows.length === 0) {
+            root.querySelectorAll('li, tr, td, dd, dt, dl, p, label, span, div').forEach(function(el) {
+                if (el.children.length >= 5 || !looksLikeOption(el)) return;
+                var text = el.innerText || '';
+                if (text.match(/\\[\\d+GB\\]/) && text.match(/[\\d,]+원/) && text.length < 500) {
+                    optionRows.push(text.trim());
+                }
+            });
+        }
+
+        // 제품 제목 추출
+        var titles = [];
+        root.querySelectorAll('a, span, div').forEach(function(el) {
+            var c = el.textContent || '';
+            if (c.indexOf('[삼성전자]') < 0 || c.indexOf('PC5-44800') < 0) return;
+            var t = el.innerText || '';
+            if (t.indexOf('[삼성전자]') >= 0 && t.indexOf('DDR5') >= 0 && t.indexOf('PC5-44800') >= 0 && t.length < 200) {
+                t = t.trim();
+                if (titles.indexOf(t) < 0) titles.push(t);
+            }
+        });
+
+        return {optionRows: optionRows, titles: titles};
+    }
+
+    for (var i = 0; i < selectors.length; i++) {
+        var root = document.querySelector(selectors[i]);
+        if (!root) continue;
+        var scoped = extractFrom(root);
+        if (scoped.optionRows.length > 0) {
+            scoped.scope = selectors[i];
+            return scoped;
+        }
+    }
+    // 컨테이너를 못 찾음 → 체크박스 행만 (제목은 찾지 않음 - 기본 제목 사용)
+    return {optionRows: checkboxRows(document), titles: [], scope: 'checkbox-rows'};
+"""
+
 def log(msg, level="INFO"):
     now = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{now}] [{level}] {msg}", flush=True)
@@ -61,85 +174,34 @@ def extract_products(driver, keyword):
     url = f"https://www.compuzone.co.kr/search/search.htm?SearchProductKey={keyword.replace(' ', '+')}"
     log(f"검색: {url}")
 
-    driver.get(url)
+    with crawl_metrics.phase("navigation"):
+        driver.get(url)
 
-    # AJAX 로딩 대기
+    # AJAX 로딩 대기 (page_source 직렬화 대신 셀렉터 존재 여부만 확인)
     log("AJAX 로딩 대기...")
     try:
-        WebDriverWait(driver, 15).until(
-            lambda d: "DDR5" in d.page_source and "원" in d.page_source
-        )
+        with crawl_metrics.phase("wait"):
+            WebDriverWait(driver, 15).until(
+                lambda d: d.execute_script(READY_JS, PRODUCT_LIST_SELECTORS)
+            )
         log("✅ 제품 로딩 완료")
     except:
         log("⚠️ 15초 대기 후에도 제품 미확인, 추가 대기...", "WARN")
-        time.sleep(5)
+        crawl_metrics.sleep(5)
 
     # ============================================
-    # 핵심: JavaScript로 옵션 행 데이터 직접 추출
+    # 핵심: JavaScript로 옵션 행 데이터 직접 추출 (제품 목록 범위 한정)
     # ============================================
-    # 컴퓨존 옵션은 체크박스 행으로 되어있음
-    # 각 행에서 [XGB] 텍스트와 가격을 함께 추출
-    
-    products_js = driver.execute_script("""
-        var results = [];
-        
-        // 모든 제품 블록을 찾기 (제품명 + 옵션)
-        var allText = document.body.innerText;
-        
-        // 제품 제목과 옵션을 포함하는 영역 찾기
-        // 방법 1: 체크박스 input의 부모 행에서 추출
-        var checkboxes = document.querySelectorAll('input[type="checkbox"]');
-        var optionRows = [];
-        
-        checkboxes.forEach(function(cb) {
-            var row = cb.closest('tr') || cb.closest('li') || cb.closest('div');
-            if (row) {
-                var text = row.innerText || row.textContent || '';
-                // [8GB] (5600) ... 179,000원 패턴 확인
-                if (text.match(/\\[\\d+GB\\]/)) {
-                    optionRows.push(text.trim());
-                }
-            }
-        });
-        
-        // 방법 2: 테이블 행에서 추출
-        if (optionRows.length === 0) {
-            var rows = document.querySelectorAll('tr, li, .opt_item, .option_item');
-            rows.forEach(function(row) {
-                var text = row.innerText || row.textContent || '';
-                if (text.match(/\\[\\d+GB\\]/) && text.match(/[\\d,]+원/)) {
-                    optionRows.push(text.trim());
-                }
-            });
-        }
-        
-        // 방법 3: 모든 텍스트 노드에서 GB와 원이 근접한 것 찾기
-        if (optionRows.length === 0) {
-            var allElements = document.querySelectorAll('*');
-            allElements.forEach(function(el) {
-                if (el.children.length === 0 || el.children.length < 5) {
-                    var text = el.innerText || '';
-                    if (text.match(/\\[\\d+GB\\]/) && text.match(/[\\d,]+원/) && text.length < 500) {
-                        optionRows.push(text.trim());
-                    }
-                }
-            });
-        }
-        
-        return {
-            optionRows: optionRows,
-            // 제품 제목도 추출
-            titles: Array.from(document.querySelectorAll('a, span, div')).filter(function(el) {
-                var t = el.innerText || '';
-                return t.indexOf('[삼성전자]') >= 0 && t.indexOf('DDR5') >= 0 && t.indexOf('PC5-44800') >= 0 && t.length < 200;
-            }).map(function(el) { return el.innerText.trim(); }).filter(function(v, i, a) { return a.indexOf(v) === i; })
-        };
-    """)
+    with crawl_metrics.phase("extraction"):
+        products_js = driver.execute_script(EXTRACT_OPTIONS_JS, PRODUCT_LIST_SELECTORS)
 
     option_rows = products_js.get("optionRows", [])
     titles = products_js.get("titles", [])
 
-    log(f"\nJS 추출 결과:")
+    if products_js.get("scope") == "checkbox-rows":
+        log("⚠️ 제품 목록 컨테이너에서 옵션을 못 찾음 - 페이지의 체크박스 행만으로 추출 "
+            "(PRODUCT_LIST_SELECTORS가 실제 페이지와 맞는지 확인 필요)", "WARN")
+    log(f"\nJS 추출 결과 (범위: {products_js.get('scope')}):")
     log(f"  제목 후보: {len(titles)}개")
     for t in titles[:5]:
         log(f"    {t[:80]}")
@@ -176,7 +238,8 @@ def extract_products(driver, keyword):
     # 페이지 전체 텍스트도 추출 (fallback)
     if not all_options:
         log("\nJS 추출 실패, 전체 텍스트 fallback...")
-        page_text = driver.find_element(By.TAG_NAME, "body").text
+        with crawl_metrics.phase("extraction"):
+            page_text = driver.find_element(By.TAG_NAME, "body").text
         lines = page_text.split('\n')
         
         for i, line in enumerate(lines):
@@ -343,10 +406,16 @@ def main():
     log(f"📅 KST: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     log("=" * 60)
 
+    crawl_metrics.start(STATE_NAME)
     driver = None
     try:
-        driver = setup_driver()
-        products = extract_products(driver, "삼성 DDR5 PC5-44800")
+        with crawl_metrics.phase("driver_startup"):
+            driver = setup_driver()
+        crawl_metrics.watch_driver(driver)
+
+        # 페이지 이동/대기/추출은 안쪽 구간으로 따로 잡히고 나머지(옵션 파싱)가 parsing
+        with crawl_metrics.phase("parsing"):
+            products = extract_products(driver, "삼성 DDR5 PC5-44800")
 
         if not products:
             log("❌ 제품을 찾지 못했습니다", "ERROR")
@@ -369,7 +438,15 @@ def main():
             log("❌ 매칭된 제품 없음", "ERROR")
             return False
 
-        save_data(results)
+        # 가격이 지난 실행과 같으면 저장 생략
+        prices_fp = crawl_state.fingerprint([[r["category"], r["options"]] for r in valid])
+        if crawl_state.is_unchanged(STATE_NAME, prices_fp):
+            log("ℹ️ 가격 변경 없음 - 저장 생략")
+            return crawl_state.UNCHANGED
+
+        with crawl_metrics.phase("save"):
+            save_data(results)
+            crawl_state.save_fingerprint(STATE_NAME, prices_fp)
 
         log("=" * 60)
         log(f"✅ 완료! {len(valid)}/{len(TARGETS)} 제품 수집")
@@ -386,5 +463,6 @@ def main():
             log("브라우저 종료")
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    result = main()
+    crawl_metrics.finish(result)
+    sys.exit(crawl_state.exit_code(result))
@@ -2,6 +2,9 @@
 네이버 카페 RAM 시세 자동 크롤러 (쿠키 기반 로그인)
 - GitHub Actions(ubuntu)에서 실행
 - NAVER_COOKIES 환경변수에서 쿠키 로드
+- NAVER_PROFILE_DIR 지정 시 Chrome 프로필(캐시/서비스워커)을 실행 간 재사용 (세션 유지 모드)
+  로그인은 카페 페이지의 로그인 표시로 확인, 실패하면 쿠키 재주입 후 재시도
+- 카페 JSON API로 먼저 시도하고, 실패 시에만 Selenium으로 검색/본문 추출
 - KST 시간 기준 타임슬롯 저장
 """
 
@@ -13,7 +16,10 @@ import traceback
 import re
 import base64
 import glob
+import html
+from html.parser import HTMLParser
 from datetime import datetime, timezone, timedelta
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -21,16 +27,40 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 
+import crawl_state
+import crawl_metrics
+from price_parser import parse_price_data, ParseReport
+from price_store import PriceStore
+
 # ============================================
 # 설정
 # ============================================
 CAFE_URL = "https://cafe.naver.com/joonggonara"
 SEARCH_KEYWORD = "베스트코리아컴"
 TARGET_TITLE_KEYWORD = "[매입]구입]채굴기"
+STATE_NAME = "cafe"
+
+# 카페 프론트엔드가 호출하는 JSON API (중고나라 clubid)
+CAFE_ID = 10050146
+ARTICLE_SEARCH_API = "https://apis.naver.com/cafe-web/cafe-mobile/CafeMobileWebArticleSearchListV4"
+ARTICLE_API = "https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{cafe_id}/articles/{article_id}"
+USE_CAFE_API = os.environ.get('NAVER_CAFE_API', '1') != '0'
+API_TIMEOUT = 10
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+              'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 KST = timezone(timedelta(hours=9))
 
+# 세션 유지 모드: 캐시/서비스워커가 남아있는 프로필 디렉토리
+# (로그인 쿠키는 실행마다 NAVER_COOKIES에서 다시 주입 - 프로필에 남은 세션은 만료됐을 수 있음)
+PROFILE_DIR = os.environ.get('NAVER_PROFILE_DIR')
+AUTH_COOKIES = ['NID_AUT', 'NID_SES']
+# 카페 상단(GNB) 로그인 상태 표시 - 로그인: 내 정보 영역/로그아웃 링크, 비로그인: 로그인 버튼
+LOGGED_IN_SELECTORS = ['#gnb_name1', '.gnb_my', 'a[href*="nidlogin.logout"]']
+LOGGED_OUT_SELECTORS = ['#gnb_login_button', '.gnb_btn_login', 'a[href*="nidlogin.login"]']
+LOGIN_CHECK_TIMEOUT = 10
+
 # ============================================
 # 로깅
 # ============================================
@@ -38,90 +68,6 @@ def log(msg, level="INFO"):
     now = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{now}] [{level}] {msg}", flush=True)
 
-# ============================================
-# 파싱 함수
-# ============================================
-def parse_price_data(price_text):
-    log("파싱 시작")
-    prices = {}
-    current_category = None
-    current_mem_type = "데스크탑"
-
-    category_patterns = [
-        (r'데스크탑\s*용?\s*DDR5', 'DDR5 RAM (데스크탑)'),
-        (r'데스크탑\s*용?\s*DDR4', 'DDR4 RAM (데스크탑)'),
-        (r'데스크탑\s*용?\s*DDR3', 'DDR3 RAM (데스크탑)'),
-        (r'노트북\s*용?\s*DDR5', 'DDR5 RAM (노트북)'),
-        (r'노트북\s*용?\s*DDR4', 'DDR4 RAM (노트북)'),
-        (r'노트북\s*용?\s*DDR3', 'DDR3 RAM (노트북)'),
-    ]
-
-    product_patterns = [
-        (r'삼성\s*D5\s*(\d+G)\s*[,\-]?\s*(\d{4,5})\s*(?:\[?\d*\]?)?\s*-\s*([\d,\.]+)\s*원', 'DDR5'),
-        (r'삼성\s*(\d+G)\s*PC4[\s\-]*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
-        (r'삼성\s*(\d+G)\s*-?\s*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
-        (r'삼성\s*(\d+G)\s*PC3[\s\-]*(\d{5})\s*-?\s*([\d,\.]+)\s*원', 'DDR3'),
-    ]
-
-    lines = price_text.split('\n')
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        for pattern, cat_name in category_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                current_category = cat_name
-                current_mem_type = "노트북" if '노트북' in cat_name else "데스크탑"
-                log(f"카테고리 발견: {cat_name}")
-                break
-
-        if current_category is None:
-            continue
-
-        for pattern, ddr_type in product_patterns:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    capacity, speed, price_str = match.groups()
-                    price_clean = price_str.replace(',', '')
-                    if '.' in price_clean:
-                        parts = price_clean.split('.')
-                        price = int(parts[0]) * 1000 if len(parts[1]) == 3 else int(float(price_clean))
-                    else:
-                        price = int(price_clean)
-
-                    if ddr_type == 'DDR5':
-                        product_name = f"삼성 DDR5 {capacity} {speed}MHz"
-                    elif ddr_type == 'DDR4':
-                        product_name = f"삼성 DDR4 {capacity} PC4-{speed}"
-                    else:
-                        product_name = f"삼성 DDR3 {capacity} PC3-{speed}"
-
-                    if current_mem_type == "노트북":
-                        product_name += " (노트북)"
-
-                    if current_category not in prices:
-                        prices[current_category] = []
-
-                    existing = [p['product'] for p in prices[current_category]]
-                    if product_name not in existing:
-                        prices[current_category].append({
-                            "product": product_name,
-                            "price": price,
-                            "price_formatted": f"{price:,}원"
-                        })
-                        log(f"제품 파싱: {product_name} - {price:,}원")
-                    break
-                except Exception as e:
-                    log(f"제품 파싱 오류: {line} - {str(e)}", "WARN")
-                    continue
-
-    total_items = sum(len(items) for items in prices.values())
-    log(f"파싱 완료: {len(prices)} 카테고리, {total_items} 제품")
-    return prices
-
 # ============================================
 # 데이터 저장
 # ============================================
@@ -141,33 +87,17 @@ def save_data(parsed_data, date_str, time_str):
     log(f"데이터 저장 시작: {date_str} {time_str}")
     data_path = get_data_file()
 
-    full = {"price_data": {}, "price_history": {}}
+    store = PriceStore()
     if os.path.exists(data_path):
         try:
-            with open(data_path, "r", encoding="utf-8") as f:
-                full = json.load(f)
-            log(f"기존 데이터 로드 완료: {len(full.get('price_history', {}))} 히스토리")
+            store = PriceStore.load(data_path)
+            log(f"기존 데이터 로드 완료: {len(store.history)} 히스토리")
         except Exception as e:
             log(f"기존 파일 로드 실패, 새로 생성: {str(e)}", "WARN")
 
     history_key = f"{date_str} {time_str}"
-    full["price_history"][history_key] = parsed_data
-
-    for category, items in parsed_data.items():
-        if category not in full["price_data"]:
-            full["price_data"][category] = []
-
-        existing_products = {item['product']: idx for idx, item in enumerate(full["price_data"][category])}
-        for new_item in items:
-            prod_name = new_item['product']
-            if prod_name in existing_products:
-                idx = existing_products[prod_name]
-                full["price_data"][category][idx] = new_item
-            else:
-                full["price_data"][category].append(new_item)
-
-    with open(data_path, "w", encoding="utf-8") as f:
-        json.dump(full, f, ensure_ascii=False, indent=2)
+    store.apply(history_key, parsed_data)
+    store.save(data_path)
 
     log(f"데이터 저장 완료: {history_key}")
     return True
@@ -184,24 +114,34 @@ def setup_driver():
     options.add_argument('--window-size=1920,1080')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                         'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    options.add_argument(f'--user-agent={USER_AGENT}')
     options.page_load_strategy = 'eager'
+    if PROFILE_DIR:
+        prepare_profile_dir(PROFILE_DIR)
+        options.add_argument(f'--user-data-dir={PROFILE_DIR}')
+        log(f"프로필 재사용: {PROFILE_DIR}")
     driver = webdriver.Chrome(options=options)
     driver.set_page_load_timeout(40)
     log("Chrome 드라이버 초기화 완료")
     return driver
 
+def prepare_profile_dir(profile_dir):
+    """프로필 디렉토리 생성 + 이전 실행이 남긴 잠금 파일 제거"""
+    os.makedirs(profile_dir, exist_ok=True)
+    for name in ("SingletonLock", "SingletonSocket", "SingletonCookie"):
+        path = os.path.join(profile_dir, name)
+        if os.path.lexists(path):
+            os.remove(path)
+
 # ============================================
 # 쿠키 로드 (환경변수에서)
 # ============================================
-def load_cookies(driver):
-    log("쿠키 로드 시작...")
+def read_env_cookies():
     cookies_json = os.environ.get('NAVER_COOKIES')
 
     if not cookies_json:
         log("환경변수 NAVER_COOKIES가 없습니다", "ERROR")
-        return False
+        return None
 
     try:
         if cookies_json.startswith('base64:'):
@@ -210,28 +150,67 @@ def load_cookies(driver):
 
         cookies = json.loads(cookies_json)
         log(f"쿠키 파싱 완료: {len(cookies)}개")
+        return cookies
+    except Exception as e:
+        log(f"쿠키 파싱 실패: {str(e)}", "ERROR")
+        return None
 
-        driver.get("https://naver.com")
-        time.sleep(2)
 
-        added = 0
-        for cookie in cookies:
-            try:
-                driver.add_cookie({
-                    'name': cookie.get('name'),
-                    'value': cookie.get('value'),
-                    'domain': cookie.get('domain', '.naver.com'),
-                    'path': cookie.get('path', '/'),
-                })
-                added += 1
-            except Exception as e:
-                log(f"쿠키 추가 실패: {cookie.get('name')} - {e}", "WARN")
-
-        log(f"쿠키 {added}개 추가 완료")
+def set_cookies_cdp(driver, cookies):
+    """CDP Network.setCookies로 한 번에 주입 (naver.com 선방문 불필요)
+
+    만료 시각은 원래 값 그대로 (없으면 세션 쿠키 - 브라우저 종료 시 사라짐)
+    """
+    params = []
+    for cookie in cookies:
+        item = {
+            'name': cookie.get('name'),
+            'value': cookie.get('value'),
+            'domain': cookie.get('domain', '.naver.com'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        expiry = cookie.get('expiry') or cookie.get('expirationDate')
+        if expiry:
+            item['expires'] = int(expiry)
+        params.append(item)
+    driver.execute_cdp_cmd('Network.setCookies', {'cookies': params})
+    return len(params)
+
+
+def load_cookies(driver):
+    log("쿠키 로드 시작...")
+    cookies = read_env_cookies()
+    if cookies is None:
+        return False
+
+    try:
+        added = set_cookies_cdp(driver, cookies)
+        log(f"쿠키 {added}개 추가 완료 (CDP)")
         return True
     except Exception as e:
-        log(f"쿠키 파싱 실패: {str(e)}", "ERROR")
-        return False
+        log(f"CDP 쿠키 주입 실패, add_cookie로 재시도: {e}", "WARN")
+
+    with crawl_metrics.phase("navigation"):
+        driver.get("https://naver.com")
+    crawl_metrics.sleep(2)
+
+    added = 0
+    for cookie in cookies:
+        try:
+            driver.add_cookie({
+                'name': cookie.get('name'),
+                'value': cookie.get('value'),
+                'domain': cookie.get('domain', '.naver.com'),
+                'path': cookie.get('path', '/'),
+            })
+            added += 1
+        except Exception as e:
+            log(f"쿠키 추가 실패: {cookie.get('name')} - {e}", "WARN")
+
+    log(f"쿠키 {added}개 추가 완료")
+    return True
 
 # ============================================
 # 로그인 확인
@@ -239,11 +218,12 @@ def load_cookies(driver):
 def verify_login(driver):
     log("로그인 상태 확인 중...")
     try:
-        driver.get("https://naver.com")
-        time.sleep(2)
+        with crawl_metrics.phase("navigation"):
+            driver.get("https://naver.com")
+        crawl_metrics.sleep(2)
         cookies = driver.get_cookies()
 
-        auth_cookies = [c for c in cookies if c['name'] in ['NID_AUT', 'NID_SES']]
+        auth_cookies = [c for c in cookies if c['name'] in AUTH_COOKIES]
 
         if auth_cookies:
             log(f"로그인 확인됨: {[c['name'] for c in auth_cookies]}")
@@ -256,21 +236,71 @@ def verify_login(driver):
         log(f"로그인 확인 오류: {str(e)}", "ERROR")
         return False
 
+def cafe_login_state(driver):
+    """카페 페이지의 로그인 표시로 판단: True(로그인) / False(비로그인) / None(표시를 못 찾음)"""
+    script = """
+        const found = (selectors) => selectors.some(s => document.querySelector(s));
+        if (found(arguments[0])) return true;
+        if (found(arguments[1])) return false;
+        return null;
+    """
+    # GNB는 스크립트로 늦게 그려질 수 있어 둘 중 하나가 나타날 때까지 폴링
+    deadline = time.time() + LOGIN_CHECK_TIMEOUT
+    with crawl_metrics.phase("wait"):
+        while True:
+            try:
+                state = driver.execute_script(script, LOGGED_IN_SELECTORS, LOGGED_OUT_SELECTORS)
+            except Exception:
+                state = None
+            if state is not None or time.time() >= deadline:
+                return state
+            time.sleep(0.5)
+
+def open_cafe_with_session(driver):
+    """세션 유지 모드: NAVER_COOKIES를 주입하고 카페 응답에서 로그인 확인, 실패하면 다시 주입 후 재시도
+
+    쿠키가 있다는 것만으로는 판단하지 않음 (만료/서버에서 무효화된 세션도 쿠키는 남아 있음)
+    """
+    has_env_cookies = bool(os.environ.get('NAVER_COOKIES'))
+    for attempt in (1, 2):
+        if has_env_cookies and not load_cookies(driver):
+            return False
+        log(f"카페 접속 (로그인 확인 {attempt}/2)...")
+        with crawl_metrics.phase("navigation"):
+            driver.get(CAFE_URL)
+        crawl_metrics.sleep(3)
+
+        state = cafe_login_state(driver)
+        if state:
+            log("카페 로그인 확인됨")
+            return True
+        log("카페 로그인 확인 실패" + (" (로그인 표시 없음)" if state is None else ""), "WARN")
+        if not has_env_cookies or attempt == 2:
+            break
+        log("쿠키 삭제 후 재주입")
+        driver.delete_all_cookies()
+
+    log(f"로그인 실패 - 현재 쿠키: {[c['name'] for c in driver.get_cookies()]}", "ERROR")
+    return False
+
 # ============================================
 # 카페 검색 & 게시글 가져오기
 # ============================================
 def search_cafe_post(driver):
     log(f"카페 검색 시작: {SEARCH_KEYWORD}")
     try:
-        driver.get(CAFE_URL)
-        time.sleep(3)
-
-        search_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#topLayerQueryInput"))
-        )
+        if not driver.current_url.startswith(CAFE_URL):
+            with crawl_metrics.phase("navigation"):
+                driver.get(CAFE_URL)
+            crawl_metrics.sleep(3)
+
+        with crawl_metrics.phase("wait"):
+            search_input = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#topLayerQueryInput"))
+            )
         search_input.send_keys(SEARCH_KEYWORD)
         search_input.send_keys(Keys.RETURN)
-        time.sleep(3)
+        crawl_metrics.sleep(3)
 
         try:
             driver.switch_to.frame("cafe_main")
@@ -278,9 +308,10 @@ def search_cafe_post(driver):
         except:
             log("iframe 전환 건너뜀")
 
-        articles = WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.article"))
-        )
+        with crawl_metrics.phase("wait"):
+            articles = WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.article"))
+            )
         log(f"게시글 {len(articles)}개 발견")
 
         for article in articles:
@@ -310,8 +341,9 @@ def search_cafe_post(driver):
 def get_article_content(driver, article_url):
     log(f"게시글 내용 가져오는 중: {article_url}")
     try:
-        driver.get(article_url)
-        time.sleep(3)
+        with crawl_metrics.phase("navigation"):
+            driver.get(article_url)
+        crawl_metrics.sleep(3)
 
         try:
             driver.switch_to.frame("cafe_main")
@@ -321,9 +353,10 @@ def get_article_content(driver, article_url):
         selectors = [".se-main-container", ".ArticleContentBox", "#postContent"]
         for selector in selectors:
             try:
-                content_element = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
+                with crawl_metrics.phase("wait"):
+                    content_element = WebDriverWait(driver, 5).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                    )
                 text = content_element.text.strip()
                 if len(text) > 100:
                     log(f"본문 추출 성공 ({selector}): {len(text)} 글자")
@@ -343,6 +376,133 @@ def get_article_content(driver, article_url):
             pass
 
 
+# ============================================
+# 카페 JSON API (브라우저 없이 검색 + 본문)
+# ============================================
+class _ArticleTextParser(HTMLParser):
+    """contentHtml을 Selenium .text와 비슷하게 줄 단위 텍스트로 변환"""
+    BLOCK_TAGS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "table"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self.skip += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+        elif tag == "td":
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self.skip = max(0, self.skip - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self.skip:
+            self.parts.append(data)
+
+    def text(self):
+        lines = ("".join(self.parts)).replace("\u200b", "").replace("\xa0", " ").split("\n")
+        return "\n".join(line.strip() for line in lines if line.strip())
+
+
+def html_to_text(content_html):
+    parser = _ArticleTextParser()
+    parser.feed(content_html)
+    parser.close()
+    return parser.text()
+
+
+def create_api_session(cookies):
+    """로그인 쿠키를 실은 일반 HTTP 세션"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Referer': CAFE_URL,
+        'Accept': 'application/json, text/plain, */*',
+    })
+    for cookie in cookies:
+        session.cookies.set(cookie.get('name'), cookie.get('value'),
+                            domain=cookie.get('domain', '.naver.com'), path=cookie.get('path', '/'))
+    return session
+
+
+def _iter_articles(node):
+    """검색 응답에서 articleId/subject를 가진 항목을 순회 (응답 버전 차이 흡수)"""
+    if isinstance(node, dict):
+        if 'articleId' in node and 'subject' in node:
+            yield node
+            return
+        for value in node.values():
+            yield from _iter_articles(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_articles(value)
+
+
+def search_article_via_api(session):
+    params = {
+        'cafeId': CAFE_ID,
+        'query': SEARCH_KEYWORD,
+        'searchBy': 1,
+        'sortBy': 'date',
+        'page': 1,
+        'perPage': 20,
+    }
+    res = session.get(ARTICLE_SEARCH_API, params=params, timeout=API_TIMEOUT)
+    res.raise_for_status()
+
+    for article in _iter_articles(res.json()):
+        subject = html.unescape(re.sub(r'<[^>]+>', '', str(article['subject'])))
+        if TARGET_TITLE_KEYWORD in subject:
+            log(f"목표 게시글 발견 (API): {article['articleId']} {subject}")
+            return article['articleId']
+
+    log(f"'{TARGET_TITLE_KEYWORD}' 제목을 찾지 못함 (API)", "WARN")
+    return None
+
+
+def get_article_via_api(session, article_id):
+    url = ARTICLE_API.format(cafe_id=CAFE_ID, article_id=article_id)
+    res = session.get(url, params={'useCafeId': 'true'}, timeout=API_TIMEOUT)
+    res.raise_for_status()
+
+    article = res.json().get('result', {}).get('article', {})
+    content_html = article.get('contentHtml') or ''
+    text = html_to_text(content_html)
+    if len(text) <= 100:
+        log(f"본문이 너무 짧음 (API): {len(text)} 글자", "WARN")
+        return None
+
+    log(f"본문 추출 성공 (API): {len(text)} 글자")
+    return text
+
+
+def fetch_post_via_api():
+    """API로 게시글 본문 가져오기. 실패하면 None (Selenium 경로로 대체)"""
+    cookies = read_env_cookies()
+    if not cookies:
+        return None
+
+    start = time.time()
+    try:
+        session = create_api_session(cookies)
+        article_id = search_article_via_api(session)
+        if not article_id:
+            return None
+        content = get_article_via_api(session, article_id)
+        log(f"API 경로 소요: {time.time() - start:.2f}초")
+        return content
+    except Exception as e:
+        log(f"카페 API 실패, Selenium으로 대체: {str(e)}", "WARN")
+        return None
+
+
 def get_current_time_slot():
     hour = datetime.now(KST).hour
     if hour < 12:
@@ -364,43 +524,74 @@ def main():
     log(f"Python: {sys.version}")
     log("=" * 60)
 
+    crawl_metrics.start(STATE_NAME)
     driver = None
     try:
-        # 1. 드라이버
-        driver = setup_driver()
+        # 0. 카페 API로 먼저 시도 (브라우저 불필요)
+        with crawl_metrics.phase("api_fetch"):
+            content = fetch_post_via_api() if USE_CAFE_API else None
 
-        # 2. 쿠키 로드
-        if not load_cookies(driver):
-            log("쿠키 로드 실패", "ERROR")
-            return False
-
-        # 3. 로그인 확인
-        if not verify_login(driver):
-            log("로그인 실패", "ERROR")
-            return False
-
-        # 4. 게시글 검색
-        url = search_cafe_post(driver)
-        if not url:
-            log("게시글 검색 실패", "ERROR")
-            return False
-
-        # 5. 게시글 내용
-        content = get_article_content(driver, url)
         if not content:
-            log("게시글 내용 가져오기 실패", "ERROR")
-            return False
-
-        # 6. 파싱
-        parsed = parse_price_data(content)
+            # 1. 드라이버
+            with crawl_metrics.phase("driver_startup"):
+                driver = setup_driver()
+            crawl_metrics.watch_driver(driver)
+
+            # 페이지 이동/대기는 안쪽 구간으로 따로 잡힘
+            with crawl_metrics.phase("login"):
+                if PROFILE_DIR:
+                    # 2~3. NAVER_COOKIES 먼저 주입 → 카페 응답에서 로그인 확인 (실패 시 쿠키 삭제 후 한 번 재주입)
+                    logged_in = open_cafe_with_session(driver)
+                else:
+                    # 2. 쿠키 로드
+                    if not load_cookies(driver):
+                        log("쿠키 로드 실패", "ERROR")
+                        return False
+
+                    # 3. 로그인 확인
+                    logged_in = verify_login(driver)
+            if not logged_in:
+                log("로그인 실패", "ERROR")
+                return False
+
+            # 4. 게시글 검색
+            with crawl_metrics.phase("extraction"):
+                url = search_cafe_post(driver)
+            if not url:
+                log("게시글 검색 실패", "ERROR")
+                return False
+
+            # 5. 게시글 내용
+            with crawl_metrics.phase("extraction"):
+                content = get_article_content(driver, url)
+            if not content:
+                log("게시글 내용 가져오기 실패", "ERROR")
+                return False
+
+        # 6. 변경 감지 (본문이 지난 실행과 같으면 파싱/저장 생략)
+        content_fp = crawl_state.fingerprint(content)
+        if crawl_state.is_unchanged(STATE_NAME, content_fp):
+            log("게시글 변경 없음 - 파싱/저장 생략")
+            return crawl_state.UNCHANGED
+
+        # 7. 파싱
+        with crawl_metrics.phase("parsing"):
+            parsed = parse_price_data(content)
         if not parsed:
             log("데이터 파싱 실패", "ERROR")
+            # 실패했을 때만 진단 리포트를 만들어 출력
+            report = ParseReport()
+            parse_price_data(content, report=report)
+            log(report.render(), "DEBUG")
             return False
+        log(f"파싱 완료: {len(parsed)} 카테고리, {sum(len(v) for v in parsed.values())} 제품")
 
-        # 7. 저장
+        # 8. 저장
         today = now.strftime("%Y-%m-%d")
         time_slot = get_current_time_slot()
-        save_data(parsed, today, time_slot)
+        with crawl_metrics.phase("save"):
+            save_data(parsed, today, time_slot)
+            crawl_state.save_fingerprint(STATE_NAME, content_fp)
 
         log("=" * 60)
         log("크롤러 성공 완료!")
@@ -418,5 +609,6 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    result = main()
+    crawl_metrics.finish(result)
+    sys.exit(crawl_state.exit_code(result))
@@ -7,7 +7,6 @@
 import os
 import json
 import time
-import re
 import base64
 from datetime import datetime
 from selenium import webdriver
@@ -20,6 +19,9 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 import glob
 
+from price_parser import parse_price_data
+from price_store import PriceStore
+
 # ============================================
 # 설정
 # ============================================
@@ -29,100 +31,6 @@ TARGET_TITLE_KEYWORD = "구입]채굴기"
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# ============================================
-# 파싱 함수 (기존과 동일)
-# ============================================
-def parse_price_data(price_text):
-    """네이버 카페 RAM 시세 글 형식 파싱"""
-    prices = {}
-    current_category = None
-    current_mem_type = "데스크탑"
-    
-    category_patterns = [
-        (r'데스크탑\s*용?\s*DDR5', 'DDR5 RAM (데스크탑)'),
-        (r'데스크탑\s*용?\s*DDR4', 'DDR4 RAM (데스크탑)'),
-        (r'데스크탑\s*용?\s*DDR3', 'DDR3 RAM (데스크탑)'),
-        (r'데스크탑\s+DDR5', 'DDR5 RAM (데스크탑)'),
-        (r'데스크탑\s+DDR4', 'DDR4 RAM (데스크탑)'),
-        (r'데스크탑\s+DDR3', 'DDR3 RAM (데스크탑)'),
-        (r'노트북\s*용?\s*DDR5', 'DDR5 RAM (노트북)'),
-        (r'노트북\s*용?\s*DDR4', 'DDR4 RAM (노트북)'),
-        (r'노트북\s*용?\s*DDR3', 'DDR3 RAM (노트북)'),
-        (r'노트북\s+DDR5', 'DDR5 RAM (노트북)'),
-        (r'노트북\s+DDR4', 'DDR4 RAM (노트북)'),
-        (r'노트북\s+DDR3', 'DDR3 RAM (노트북)'),
-    ]
-    
-    product_patterns = [
-        (r'삼성\s*D5\s*(\d+G)\s*[,\-]?\s*(\d{4,5})\s*(?:\[?\d*\]?)?\s*-\s*([\d,\.]+)\s*원', 'DDR5'),
-        (r'삼성\s*(\d+G)\s*PC4[\s\-]*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
-        (r'삼성\s*(\d+G)\s*-?\s*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
-        (r'삼성\s*(\d+G)\s*PC3[\s\-]*(\d{5})\s*-?\s*([\d,\.]+)\s*원', 'DDR3'),
-    ]
-    
-    lines = price_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        for pattern, cat_name in category_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                current_category = cat_name
-                if '노트북' in cat_name:
-                    current_mem_type = "노트북"
-                else:
-                    current_mem_type = "데스크탑"
-                break
-        
-        if current_category is None:
-            continue
-            
-        for pattern, ddr_type in product_patterns:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    capacity, speed, price_str = match.groups()
-                    
-                    price_clean = price_str.replace(',', '')
-                    if '.' in price_clean:
-                        parts = price_clean.split('.')
-                        if len(parts) == 2 and len(parts[1]) == 3:
-                            price = int(parts[0]) * 1000
-                        else:
-                            price = int(float(price_clean))
-                    else:
-                        price = int(price_clean)
-                    
-                    if ddr_type == 'DDR5':
-                        product_name = f"삼성 DDR5 {capacity} {speed}MHz"
-                    elif ddr_type == 'DDR4':
-                        product_name = f"삼성 DDR4 {capacity} PC4-{speed}"
-                    else:
-                        product_name = f"삼성 DDR3 {capacity} PC3-{speed}"
-                    
-                    if current_mem_type == "노트북":
-                        product_name += " (노트북)"
-                    
-                    if current_category not in prices:
-                        prices[current_category] = []
-                    
-                    existing = [p['product'] for p in prices[current_category]]
-                    if product_name not in existing:
-                        prices[current_category].append({
-                            "product": product_name,
-                            "price": price,
-                            "price_formatted": f"{price:,}원"
-                        })
-                    
-                    break
-                except Exception as e:
-                    continue
-    
-    return prices
-
-
 def get_data_file():
     """최신 JSON 파일 경로 반환"""
     files = glob.glob(os.path.join(BASE_DIR, "ram_*.json"))
@@ -135,30 +43,11 @@ def save_data(parsed_data, date_str, time_str):
     """파싱된 데이터를 JSON 파일에 저장"""
     data_path = get_data_file()
     
-    full = {"price_data": {}, "price_history": {}}
-    if os.path.exists(data_path):
-        with open(data_path, "r", encoding="utf-8") as f:
-            full = json.load(f)
+    store = PriceStore.load(data_path)
     
     history_key = f"{date_str} {time_str}"
-    full["price_history"][history_key] = parsed_data
-    
-    for category, items in parsed_data.items():
-        if category not in full["price_data"]:
-            full["price_data"][category] = []
-        
-        existing_products = {item['product']: idx for idx, item in enumerate(full["price_data"][category])}
-        
-        for new_item in items:
-            prod_name = new_item['product']
-            if prod_name in existing_products:
-                idx = existing_products[prod_name]
-                full["price_data"][category][idx] = new_item
-            else:
-                full["price_data"][category].append(new_item)
-    
-    with open(data_path, "w", encoding="utf-8") as f:
-        json.dump(full, f, ensure_ascii=False, indent=2)
+    store.apply(history_key, parsed_data)
+    store.save(data_path)
     
     print(f"✅ 데이터 저장 완료: {history_key}")
     return True
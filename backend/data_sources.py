@@ -0,0 +1,112 @@
+"""
+크롤러 데이터 파일 소스 (main.py용)
+- GitHubSource: raw.githubusercontent.com 에서 가져옴 (기본, Vercel)
+- LocalSource: 저장소 체크아웃 디렉토리에서 직접 읽음 (자체 호스팅)
+  - mtime/크기가 바뀐 경우에만 다시 읽어 파싱
+  - version()으로 변경 여부를 알 수 있어 스케줄러가 폴링해 즉시 반영
+- load(파일명, convert): 파싱 결과에 convert(예: timeseries.compact)를 적용해 반환
+  LocalSource는 변환된 결과만 캐시 → 원본 dict는 파싱 직후 버려짐
+- DATA_DIR 환경 변수가 있으면 LocalSource (예: DATA_DIR=/srv/Seondori.com/backend)
+"""
+
+import os
+import json
+
+import http_client
+import metrics
+
+GITHUB_RAW = "https://raw.githubusercontent.com/seondori/Seondori.com/main/backend/"
+GITHUB_CONTENTS_API = "https://api.github.com/repos/seondori/Seondori.com/contents/backend"
+
+
+class DataSource:
+    """load(파일명, convert) → 파싱된 JSON, list() → 파일명 목록, version(파일명) → 변경 감지 값"""
+    label = ""
+    watchable = False
+
+    def load(self, filename, convert=None):
+        raise NotImplementedError
+
+    def list(self):
+        raise NotImplementedError
+
+    def version(self, filename):
+        return None
+
+    def latest(self, prefix, suffix=".json"):
+        """prefix로 시작하는 파일 중 이름순 마지막 (예: ram_new_20260320.json)"""
+        names = sorted(name for name in self.list() if name.startswith(prefix) and name.endswith(suffix))
+        return names[-1] if names else None
+
+
+class GitHubSource(DataSource):
+    label = "GitHub"
+
+    def __init__(self, raw_base=GITHUB_RAW, contents_api=GITHUB_CONTENTS_API):
+        self.raw_base = raw_base
+        self.contents_api = contents_api
+
+    def load(self, filename, convert=None):
+        data = http_client.get_json(self.raw_base + filename)
+        return convert(data) if convert else data
+
+    def list(self):
+        return [f["name"] for f in http_client.get_json(self.contents_api)]
+
+
+class LocalSource(DataSource):
+    label = "로컬"
+    watchable = True
+
+    def __init__(self, directory):
+        self.directory = directory
+        # (파일명, convert) → ((mtime_ns, size), 변환 결과)
+        # convert별로 따로 둬야 관리자용 원본(convert=None)과 스냅샷용 압축본이 서로를 밀어내지 않음
+        # (convert는 모듈 수준 함수만 넘어오므로 파일당 항목 수는 고정)
+        self._cache = {}
+
+    def _path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def version(self, filename):
+        """파일 변경 감지용 (mtime_ns, size). 파일이 없으면 None"""
+        try:
+            st = os.stat(self._path(filename))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def load(self, filename, convert=None):
+        """파싱된 JSON (변경 없으면 캐시 재사용 - 호출하는 쪽에서 수정하지 말 것)"""
+        version = self.version(filename)
+        if version is None:
+            raise FileNotFoundError(self._path(filename))
+        key = (filename, convert)
+        cached = self._cache.get(key)
+        hit = bool(cached and cached[0] == version)
+        metrics.cache_lookup("local_file", hit=hit)
+        if hit:
+            return cached[1]
+
+        if version[1] == 0:
+            raise ValueError(f"{filename}: 빈 파일")
+        # json.loads는 bytes가 필요해 어차피 전체를 한 번 읽음 (mmap으로 매핑해도 복사만 늘어남)
+        with metrics.span("fetch.local"):
+            with open(self._path(filename), "rb") as f:
+                raw = f.read()
+        with metrics.span("parse"):
+            data = json.loads(raw)
+        if convert:
+            data = convert(data)
+        self._cache[key] = (version, data)
+        return data
+
+    def list(self):
+        return os.listdir(self.directory)
+
+
+def from_env():
+    directory = os.environ.get("DATA_DIR")
+    if directory:
+        return LocalSource(os.path.abspath(directory))
+    return GitHubSource()
@@ -0,0 +1,88 @@
+"""
+이력 증분 동기화 (main.py의 since= 파라미터용)
+- 스냅샷 버전(Scheduler가 소스별로 1씩 올림)을 동기화 버전으로 씀
+- 스냅샷이 바뀔 때마다 시점 키별로 "마지막으로 추가/변경된 버전"을 기록
+  - price_history 데이터셋(compuzone / dramexchange): 시점 키 → 그 시점 JSON
+  - trends 데이터셋(ram / ram-new): 점의 date → 그 날짜의 (상품, 가격) 목록
+  같은 키라도 내용이 바뀌면 새 버전으로 기록 (관리자 업데이트로 같은 시점을 다시 저장하는 경우)
+- since=v 요청 → 버전이 v보다 큰 시점만 담은 응답 (현재 시세 등 나머지 필드는 전체)
+- 다음 경우엔 전체(reset)를 돌려줌
+  - epoch가 없거나 다름 (서버 재시작 / 다른 워커 등으로 버전을 1부터 따로 셈)
+  - v가 기록 시작 버전보다 작음, 또는 그 뒤로 시점이 빠짐 (증분으로 표현 불가)
+  - v가 현재 버전보다 큼
+- 응답의 "sync": {"dataset", "epoch", "version", "since", "mode": "delta" | "reset"}
+  클라이언트는 version / epoch를 저장해 두고 다음 요청의 since / epoch로 둘 다 보냄 (since=0 → 항상 전체)
+"""
+
+from collections import namedtuple
+
+from timeseries import CompactHistory, iter_entries, select
+
+# base: 이 버전 이전(since < base)은 증분으로 줄 수 없음
+SyncState = namedtuple("SyncState", ["epoch", "base", "version", "seqs", "fingerprints", "data"])
+
+
+def fingerprints(data):
+    """{시점 키: 내용 해시} (추적 대상이 아닌 데이터면 None) - 같은 프로세스 안에서만 비교"""
+    if not isinstance(data, dict):
+        return None
+    history = data.get("price_history")
+    if isinstance(history, (dict, CompactHistory)):
+        return {key: hash(entry) for key, entry in iter_entries(history)}
+    trends = data.get("trends")
+    if isinstance(trends, dict):
+        by_date = {}
+        for product, points in trends.items():
+            for point in points:
+                by_date.setdefault(point["date"], []).append((product, point["price"]))
+        return {date: hash(tuple(items)) for date, items in by_date.items()}
+    return None
+
+def _partial(data, keys):
+    """keys에 든 시점만 남긴 응답 데이터"""
+    if isinstance(data.get("price_history"), (dict, CompactHistory)):
+        return {**data, "price_history": select(data["price_history"], keys)}
+    trends = {}
+    for product, points in data["trends"].items():
+        changed = [point for point in points if point["date"] in keys]
+        if changed:
+            trends[product] = changed
+    return {**data, "trends": trends}
+
+
+class SyncTracker:
+    def __init__(self):
+        self.states = {}   # 스냅샷 이름 → SyncState (통째로 교체)
+
+    def on_snapshot(self, prev, snapshot):
+        """Scheduler 리스너 - 시점 키별 버전 갱신 (갱신 스레드에서 호출)"""
+        prints = fingerprints(snapshot.data)
+        if prints is None:
+            return
+        version = snapshot.version
+        state = self.states.get(snapshot.name)
+        if state is None or state.epoch != snapshot.epoch or version <= state.version:
+            # 처음 보는 계열 → 이 버전부터 기록
+            seqs, base = dict.fromkeys(prints, version), version
+        else:
+            seqs = {key: state.seqs[key] if state.fingerprints.get(key) == fp else version
+                    for key, fp in prints.items()}
+            base = version if state.fingerprints.keys() - prints.keys() else state.base
+        self.states[snapshot.name] = SyncState(snapshot.epoch, base, version, seqs, prints, snapshot.data)
+
+    def changes_since(self, name, since, epoch=None):
+        """(sync 정보, 응답 데이터). 추적 중인 스냅샷이 없으면 None"""
+        state = self.states.get(name)
+        if state is None:
+            return None
+        info = {"dataset": name, "epoch": state.epoch, "version": state.version, "since": since}
+        # 버전은 워커/재시작마다 1부터 따로 셈 → epoch 없이 온 since는 어느 계열 버전인지 알 수 없음
+        if since > 0 and epoch != state.epoch:
+            return {**info, "mode": "reset"}, state.data
+        if not state.base <= since <= state.version:
+            return {**info, "mode": "reset"}, state.data
+        keys = {key for key, seq in state.seqs.items() if seq > since}
+        return {**info, "mode": "delta"}, _partial(state.data, keys)
+
+
+tracker = SyncTracker()
@@ -3,8 +3,8 @@ DRAM Exchange 크롤링 모듈
 """
 
 import os
+import sys
 import json
-import time
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -13,6 +13,11 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 import re
 
+import crawl_state
+import crawl_metrics
+
+STATE_NAME = "dram_exchange"
+
 def setup_driver():
     """Selenium WebDriver 설정"""
     options = Options()
@@ -33,53 +38,79 @@ def setup_driver():
         print(f"❌ WebDriver 생성 실패: {e}")
         raise
 
+# 테이블 행을 셀 텍스트 배열로 한 번에 반환
+TABLE_ROWS_JS = """
+    var rows = document.querySelectorAll('table tbody tr');
+    if (!rows.length) rows = document.querySelectorAll('tr');
+    var out = [];
+    for (var i = 0; i < rows.length; i++) {
+        var cells = rows[i].querySelectorAll('td');
+        if (cells.length < 3) continue;
+        var texts = [];
+        for (var j = 0; j < cells.length && j < 7; j++) texts.push(cells[j].innerText);
+        out.push(texts);
+    }
+    return out;
+"""
+
+NUMERIC_COLUMNS = ["daily_high", "daily_low", "session_high", "session_low", "session_average"]
+NON_NUMERIC = re.compile(r'[^0-9.]')
+
+def extract_table_rows(driver):
+    """페이지의 모든 행을 [[셀 텍스트, ...], ...] 형태로 한 번에 추출"""
+    return driver.execute_script(TABLE_ROWS_JS) or []
+
+def parse_dram_rows(rows):
+    """셀 텍스트 배열을 카테고리별 데이터로 변환 (숫자 변환은 일괄 처리)"""
+    results = {}
+    for cells in rows:
+        if not cells or len(cells) < 3: continue
+
+        product_cell = cells[0].strip()
+
+        current_category = None
+        if "DDR5" in product_cell: current_category = "DDR5"
+        elif "DDR4" in product_cell: current_category = "DDR4"
+        elif "DDR3" in product_cell: current_category = "DDR3"
+
+        if not current_category: continue
+
+        try:
+            values = [float(NON_NUMERIC.sub('', c)) for c in cells[1:6]]
+        except ValueError:
+            continue
+        values += [0] * (len(NUMERIC_COLUMNS) - len(values))
+
+        data_point = {"product": product_cell}
+        data_point.update(zip(NUMERIC_COLUMNS, values))
+        data_point["session_change"] = cells[6].strip() if len(cells) > 6 else "N/A"
+        results.setdefault(current_category, []).append(data_point)
+    return results
+
 def crawl_dram_exchange():
     """DRAM Exchange 크롤링 실행"""
     driver = None
     try:
-        driver = setup_driver()
+        with crawl_metrics.phase("driver_startup"):
+            driver = setup_driver()
+        crawl_metrics.watch_driver(driver)
         print("\n🌐 DRAM Exchange 접속 중...")
-        driver.get("https://www.dramexchange.com/")
-        time.sleep(5)
-        
-        results = {}
+        with crawl_metrics.phase("navigation"):
+            driver.get("https://www.dramexchange.com/")
+        crawl_metrics.sleep(5)
         
         try:
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            if not rows:
-                rows = driver.find_elements(By.CSS_SELECTOR, "tr")
-            
+            # 테이블 전체를 한 번의 execute_script로 가져옴 (셀마다 WebDriver 왕복 X)
+            with crawl_metrics.phase("extraction"):
+                rows = extract_table_rows(driver)
             print(f"📊 발견된 행: {len(rows)}")
-            
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if not cells or len(cells) < 3: continue
-                    
-                    product_cell = cells[0].text.strip()
-                    
-                    current_category = None
-                    if "DDR5" in product_cell: current_category = "DDR5"
-                    elif "DDR4" in product_cell: current_category = "DDR4"
-                    elif "DDR3" in product_cell: current_category = "DDR3"
-                    
-                    if not current_category: continue
-                    if current_category not in results: results[current_category] = []
-                    
-                    data_point = {
-                        "product": product_cell,
-                        "daily_high": float(re.sub(r'[^0-9.]', '', cells[1].text)) if len(cells) > 1 else 0,
-                        "daily_low": float(re.sub(r'[^0-9.]', '', cells[2].text)) if len(cells) > 2 else 0,
-                        "session_high": float(re.sub(r'[^0-9.]', '', cells[3].text)) if len(cells) > 3 else 0,
-                        "session_low": float(re.sub(r'[^0-9.]', '', cells[4].text)) if len(cells) > 4 else 0,
-                        "session_average": float(re.sub(r'[^0-9.]', '', cells[5].text)) if len(cells) > 5 else 0,
-                        "session_change": cells[6].text.strip() if len(cells) > 6 else "N/A",
-                    }
-                    results[current_category].append(data_point)
-                    print(f"  ✅ {product_cell}: ${data_point['session_average']:.2f}")
-                    
-                except Exception: continue
-            
+
+            with crawl_metrics.phase("parsing"):
+                results = parse_dram_rows(rows)
+            for category_rows in results.values():
+                for data_point in category_rows:
+                    print(f"  ✅ {data_point['product']}: ${data_point['session_average']:.2f}")
+
             return {
                 "status": "success",
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
@@ -133,10 +164,27 @@ def save_dram_data(data, base_dir="."):
     print(f"✅ 데이터 업데이트 완료: {filepath} (총 {len(dram_data['price_history'])}개 시점 데이터)")
     return True
 
-if __name__ == "__main__":
+def main():
     print("🚀 DRAM Exchange 크롤러 시작")
+    crawl_metrics.start(STATE_NAME)
     data = crawl_dram_exchange()
-    if data["status"] == "success":
-        save_dram_data(data)
-    else:
+    if data["status"] != "success":
         print(f"❌ 실패: {data.get('message')}")
+        return False
+
+    # 시세가 지난 실행과 같으면 저장 생략
+    prices_fp = crawl_state.fingerprint(data["data"])
+    if crawl_state.is_unchanged(STATE_NAME, prices_fp):
+        print("ℹ️ 시세 변경 없음 - 저장 생략")
+        return crawl_state.UNCHANGED
+
+    with crawl_metrics.phase("save"):
+        if not save_dram_data(data):
+            return False
+        crawl_state.save_fingerprint(STATE_NAME, prices_fp)
+    return True
+
+if __name__ == "__main__":
+    result = main()
+    crawl_metrics.finish(result)
+    sys.exit(crawl_state.exit_code(result))
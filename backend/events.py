@@ -0,0 +1,195 @@
+"""
+실시간 갱신 푸시 (Server-Sent Events, main.py /api/events용)
+- 구독자마다 asyncio.Queue. publish()는 어느 스레드에서 불러도 됨 (스냅샷 갱신은 스레드풀에서 돎)
+- 스냅샷이 바뀌면 이전 스냅샷과 비교한 변경분(snapshot_delta)만 보냄
+  - price_history 데이터셋(compuzone / dramexchange): 바뀐 최상위 필드 + 새 시점 (마지막 시점이 바뀐 경우 포함)
+  - trends 데이터셋(ram / ram-new): 바뀐 최상위 필드 + 상품별로 뒤에 붙은 점 (앞부분이 달라진 상품은 통째로)
+  - 시장 데이터: 종목별 현재가 / 등락 + 마지막 점 이후 차트 점 (창 길이 유지용 length 포함)
+  - 시점/상품이 빠지는 등 변경분으로 표현할 수 없으면 reset → 클라이언트가 다시 받음
+- 큐가 가득 찬(느린) 구독자는 끊음 → EventSource가 다시 연결하면서 전체를 새로 받음
+- 구독자가 없으면 변경분 계산 자체를 건너뜀
+"""
+
+import asyncio
+import threading
+
+from timeseries import CompactHistory, encode_json, history_keys, select
+
+# 구독자별 대기 메시지 수 (넘으면 연결 종료)
+QUEUE_SIZE = 64
+# 이벤트가 없을 때 주석 줄을 보내는 주기 (프록시 유휴 타임아웃 방지, 초)
+HEARTBEAT = 25
+# 끊겼을 때 EventSource 재연결 대기 (ms)
+RETRY_MS = 5000
+
+
+def format_event(event, data):
+    """SSE 메시지 한 개 (data는 CompactHistory가 들어 있어도 encode_json으로 직렬화)"""
+    return f"event: {event}\ndata: {encode_json(data)}\n\n"
+
+
+class Subscriber:
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.closed = False
+
+
+class Broker:
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def subscribe(self):
+        subscriber = Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event, data):
+        if not self._subscribers:
+            return
+        message = format_event(event, data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, message)
+            except RuntimeError:  # 이벤트 루프가 이미 닫힘
+                self.unsubscribe(subscriber)
+
+    def _deliver(self, subscriber, message):
+        if subscriber.closed:
+            return
+        try:
+            subscriber.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 밀린 메시지를 버리고 종료 신호(None)만 남김
+            subscriber.closed = True
+            self.unsubscribe(subscriber)
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait(None)
+
+    async def stream(self, hello=None):
+        """StreamingResponse용 - 연결 직후 hello 이벤트, 이후 publish된 메시지"""
+        subscriber = self.subscribe()
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            if hello is not None:
+                yield format_event("hello", hello)
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscriber.queue.get(), HEARTBEAT)
+                except asyncio.TimeoutError:
+                    message = ": ping\n\n"
+                if message is None:
+                    break
+                yield message
+        finally:
+            self.unsubscribe(subscriber)
+
+
+# ============================================
+# 스냅샷 변경분
+# ============================================
+class Reset(Exception):
+    """변경분으로 표현할 수 없음"""
+
+
+def _changed_fields(prev, data, skip):
+    if set(prev) - set(data):
+        raise Reset()
+    return {key: value for key, value in data.items()
+            if key not in skip and (key not in prev or prev[key] != value)}
+
+def _history_delta(prev, history):
+    prev_keys = set(history_keys(prev))
+    keys = history_keys(history)
+    if prev_keys - set(keys):
+        raise Reset()
+    changed = [key for key in keys if key not in prev_keys]
+    # 같은 시점 키로 다시 저장된 경우 (마지막 시점만 확인)
+    latest = max(prev_keys) if prev_keys else None
+    if latest is not None and encode_json(select(prev, [latest])) != encode_json(select(history, [latest])):
+        changed.append(latest)
+    return select(history, changed)
+
+def _trends_delta(prev, trends):
+    if set(prev) - set(trends):
+        raise Reset()
+    append, replace = {}, {}
+    for product, points in trends.items():
+        old = prev.get(product, [])
+        if points[:len(old)] == old:
+            if len(points) > len(old):
+                append[product] = points[len(old):]
+        else:
+            replace[product] = points
+    return append, replace
+
+def _market_delta(prev, data):
+    if set(prev) - set(data):
+        raise Reset()
+    result = {}
+    for category, items in data.items():
+        old = {item["name"]: item for item in prev.get(category, [])}
+        changed = []
+        for item in items:
+            before = old.get(item["name"], {})
+            last_time = before["chart"][-1]["time"] if before.get("chart") else ""
+            tick = {key: item[key] for key in ("name", "current", "delta", "pct")}
+            tick["append"] = [point for point in item["chart"] if point["time"] > last_time]
+            tick["length"] = len(item["chart"])
+            if tick["append"] or any(before.get(key) != item[key] for key in ("current", "delta", "pct")):
+                changed.append(tick)
+        if changed:
+            result[category] = changed
+    return result
+
+def snapshot_delta(prev, snapshot):
+    """이전 스냅샷 → 새 스냅샷 변경분 이벤트 데이터 (바뀐 게 없으면 None)"""
+    name = snapshot.name
+    dataset, _, period = name.partition(":")
+    delta = {"dataset": dataset, "version": snapshot.version}
+    if period:
+        delta["period"] = period
+    data = snapshot.data
+    if prev is None or not isinstance(prev.data, dict) or not isinstance(data, dict):
+        return {**delta, "reset": True}
+
+    try:
+        if dataset == "market-data":
+            changes = {"market": _market_delta(prev.data, data)}
+        elif isinstance(data.get("price_history"), (dict, CompactHistory)):
+            changes = _changed_fields(prev.data, data, skip={"price_history"})
+            history = _history_delta(prev.data.get("price_history") or {}, data["price_history"])
+            changes = {"set": changes, "history": history}
+        elif isinstance(data.get("trends"), dict):
+            append, replace = _trends_delta(prev.data.get("trends") or {}, data["trends"])
+            changes = {"set": _changed_fields(prev.data, data, skip={"trends"}), "append": append, "replace": replace}
+        else:
+            changes = {"set": _changed_fields(prev.data, data, skip=set())}
+    except (Reset, KeyError, TypeError):
+        return {**delta, "reset": True}
+
+    changes = {key: value for key, value in changes.items() if value}
+    return {**delta, **changes} if changes else None
+
+
+broker = Broker()
+
+def on_snapshot(prev, snapshot):
+    """Scheduler 리스너 - 구독자가 있을 때만 변경분 계산"""
+    if not len(broker):
+        return
+    delta = snapshot_delta(prev, snapshot)
+    if delta is not None:
+        broker.publish("snapshot", delta)
@@ -0,0 +1,245 @@
+"""
+GitHub 데이터 fetch용 공용 HTTP 클라이언트 (main.py용)
+- 호스트별 keep-alive 연결 풀 (http.client - requests를 import하지 않아 콜드 스타트 비용 없음)
+- 일시적 오류(연결 실패, 429, 5xx, 잘린 응답 본문)는 지터를 섞은 지수 백오프로 재시도
+- GitHub 요청 한도 초과(403 + X-RateLimit-Remaining: 0 / Retry-After)는 재시도하지 않고 바로 마지막 정상 응답 사용
+- 호스트별 타임아웃
+- 호스트별 서킷 브레이커: 연속 실패 시 일정 시간 요청을 보내지 않고 마지막 정상 응답을 반환
+- 연결 재사용 / 재시도 / 캐시 응답 횟수 집계 (stats())
+"""
+
+import gzip
+import json
+import time
+import random
+import threading
+import http.client
+from urllib.parse import urlsplit
+
+import metrics
+
+DEFAULT_TIMEOUT = 10
+HOST_TIMEOUTS = {
+    "raw.githubusercontent.com": 10,
+    "api.github.com": 5,
+}
+
+POOL_SIZE = 4          # 호스트별 보관할 유휴 연결 수
+MAX_RETRIES = 3        # 첫 시도 제외
+BACKOFF_BASE = 0.5     # 초
+BACKOFF_CAP = 8.0
+
+BREAKER_THRESHOLD = 5  # 연속 실패 횟수
+BREAKER_COOLDOWN = 60  # 초
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def is_rate_limited(status, headers):
+    """GitHub 요청 한도 초과 응답 (403/429 + 한도 헤더) - 한도가 풀리는 건 보통 수십 분 뒤라 재시도 대신 캐시"""
+    if status not in (403, 429):
+        return False
+    return headers.get("X-RateLimit-Remaining") == "0" or headers.get("Retry-After") is not None
+
+# keep-alive 연결이 서버 쪽에서 이미 닫혀 있을 때 나는 오류 → 새 연결로 바로 다시 시도
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+HEADERS = {
+    "User-Agent": "Seondori-API",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+}
+
+
+class FetchError(Exception):
+    """재시도 후에도 실패 (캐시된 응답도 없음)"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class CircuitOpenError(FetchError):
+    pass
+
+
+class _Breaker:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def is_open(self, now):
+        # 쿨다운이 지나면 한 번 시도해 보도록 반쯤 열어 둠 (실패하면 다시 열림)
+        return self.opened_at is not None and now - self.opened_at < BREAKER_COOLDOWN
+
+
+class HttpClient:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}       # host → [HTTPSConnection]
+        self._breakers = {}   # host → _Breaker
+        self._cache = {}      # url → 마지막 정상 응답 본문 (bytes - 파싱된 dict보다 훨씬 작음)
+        self.counters = {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "retries": 0,
+            "failures": 0,
+            "served_from_cache": 0,
+            "circuit_opened": 0,
+        }
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.counters[key] += n
+
+    # ----- 연결 풀 -----
+    def _connect(self, host):
+        self._count("new_connections")
+        return http.client.HTTPSConnection(host, timeout=HOST_TIMEOUTS.get(host, DEFAULT_TIMEOUT))
+
+    def _acquire(self, host):
+        """(연결, 재사용 여부)"""
+        with self._lock:
+            idle = self._idle.get(host)
+            if idle:
+                self.counters["reused_connections"] += 1
+                return idle.pop(), True
+        return self._connect(host), False
+
+    def _release(self, host, conn):
+        with self._lock:
+            idle = self._idle.setdefault(host, [])
+            if len(idle) < POOL_SIZE:
+                idle.append(conn)
+                return
+        conn.close()
+
+    # ----- 서킷 브레이커 -----
+    def _breaker(self, host):
+        with self._lock:
+            return self._breakers.setdefault(host, _Breaker())
+
+    def _record(self, host, ok):
+        breaker = self._breaker(host)
+        with self._lock:
+            if ok:
+                breaker.failures = 0
+                breaker.opened_at = None
+                return
+            breaker.failures += 1
+            self.counters["failures"] += 1
+            if breaker.failures >= BREAKER_THRESHOLD:
+                if breaker.opened_at is None:
+                    self.counters["circuit_opened"] += 1
+                breaker.opened_at = time.monotonic()
+
+    # ----- 요청 -----
+    def _request_once(self, host, path):
+        """(status, 응답 헤더, body bytes). 재사용 연결이 끊겨 있으면 새 연결로 한 번 더"""
+        conn, reused = self._acquire(host)
+        try:
+            conn.request("GET", path, headers=HEADERS)
+            res = conn.getresponse()
+        except STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            conn = self._connect(host)
+            try:
+                conn.request("GET", path, headers=HEADERS)
+                res = conn.getresponse()
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        try:
+            body = res.read()
+        except Exception:
+            conn.close()
+            raise
+        if res.will_close:
+            conn.close()
+        else:
+            self._release(host, conn)
+
+        if res.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return res.status, res.headers, body
+
+    def get_json(self, url):
+        """URL의 JSON. 실패 시 마지막 정상 응답, 그것도 없으면 FetchError"""
+        parts = urlsplit(url)
+        host = parts.hostname
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+        if self._breaker(host).is_open(time.monotonic()):
+            return self._fallback(url, CircuitOpenError(f"{host} 서킷 열림 (연속 실패)"))
+
+        last_error = None
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                self._count("retries")
+                time.sleep(min(BACKOFF_CAP, BACKOFF_BASE * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+            self._count("requests")
+            try:
+                with metrics.span(f"fetch.{host}"):
+                    status, headers, body = self._request_once(host, path)
+            except (OSError, EOFError, http.client.HTTPException) as e:
+                # EOFError: gzip 본문이 잘림
+                last_error = FetchError(f"{host} 연결 실패: {e}")
+                continue
+
+            if 200 <= status < 300:
+                try:
+                    with metrics.span("parse"):
+                        data = json.loads(body)
+                except ValueError as e:
+                    # 잘린 본문 등 → 연결 오류처럼 재시도 (캐시도 갱신하지 않음)
+                    last_error = FetchError(f"{url} JSON 파싱 실패: {e}")
+                    continue
+                self._record(host, ok=True)
+                with self._lock:
+                    self._cache[url] = body
+                return data
+
+            if is_rate_limited(status, headers):
+                last_error = FetchError(f"{url} HTTP {status} (요청 한도 초과)", status=status)
+                break
+            last_error = FetchError(f"{url} HTTP {status}", status=status)
+            if status not in RETRY_STATUSES:
+                # 404 등은 업스트림 장애가 아니므로 서킷/캐시 없이 그대로 실패
+                raise last_error
+        self._record(host, ok=False)
+        return self._fallback(url, last_error)
+
+    def _fallback(self, url, error):
+        with self._lock:
+            cached = self._cache.get(url)
+        if cached is None:
+            raise error
+        self._count("served_from_cache")
+        print(f"⚠️ {error} - 마지막 정상 응답 사용")
+        return json.loads(cached)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats["idle_connections"] = {host: len(conns) for host, conns in self._idle.items()}
+            stats["open_circuits"] = [host for host, b in self._breakers.items() if b.is_open(time.monotonic())]
+        total = stats["new_connections"] + stats["reused_connections"]
+        stats["reuse_ratio"] = round(stats["reused_connections"] / total, 3) if total else 0.0
+        return stats
+
+
+client = HttpClient()
+
+def get_json(url):
+    return client.get_json(url)
+
+def stats():
+    return client.stats()
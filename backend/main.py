@@ -1,17 +1,55 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi import Request
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
-import yfinance as yf
-import json
+from typing import List, Optional
+from contextlib import asynccontextmanager
+import asyncio
 import os
-import glob
-import re
-import requests
-import pandas as pd
-from datetime import datetime, timedelta
+import json
+from datetime import datetime
+
+from price_parser import parse_price_data, ParseReport
+from batch_parse import parse_posts, merge_parsed
+from price_store import PriceStore
+import snapshots
+from snapshots import Scheduler
+import shared_snapshot
+import events
+import delta_sync
+import analytics
+import http_client
+import data_sources
+import metrics
+import timeseries
+from views import (BASE_DIR, PRERENDERED_DIR, build_trend_data, file_fingerprint, iter_json, iter_ndjson,
+                   limit_days, limit_history, render_json, snapshot_filename, source_filename)
+
+scheduler = Scheduler(shared_snapshot.from_env())
+scheduler.listeners.append(delta_sync.tracker.on_snapshot)
+scheduler.listeners.append(events.on_snapshot)
+scheduler.listeners.append(analytics.cache.on_snapshot)
+
+@asynccontextmanager
+async def lifespan(app):
+    scheduler.start()
+    yield
+    await scheduler.stop()
+
+class TimedJSONResponse(JSONResponse):
+    """직렬화 시간을 encode 구간으로 기록하는 JSONResponse
+
+    views.render_json은 Starlette와 같은 바이트를 만들면서 CompactHistory도 직접 인코딩
+    """
 
-app = FastAPI()
+    def render(self, content):
+        with metrics.span("encode"):
+            return render_json(content)
+
+app = FastAPI(lifespan=lifespan, default_response_class=TimedJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,64 +57,50 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+# 가장 바깥쪽 (압축 후 크기 기록, Server-Timing 헤더 추가). 비활성화 시 아예 붙이지 않음
+if metrics.ENABLED:
+    app.add_middleware(metrics.TimingMiddleware)
 
-GITHUB_RAW = "https://raw.githubusercontent.com/seondori/Seondori.com/main/backend/"
+# DATA_DIR가 있으면 로컬 디렉토리, 없으면 GitHub (data_sources.py)
+# GitHub JSON은 requests 대신 http_client(표준 라이브러리 http.client 기반 연결 풀)로 받고,
+# yfinance / pandas는 import만 수백 ms라 시세 엔드포인트 안에서만 import
+# → Vercel 콜드 스타트 때 JSON 엔드포인트가 이 비용을 내지 않도록
+DATA_SOURCE = data_sources.from_env()
 
-def load_ram_data():
+# 스냅샷용 로드는 convert=timeseries.compact로 price_history를 압축 표현으로 보관
+# (관리자 업데이트/다운로드처럼 원본 dict를 수정·재저장하는 곳은 convert 없이 로드)
+def load_source_file(filename, label, convert=None):
     try:
-        url = GITHUB_RAW + "ram_price_junggo.json"
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        return res.json()
+        return DATA_SOURCE.load(filename, convert)
     except Exception as e:
-        print(f"GitHub에서 RAM 데이터 로드 실패: {e}")
+        print(f"{DATA_SOURCE.label}에서 {label} 데이터 로드 실패: {e}")
         return None
 
+def load_ram_data(convert=None):
+    return load_source_file("ram_price_junggo.json", "RAM", convert)
+
 def load_dram_data():
-    try:
-        url = GITHUB_RAW + "dram_exchange_data.json"
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        return res.json()
-    except Exception as e:
-        print(f"GitHub에서 DRAM 데이터 로드 실패: {e}")
-        return None
+    return load_source_file("dram_exchange_data.json", "DRAM", timeseries.compact)
 
 def load_compuzone_data():
-    """GitHub에서 컴퓨존 데이터 로드"""
+    """컴퓨존 데이터 로드"""
+    return load_source_file("compuzone_data.json", "컴퓨존", timeseries.compact)
+
+def latest_ram_new_file():
     try:
-        url = GITHUB_RAW + "compuzone_data.json"
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        return res.json()
+        return DATA_SOURCE.latest("ram_new_")
     except Exception as e:
-        print(f"GitHub에서 컴퓨존 데이터 로드 실패: {e}")
+        print(f"{DATA_SOURCE.label}에서 신품 데이터 목록 조회 실패: {e}")
         return None
 
-def load_ram_new_data():
-    """GitHub에서 신품 최저가 데이터 로드 (ram_new_*.json)"""
-    try:
-        # 먼저 최신 파일명을 찾기 위해 GitHub API 사용
-        api_url = "https://api.github.com/repos/seondori/Seondori.com/contents/backend"
-        res = requests.get(api_url, timeout=10)
-        res.raise_for_status()
-        files = res.json()
-        
-        # ram_new_*.json 파일 찾기
-        new_files = [f["name"] for f in files if f["name"].startswith("ram_new_") and f["name"].endswith(".json")]
-        
-        if not new_files:
-            print("ram_new_*.json 파일 없음")
-            return None
-        
-        latest_file = sorted(new_files)[-1]
-        url = GITHUB_RAW + latest_file
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        return res.json()
-    except Exception as e:
-        print(f"GitHub에서 신품 데이터 로드 실패: {e}")
+def load_ram_new_data(convert=None):
+    """신품 최저가 데이터 로드 (가장 최근 ram_new_*.json)"""
+    latest_file = latest_ram_new_file()
+    if not latest_file:
+        print("ram_new_*.json 파일 없음")
         return None
+    return load_source_file(latest_file, "신품", convert)
 
 @app.get("/")
 async def root():
@@ -89,6 +113,9 @@ async def root():
             "/api/dramexchange-data",
             "/api/compuzone-data",
             "/api/ram-new-data",
+            "/api/dashboard",
+            "/api/events",
+            "/api/analytics",
         ]
     }
 
@@ -97,105 +124,9 @@ class UpdateRequest(BaseModel):
     time: str
     text: str
 
-# ============================================
-# 네이버 카페 글 형식 파싱
-# ============================================
-def parse_price_data(price_text):
-    prices = {}
-    current_category = None
-    current_mem_type = "데스크탑"
-    
-    category_patterns = [
-        (r'데스크탑\s*용?\s*DDR5', 'DDR5 RAM (데스크탑)'),
-        (r'데스크탑\s*용?\s*DDR4', 'DDR4 RAM (데스크탑)'),
-        (r'데스크탑\s*용?\s*DDR3', 'DDR3 RAM (데스크탑)'),
-        (r'데스크탑\s+DDR5', 'DDR5 RAM (데스크탑)'),
-        (r'데스크탑\s+DDR4', 'DDR4 RAM (데스크탑)'),
-        (r'데스크탑\s+DDR3', 'DDR3 RAM (데스크탑)'),
-        (r'노트북\s*용?\s*DDR5', 'DDR5 RAM (노트북)'),
-        (r'노트북\s*용?\s*DDR4', 'DDR4 RAM (노트북)'),
-        (r'노트북\s*용?\s*DDR3', 'DDR3 RAM (노트북)'),
-        (r'노트북\s+DDR5', 'DDR5 RAM (노트북)'),
-        (r'노트북\s+DDR4', 'DDR4 RAM (노트북)'),
-        (r'노트북\s+DDR3', 'DDR3 RAM (노트북)'),
-    ]
-    
-    product_patterns = [
-        (r'삼성\s*D5\s*(\d+G)\s*[,\-]?\s*(\d{4,5})\s*(?:\[?\d*\]?)?\s*-\s*([\d,\.]+)\s*원', 'DDR5'),
-        (r'삼성\s*(\d+G)\s*PC4[\s\-]*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
-        (r'삼성\s*(\d+G)\s*-?\s*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원', 'DDR4'),
-        (r'삼성\s*(\d+G)\s*PC3[\s\-]*(\d{5})\s*-?\s*([\d,\.]+)\s*원', 'DDR3'),
-    ]
-    
-    lines = price_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        for pattern, cat_name in category_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                current_category = cat_name
-                if '노트북' in cat_name:
-                    current_mem_type = "노트북"
-                else:
-                    current_mem_type = "데스크탑"
-                print(f"[카테고리 감지] {cat_name}")
-                break
-        
-        if current_category is None:
-            continue
-            
-        for pattern, ddr_type in product_patterns:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    capacity, speed, price_str = match.groups()
-                    price_clean = price_str.replace(',', '')
-                    if '.' in price_clean:
-                        parts = price_clean.split('.')
-                        if len(parts) == 2 and len(parts[1]) == 3:
-                            price = int(parts[0]) * 1000
-                        else:
-                            price = int(float(price_clean))
-                    else:
-                        price = int(price_clean)
-                    
-                    if ddr_type == 'DDR5':
-                        product_name = f"삼성 DDR5 {capacity} {speed}MHz"
-                    elif ddr_type == 'DDR4':
-                        product_name = f"삼성 DDR4 {capacity} PC4-{speed}"
-                    else:
-                        product_name = f"삼성 DDR3 {capacity} PC3-{speed}"
-                    
-                    if current_mem_type == "노트북":
-                        product_name += " (노트북)"
-                    
-                    if current_category not in prices:
-                        prices[current_category] = []
-                    
-                    existing = [p['product'] for p in prices[current_category]]
-                    if product_name not in existing:
-                        prices[current_category].append({
-                            "product": product_name,
-                            "price": price,
-                            "price_formatted": f"{price:,}원"
-                        })
-                        print(f"  [제품 추가] {product_name} = {price:,}원")
-                    
-                    break
-                    
-                except Exception as e:
-                    print(f"[파싱 오류] {line}: {e}")
-                    continue
-    
-    print(f"\n[파싱 완료] 총 {len(prices)}개 카테고리")
-    for cat, items in prices.items():
-        print(f"  - {cat}: {len(items)}개 제품")
-    
-    return prices
-
+class BatchParseRequest(BaseModel):
+    posts: List[UpdateRequest]
+    merge_existing: bool = False
 
 def format_chart_data(series):
     if series is None or series.empty: return []
@@ -207,8 +138,13 @@ def get_period_str(period_option):
     if period_option == "6개월": return "6mo", "1d"
     return "1y", "1d"
 
-@app.get("/api/market-data")
-async def get_market_data(period: str = "1개월"):
+MARKET_PERIODS = ["5일", "1개월", "6개월", "1년"]
+
+def build_market_data(period):
+    """yfinance에서 시세를 받아 /api/market-data 응답 생성 (다운로드 실패 시 예외)"""
+    import yfinance as yf
+    import pandas as pd
+
     p, i = get_period_str(period)
     TICKERS = {
         "indices": {"^KS11": "🇰🇷 코스피", "^DJI": "🇺🇸 다우존스", "^GSPC": "🇺🇸 S&P 500", "^IXIC": "🇺🇸 나스닥"},
@@ -218,10 +154,8 @@ async def get_market_data(period: str = "1개월"):
     }
     all_symbols = [s for cat in TICKERS.values() for s in cat.keys()] + ["CNY=X"]
 
-    try:
+    with metrics.span("fetch.yfinance"):
         data = yf.download(all_symbols, period=p, interval=i, progress=False, group_by='ticker')
-    except Exception as e:
-        return {"error": str(e)}
 
     result = {}
     def process_ticker(symbol, name):
@@ -254,78 +188,295 @@ async def get_market_data(period: str = "1개월"):
     except: pass
     return result
 
-@app.get("/api/dramexchange-data")
-async def get_dramexchange_data():
-    data = load_dram_data()
+# ============================================
+# ✅ 백그라운드 갱신 (크롤러 워크플로우 cron 시각 기준, UTC)
+# ============================================
+EVERY_30_MIN = [(None, 0), (None, 30)]
+
+# 로컬 소스면 파일 mtime을 폴링해 크롤러가 저장하자마자 반영
+def watch_file(filename_fn):
+    if not DATA_SOURCE.watchable:
+        return None
+    def watch():
+        filename = filename_fn()
+        return filename, DATA_SOURCE.version(filename) if filename else None
+    return watch
+
+def trend_data(json_data):
+    with metrics.span("transform"):
+        return build_trend_data(json_data)
+
+scheduler.register("ram-data", lambda: trend_data(load_ram_data(timeseries.compact)),
+                   interval=6 * 3600, cron=[(1, 0), (4, 0), (9, 0)], delay=20 * 60,
+                   watch=watch_file(lambda: "ram_price_junggo.json"))
+scheduler.register("ram-new-data", lambda: trend_data(load_ram_new_data(timeseries.compact)),
+                   interval=3600, cron=EVERY_30_MIN, delay=10 * 60,
+                   watch=watch_file(latest_ram_new_file))
+scheduler.register("compuzone-data", lambda: load_compuzone_data(),
+                   interval=3600, cron=EVERY_30_MIN, delay=10 * 60,
+                   watch=watch_file(lambda: "compuzone_data.json"))
+scheduler.register("dramexchange-data", lambda: load_dram_data(),
+                   interval=6 * 3600, cron=[(16, 3), (19, 43), (23, 13)], delay=15 * 60,
+                   watch=watch_file(lambda: "dram_exchange_data.json"))
+
+# 짧은 기간일수록 봉 간격이 짧아 자주 갱신
+MARKET_INTERVALS = {"5일": 5 * 60, "1개월": 15 * 60, "6개월": 3600, "1년": 3600}
+
+def fetch_market_snapshot(period):
+    # 전 종목 다운로드 실패(빈 결과)로 기존 스냅샷을 덮어쓰지 않도록 None 처리 (스케줄러 갱신 전용)
+    result = build_market_data(period)
+    return result if any(result.values()) else None
+
+# 스냅샷이 없을 때 요청 경로는 build_market_data 그대로 (전부 비어도 {"indices": [], ...} 형태 유지)
+for _period in MARKET_PERIODS:
+    scheduler.register(f"market-data:{_period}", lambda period=_period: fetch_market_snapshot(period),
+                       interval=MARKET_INTERVALS[_period],
+                       load=lambda period=_period: build_market_data(period))
+
+@app.get("/api/market-data")
+async def get_market_data(period: str = "1개월"):
+    # 목록에 없는 기간은 get_period_str과 같이 1년으로 처리
+    if period not in MARKET_PERIODS:
+        period = "1년"
+    try:
+        return await scheduler.get_or_load(f"market-data:{period}")
+    except Exception as e:
+        return {"error": str(e)}
+
+# ============================================
+# ✅ 크롤러 데이터 API (ram / ram-new / compuzone / dramexchange)
+# ============================================
+# 로드 실패 시 응답
+DATASET_DEFAULTS = {
+    "ram-data": {"error": "데이터 로드 실패"},
+    "ram-new-data": {"current": {}, "trends": {}},
+    "compuzone-data": {"products": {}, "price_history": {}, "last_updated": ""},
+    "dramexchange-data": {"current_data": {}, "price_history": {}, "error": "데이터 로드 실패"},
+}
+
+async def get_dataset(name, days=None):
+    data = await scheduler.get_or_load(name)
     if data is None:
-        return {"current_data": {}, "price_history": {}, "error": "데이터 로드 실패"}
-    return data
+        return DATASET_DEFAULTS[name]
+    if not days:
+        return data
+    with metrics.span("transform"):
+        return limit_days(data, days)
+
+# 미리 렌더링한 응답의 원본 파일 (render_snapshots.py의 DATASETS와 같은 파일)
+PRERENDERED_SOURCES = {
+    "ram-data": lambda: "ram_price_junggo.json",
+    "ram-new-data": latest_ram_new_file,
+    "compuzone-data": lambda: "compuzone_data.json",
+    "dramexchange-data": lambda: "dram_exchange_data.json",
+}
+_fingerprints = {}  # 원본 경로 → ((mtime_ns, size), 내용 해시)
+
+def prerendered_is_current(name):
+    """미리 렌더링한 파일이 지금 데이터 소스의 원본에서 만든 것인지
+
+    render_snapshots.py는 저장소 체크아웃(backend/)을 읽으므로 데이터 소스가 같은 디렉토리일 때만,
+    <이름>.source.json에 기록된 원본 파일명/내용 해시가 지금 파일과 같으면 True
+    (DATA_DIR로 다른 디렉토리를 쓰거나 GitHub에서 받는 경우엔 커밋된 파일이 더 오래됐을 수 있음)
+    """
+    if not isinstance(DATA_SOURCE, data_sources.LocalSource):
+        return False
+    if os.path.realpath(DATA_SOURCE.directory) != os.path.realpath(BASE_DIR):
+        return False
+    try:
+        with open(os.path.join(PRERENDERED_DIR, source_filename(name)), "r", encoding="utf-8") as f:
+            source = json.load(f)
+    except (OSError, ValueError):
+        return False
+    filename = PRERENDERED_SOURCES[name]()
+    if not filename or source.get("file") != filename:
+        return False
+    path = os.path.join(BASE_DIR, filename)
+    version = DATA_SOURCE.version(filename)
+    if version is None:
+        return False
+    cached = _fingerprints.get(path)
+    if not cached or cached[0] != version:
+        cached = (version, file_fingerprint(path))
+        _fingerprints[path] = cached
+    return cached[1] == source.get("sha256")
+
+def prerendered_response(request, name, days):
+    """render_snapshots.py가 만든 응답 파일 (스냅샷이 아직 없고 원본과 맞을 때만, 아니면 None)
+
+    스케줄러가 도는 서버는 메모리 스냅샷이 더 최신이므로 그쪽을 씀
+    """
+    if scheduler.get(name) is not None:
+        return None
+    path = os.path.join(PRERENDERED_DIR, snapshot_filename(name, days))
+    if not prerendered_is_current(name):
+        metrics.cache_lookup("prerendered", hit=False)
+        return None
+    if "gzip" in request.headers.get("accept-encoding", "") and os.path.exists(path + ".gz"):
+        metrics.cache_lookup("prerendered", hit=True)
+        return FileResponse(path + ".gz", media_type="application/json",
+                            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    if os.path.exists(path):
+        metrics.cache_lookup("prerendered", hit=True)
+        return FileResponse(path, media_type="application/json")
+    metrics.cache_lookup("prerendered", hit=False)
+    return None
+
+# 전체 이력을 그대로 내보내는 엔드포인트 → 응답을 통째로 만들지 않고 시점 단위로 스트리밍
+STREAMED_DATASETS = {"compuzone-data", "dramexchange-data"}
+NDJSON = "application/x-ndjson"
+
+async def sync_dataset(name, days, since, epoch):
+    """since= 요청 - since 버전 이후 바뀐 시점만 + "sync" 정보 (delta_sync.py)
+
+    추적 중인 스냅샷이 없으면 (스케줄러 꺼짐/첫 로드 전) 전체 + mode=reset, version=0
+    """
+    result = delta_sync.tracker.changes_since(name, since, epoch)
+    if result is None:
+        data = await get_dataset(name, days)
+        return {**data, "sync": {"dataset": name, "epoch": None, "version": 0, "since": since, "mode": "reset"}}
+    info, data = result
+    if days:
+        with metrics.span("transform"):
+            data = limit_days(data, days)
+    return {**data, "sync": info}
+
+async def serve_dataset(request, name, days, since=None, epoch=None):
+    ndjson = name in STREAMED_DATASETS and NDJSON in request.headers.get("accept", "")
+    if since is not None:
+        data = await sync_dataset(name, days, since, epoch)
+    else:
+        if not ndjson:
+            response = prerendered_response(request, name, days)
+            if response is not None:
+                return response
+        data = await get_dataset(name, days)
+    if name in STREAMED_DATASETS:
+        # 동기 제너레이터라 Starlette가 스레드풀에서 돌림 (조각 생성이 이벤트 루프를 막지 않음)
+        return StreamingResponse(iter_ndjson(data) if ndjson else iter_json(data),
+                                 media_type=NDJSON if ndjson else "application/json",
+                                 headers={"Vary": "Accept"})
+    # 파일에서 읽은 JSON 그대로라 jsonable_encoder를 거치지 않고 바로 직렬화
+    return TimedJSONResponse(data)
+
+# since / epoch: 이전 응답의 sync.version / sync.epoch → 그 뒤로 바뀐 시점만 (delta_sync.py)
+@app.get("/api/dramexchange-data")
+async def get_dramexchange_data(request: Request, days: Optional[int] = None,
+                                since: Optional[int] = None, epoch: Optional[str] = None):
+    """Accept: application/x-ndjson 이면 NDJSON (첫 줄: 이력 외 필드, 이후 시점마다 한 줄), 아니면 같은 JSON을 청크로"""
+    return await serve_dataset(request, "dramexchange-data", days, since, epoch)
 
 @app.get("/api/ram-data")
-async def get_ram_data():
-    json_data = load_ram_data()
-    if json_data is None:
-        return {"error": "데이터 로드 실패"}
-    
-    product_history = {}
-    raw_history = json_data.get("price_history", {})
-    sorted_dates = sorted(raw_history.keys())
-
-    for date in sorted_dates:
-        categories = raw_history[date]
-        for cat, items in categories.items():
-            for item in items:
-                p_name = item['product']
-                if p_name not in product_history: 
-                    product_history[p_name] = []
-                product_history[p_name].append({"date": date, "price": item['price']})
+async def get_ram_data(request: Request, days: Optional[int] = None,
+                       since: Optional[int] = None, epoch: Optional[str] = None):
+    return await serve_dataset(request, "ram-data", days, since, epoch)
 
-    return {
-        "current": json_data.get("price_data", {}),
-        "trends": product_history,
-        "total_days": len(sorted_dates),
-        "date_range": f"{sorted_dates[0]} ~ {sorted_dates[-1]}" if sorted_dates else ""
-    }
+@app.get("/api/compuzone-data")
+async def get_compuzone_data(request: Request, days: Optional[int] = None,
+                             since: Optional[int] = None, epoch: Optional[str] = None):
+    """dramexchange-data와 같은 스트리밍 규칙"""
+    return await serve_dataset(request, "compuzone-data", days, since, epoch)
+
+@app.get("/api/ram-new-data")
+async def get_ram_new_data(request: Request, days: Optional[int] = None,
+                           since: Optional[int] = None, epoch: Optional[str] = None):
+    # ram-data와 동일한 형식
+    return await serve_dataset(request, "ram-new-data", days, since, epoch)
 
 # ============================================
-# ✅ 컴퓨존 데이터 API
+# ✅ 대시보드 통합 API (5개 데이터를 한 번에)
 # ============================================
-@app.get("/api/compuzone-data")
-async def get_compuzone_data():
-    data = load_compuzone_data()
-    if data is None:
-        return {"products": {}, "price_history": {}, "last_updated": ""}
-    return data
+DASHBOARD_SECTIONS = {
+    "market": lambda period: get_market_data(period),
+    "ram": lambda period: get_dataset("ram-data"),
+    "dramexchange": lambda period: get_dataset("dramexchange-data"),
+    "ram_new": lambda period: get_dataset("ram-new-data"),
+    "compuzone": lambda period: get_dataset("compuzone-data"),
+}
+
+@app.get("/api/dashboard")
+async def get_dashboard(period: str = "1개월", sections: Optional[str] = None,
+                        fields: Optional[str] = None, limit: Optional[int] = None):
+    """대시보드 전체 데이터
+
+    sections: 쉼표 구분 섹션 목록 (기본: 전체) - market, ram, dramexchange, ram_new, compuzone
+    fields: 쉼표 구분 "섹션.키" 목록 (예: ram.current,compuzone.products) - 지정한 섹션은 해당 키만 반환
+    limit: 이력(trends / price_history / chart)을 최근 N개 시점으로 제한
+    """
+    names = [s.strip() for s in sections.split(",") if s.strip()] if sections else list(DASHBOARD_SECTIONS)
+    unknown = [name for name in names if name not in DASHBOARD_SECTIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 섹션: {', '.join(unknown)}")
+
+    selected = {}
+    for field in (fields.split(",") if fields else []):
+        section, _, key = field.strip().partition(".")
+        if key:
+            selected.setdefault(section, set()).add(key)
+
+    results = await asyncio.gather(*(DASHBOARD_SECTIONS[name](period) for name in names), return_exceptions=True)
+
+    result = {}
+    for name, data in zip(names, results):
+        if isinstance(data, Exception):
+            data = {"error": str(data)}
+        elif name in selected and isinstance(data, dict):
+            data = {key: value for key, value in data.items() if key in selected[name]}
+        if limit is not None and limit > 0:
+            data = limit_history(data, limit)
+        result[name] = data
+    # 모두 JSON에서 온 기본 타입이라 jsonable_encoder 없이 바로 직렬화
+    return TimedJSONResponse(result)
 
 # ============================================
-# ✅ 신품 최저가 데이터 API
+# ✅ 상품별 통계 API (이동평균 / 변동성 / 최저·최고 / 변동률)
 # ============================================
-@app.get("/api/ram-new-data")
-async def get_ram_new_data():
-    json_data = load_ram_new_data()
-    if json_data is None:
-        return {"current": {}, "trends": {}}
-    
-    # ram-data와 동일한 형식으로 변환
-    product_history = {}
-    raw_history = json_data.get("price_history", {})
-    sorted_dates = sorted(raw_history.keys())
-
-    for date in sorted_dates:
-        categories = raw_history[date]
-        for cat, items in categories.items():
-            for item in items:
-                p_name = item['product']
-                if p_name not in product_history:
-                    product_history[p_name] = []
-                product_history[p_name].append({"date": date, "price": item['price']})
+@app.get("/api/analytics")
+async def get_analytics(datasets: Optional[str] = None):
+    """데이터셋별 상품 통계 (analytics.py) - 스냅샷 버전이 바뀔 때만 다시 계산
 
-    return {
-        "current": json_data.get("price_data", {}),
-        "trends": product_history,
-        "total_days": len(sorted_dates),
-        "date_range": f"{sorted_dates[0]} ~ {sorted_dates[-1]}" if sorted_dates else ""
-    }
+    datasets: 쉼표 구분 목록 (기본: 전체) - ram_price, ram_new, compuzone, dram_exchange
+    """
+    names = [s.strip() for s in datasets.split(",") if s.strip()] if datasets else list(analytics.DATASETS)
+    unknown = [name for name in names if name not in analytics.DATASETS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 데이터셋: {', '.join(unknown)}")
+
+    result = {}
+    for name in names:
+        snapshot_name = analytics.DATASETS[name]
+        data = await scheduler.get_or_load(snapshot_name)
+        if data is None:
+            result[name] = {"error": "데이터 로드 실패"}
+            continue
+        try:
+            with metrics.span("transform"):
+                stats, hit = await asyncio.to_thread(analytics.cache.get, name, data)
+        except Exception as e:
+            print(f"❌ [{name}] 통계 계산 실패: {e}")
+            result[name] = {"error": str(e)}
+            continue
+        metrics.cache_lookup("analytics", hit=hit)
+        snapshot = scheduler.get(snapshot_name)
+        result[name] = {"version": snapshot.version if snapshot else None, **stats}
+    return TimedJSONResponse(result)
+
+# ============================================
+# ✅ 실시간 갱신 푸시 (Server-Sent Events)
+# ============================================
+@app.get("/api/events")
+async def get_events():
+    """스냅샷 교체 변경분 스트림 (events.py)
+
+    event: hello - 연결 직후 현재 스냅샷 버전 {"versions": {이름: 버전}}
+    event: snapshot - {"dataset", "version", ["period"], "set" | "history" | "append" | "replace" | "market" | "reset"}
+    """
+    # 백그라운드 갱신이 없는 환경(Vercel)에서는 보낼 이벤트가 없음 → 204면 EventSource가 재연결하지 않음
+    if not snapshots.ENABLED:
+        return Response(status_code=204)
+    hello = {"versions": {name: snap.version for name, snap in scheduler.snapshots.items()}}
+    return StreamingResponse(events.broker.stream(hello), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 @app.post("/api/admin/update")
 async def update_data(req: UpdateRequest):
@@ -339,24 +490,10 @@ async def update_data(req: UpdateRequest):
     if not parsed: 
         return {"status": "error", "message": "파싱 실패 - 인식된 제품이 없습니다"}
     
-    full = load_ram_data() or {"price_data": {}, "price_history": {}}
+    store = PriceStore.from_json(load_ram_data())
     
     history_key = f"{req.date} {req.time}"
-    full["price_history"][history_key] = parsed
-    
-    for category, items in parsed.items():
-        if category not in full["price_data"]:
-            full["price_data"][category] = []
-        
-        existing_products = {item['product']: idx for idx, item in enumerate(full["price_data"][category])}
-        
-        for new_item in items:
-            prod_name = new_item['product']
-            if prod_name in existing_products:
-                idx = existing_products[prod_name]
-                full["price_data"][category][idx] = new_item
-            else:
-                full["price_data"][category].append(new_item)
+    store.apply(history_key, parsed)
     
     total_products = sum(len(v) for v in parsed.values())
     
@@ -364,7 +501,7 @@ async def update_data(req: UpdateRequest):
         "status": "success", 
         "count": total_products,
         "categories": list(parsed.keys()),
-        "total_categories": len(full["price_data"]),
+        "total_categories": len(store.index),
         "message": f"✅ {req.date} 데이터 저장 완료 ({total_products}개 제품)"
     }
 
@@ -380,14 +517,51 @@ async def download():
 
 @app.post("/api/admin/test-parse")
 async def test_parse(req: UpdateRequest):
-    parsed = parse_price_data(req.text)
+    report = ParseReport()
+    parsed = parse_price_data(req.text, report=report)
     
     if not parsed:
-        return {"status": "error", "message": "인식된 제품이 없습니다", "data": {}}
+        return {"status": "error", "message": "인식된 제품이 없습니다", "data": {}, "report": report.to_dict()}
     
     return {
         "status": "success",
         "count": sum(len(v) for v in parsed.values()),
         "categories": list(parsed.keys()),
-        "data": parsed
+        "data": parsed,
+        "report": report.to_dict()
+    }
+
+@app.get("/api/admin/http-stats")
+async def http_stats():
+    """GitHub fetch 연결 재사용 / 재시도 / 캐시 응답 집계"""
+    return http_client.stats()
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Prometheus 텍스트 형식 (METRICS_ENABLED=0 이면 404)"""
+    if not metrics.ENABLED:
+        raise HTTPException(status_code=404, detail="metrics disabled")
+    upstream = {f"seondori_upstream_{key}": value for key, value in http_client.stats().items()
+                if isinstance(value, (int, float))}
+    snapshot_versions = {f'seondori_snapshot_version{{source="{name}"}}': snap.version
+                         for name, snap in scheduler.snapshots.items()}
+    return PlainTextResponse(metrics.render({**upstream, **snapshot_versions}),
+                             media_type="text/plain; version=0.0.4")
+
+@app.post("/api/admin/batch-parse")
+async def batch_parse(req: BatchParseRequest):
+    """과거 글 여러 개를 한 번에 파싱해 가져오기용 price_history / price_data 반환"""
+    posts = [{"date": p.date, "time": p.time, "text": p.text} for p in req.posts]
+    # Vercel(Lambda)에는 프로세스 풀에 필요한 /dev/shm 세마포어가 없음 → 현재 프로세스에서 파싱
+    results = await run_in_threadpool(parse_posts, posts, 1)
+
+    base = (load_ram_data() if req.merge_existing else None) or {"price_data": {}, "price_history": {}}
+    merged, skipped = merge_parsed(results, base)
+
+    return {
+        "status": "success" if len(skipped) < len(posts) else "error",
+        "count": len(posts) - len(skipped),
+        "skipped": skipped,
+        "price_data": merged["price_data"],
+        "price_history": merged["price_history"],
     }
@@ -0,0 +1,176 @@
+"""
+요청 / 구간별 시간 측정 (main.py용)
+- span("이름"): 코드 구간 시간을 현재 요청에 기록 + 구간별 히스토그램에 누적
+- TimingMiddleware: 요청 전체 시간, 응답 크기 → Server-Timing 헤더 + 엔드포인트별 히스토그램
+- render(): Prometheus 텍스트 형식 (/api/metrics)
+- METRICS_ENABLED=0 이면 미들웨어를 붙이지 않고 span()은 아무것도 하지 않는 nullcontext
+"""
+
+import os
+import time
+import threading
+import contextvars
+from contextlib import contextmanager, nullcontext
+
+ENABLED = os.environ.get("METRICS_ENABLED", "1") == "1"
+
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# 현재 요청의 [(구간 이름, 초)] - 미들웨어가 요청마다 새 리스트를 넣음
+# (asyncio.to_thread / run_in_threadpool도 컨텍스트를 복사하므로 스레드에서 기록해도 보임)
+_request_spans = contextvars.ContextVar("request_spans", default=None)
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+
+
+class Histogram:
+    def __init__(self, name, help_text, buckets, label):
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        self.label = label
+        self.series = {}  # 라벨 값 → [버킷별 개수..., 합계, 개수]
+
+    def observe(self, label_value, value):
+        with _lock:
+            series = self.series.get(label_value)
+            if series is None:
+                series = self.series[label_value] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with _lock:
+            items = sorted((k, list(v)) for k, v in self.series.items())
+        for label_value, series in items:
+            label = f'{self.label}="{label_value}"'
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{label},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{label}}} {series[-2]}")
+            lines.append(f"{self.name}_count{{{label}}} {series[-1]}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name, help_text, labels):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.values = {}  # 라벨 값 튜플 → 개수
+
+    def inc(self, *label_values, n=1):
+        with _lock:
+            self.values[label_values] = self.values.get(label_values, 0) + n
+
+    def get(self, *label_values):
+        return self.values.get(label_values, 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with _lock:
+            items = sorted(self.values.items())
+        for label_values, value in items:
+            label = ",".join(f'{k}="{v}"' for k, v in zip(self.labels, label_values))
+            lines.append(f"{self.name}{{{label}}} {value}")
+        return lines
+
+
+REQUEST_SECONDS = Histogram("seondori_request_seconds", "요청 처리 시간 (초)", TIME_BUCKETS, "endpoint")
+RESPONSE_BYTES = Histogram("seondori_response_bytes", "응답 본문 크기 (바이트, 압축 후)", SIZE_BUCKETS, "endpoint")
+PHASE_SECONDS = Histogram("seondori_phase_seconds", "구간별 시간 (초) - fetch/parse/transform/encode 등", TIME_BUCKETS, "phase")
+CACHE_LOOKUPS = Counter("seondori_cache_lookups_total", "캐시 조회 (hit/miss)", ["cache", "result"])
+
+
+@contextmanager
+def _span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        PHASE_SECONDS.observe(name, elapsed)
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((name, elapsed))
+
+def span(name):
+    """with span("fetch.github"): ... - 비활성화 시 비용 없는 nullcontext"""
+    if not ENABLED:
+        return _NULL
+    return _span(name)
+
+def cache_lookup(cache, hit):
+    if ENABLED:
+        CACHE_LOOKUPS.inc(cache, "hit" if hit else "miss")
+
+def server_timing(spans, total):
+    """[(이름, 초)] → Server-Timing 헤더 값 (같은 이름은 합침)"""
+    merged = {}
+    for name, elapsed in spans:
+        merged[name] = merged.get(name, 0.0) + elapsed
+    parts = [f"{name.replace('.', '-')};dur={elapsed * 1000:.1f}" for name, elapsed in merged.items()]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+class TimingMiddleware:
+    """순수 ASGI 미들웨어 (스트리밍 응답도 그대로 통과)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        spans = []
+        token = _request_spans.set(spans)
+        start = time.perf_counter()
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal size
+            if message["type"] == "http.response.start":
+                header = server_timing(spans, time.perf_counter() - start).encode("latin-1")
+                message = {**message, "headers": list(message.get("headers", [])) + [(b"server-timing", header)]}
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_spans.reset(token)
+            # 라우트 템플릿 기준 (매칭 안 된 경로는 하나로 묶어 라벨 폭증 방지)
+            route = scope.get("route")
+            endpoint = getattr(route, "path", None) or "unmatched"
+            REQUEST_SECONDS.observe(endpoint, time.perf_counter() - start)
+            RESPONSE_BYTES.observe(endpoint, size)
+
+
+def render(extra_counters=None):
+    """Prometheus 텍스트. extra_counters: {"이름" 또는 '이름{라벨="값"}': 값} (예: http_client 집계)"""
+    lines = []
+    for metric in (REQUEST_SECONDS, RESPONSE_BYTES, PHASE_SECONDS, CACHE_LOOKUPS):
+        lines += metric.render()
+
+    lines += ["# HELP seondori_cache_hit_ratio 캐시별 적중률", "# TYPE seondori_cache_hit_ratio gauge"]
+    for cache in sorted({cache for cache, _ in CACHE_LOOKUPS.values}):
+        hits, misses = CACHE_LOOKUPS.get(cache, "hit"), CACHE_LOOKUPS.get(cache, "miss")
+        lines.append(f'seondori_cache_hit_ratio{{cache="{cache}"}} {hits / (hits + misses):.4f}')
+
+    typed = set()
+    for name, value in (extra_counters or {}).items():
+        base = name.split("{")[0]
+        if base not in typed:
+            typed.add(base)
+            lines.append(f"# TYPE {base} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
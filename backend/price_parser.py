@@ -0,0 +1,188 @@
+"""
+네이버 카페 RAM 시세 글 파싱 (main.py / 크롤러 공용)
+- 패턴은 모듈 로드 시 한 번만 컴파일
+- 키워드("데스크탑"/"노트북", "삼성" + "원")가 없는 줄은 정규식 없이 건너뜀
+- 카테고리/제품 패턴을 각각 하나의 정규식으로 합쳐 줄마다 한 번씩만 검사
+- 진단 정보는 ParseReport를 넘길 때만 수집 (평소에는 출력 없음)
+"""
+
+import re
+import time
+
+# ============================================
+# 패턴
+# ============================================
+# 데스크탑용 DDR5 / 노트북 DDR4 ... ("\s*용?\s*"가 "\s+" 변형도 포함)
+CATEGORY_RE = re.compile(r'(데스크탑|노트북)\s*용?\s*DDR([345])', re.IGNORECASE)
+
+CATEGORY_NAMES = {
+    ('데스크탑', '5'): 'DDR5 RAM (데스크탑)',
+    ('데스크탑', '4'): 'DDR4 RAM (데스크탑)',
+    ('데스크탑', '3'): 'DDR3 RAM (데스크탑)',
+    ('노트북', '5'): 'DDR5 RAM (노트북)',
+    ('노트북', '4'): 'DDR4 RAM (노트북)',
+    ('노트북', '3'): 'DDR3 RAM (노트북)',
+}
+
+# 한 줄에 카테고리가 여러 개면 기존 패턴 목록 순서(데스크탑 → 노트북, DDR5 → DDR3)를 따름
+CATEGORY_PRIORITY = {key: idx for idx, key in enumerate(CATEGORY_NAMES)}
+
+# 4개 제품 패턴을 "삼성" 접두어 뒤의 대안(alternation)으로 합침
+# 대안마다 (용량, 속도, 가격) 3개 그룹 → lastindex로 어느 대안인지 구분
+PRODUCT_RE = re.compile(
+    r'삼성\s*(?:'
+    r'D5\s*(\d+G)\s*[,\-]?\s*(\d{4,5})\s*(?:\[?\d*\]?)?\s*-\s*([\d,\.]+)\s*원'
+    r'|(\d+G)\s*PC4[\s\-]*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원'
+    r'|(\d+G)\s*-?\s*(\d{5})\s*(?:\[\d+mhz\])?\s*-\s*([\d,\.]+)\s*원'
+    r'|(\d+G)\s*PC3[\s\-]*(\d{5})\s*-?\s*([\d,\.]+)\s*원'
+    r')'
+)
+
+# 대안 순서별 제품명 형식
+PRODUCT_NAME_FORMATS = [
+    "삼성 DDR5 {capacity} {speed}MHz",
+    "삼성 DDR4 {capacity} PC4-{speed}",
+    "삼성 DDR4 {capacity} PC4-{speed}",
+    "삼성 DDR3 {capacity} PC3-{speed}",
+]
+
+# 가격 줄처럼 보이는 줄 (숫자 + 원) - 진단용
+PRICE_LIKE_RE = re.compile(r'\d[\d,\.]*\s*만?\s*원')
+
+# ============================================
+# 진단 리포트
+# ============================================
+class ParseReport:
+    """파싱 진단 정보: 감지한 카테고리, 인식한 줄, 인식 못한 가격 줄, 소요 시간"""
+
+    def __init__(self):
+        self.line_count = 0
+        self.categories = []   # [{"line", "category"}]
+        self.matched = []      # [{"line", "category", "product", "price", "duplicate"}]
+        self.unmatched = []    # [{"line", "category", "text"}] 가격 줄처럼 보이지만 제품 패턴 불일치
+        self.errors = []       # [{"line", "text", "error"}]
+        self.elapsed_ms = 0.0
+
+    def to_dict(self):
+        return {
+            "line_count": self.line_count,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "categories": self.categories,
+            "matched": self.matched,
+            "unmatched": self.unmatched,
+            "errors": self.errors,
+        }
+
+    def render(self):
+        """사람이 읽을 수 있는 텍스트 (디버깅용)"""
+        products = sum(1 for m in self.matched if not m["duplicate"])
+        out = [f"[파싱 리포트] {self.line_count}줄, 카테고리 {len(self.categories)}개, "
+               f"제품 {products}개, 미인식 가격 줄 {len(self.unmatched)}개, {self.elapsed_ms:.1f}ms"]
+        for c in self.categories:
+            out.append(f"  L{c['line']}: [카테고리] {c['category']}")
+        for m in self.matched:
+            mark = " (중복)" if m["duplicate"] else ""
+            out.append(f"  L{m['line']}: [제품] {m['product']} = {m['price']:,}원{mark}")
+        for u in self.unmatched:
+            out.append(f"  L{u['line']}: [미인식] ({u['category'] or '카테고리 없음'}) {u['text']}")
+        for e in self.errors:
+            out.append(f"  L{e['line']}: [오류] {e['text']} - {e['error']}")
+        return "\n".join(out)
+
+# ============================================
+# 파싱
+# ============================================
+def parse_price(price_str):
+    """'210.000' / '210,000' / '1.5' 형식의 가격 문자열 → 원 단위 정수"""
+    price_clean = price_str.replace(',', '')
+    if '.' in price_clean:
+        parts = price_clean.split('.')
+        if len(parts) == 2 and len(parts[1]) == 3:
+            return int(parts[0]) * 1000
+        return int(float(price_clean))
+    return int(price_clean)
+
+def detect_category(line):
+    """줄에서 카테고리 이름을 찾음 (없으면 None)"""
+    if '데스크탑' not in line and '노트북' not in line:
+        return None
+    best = None
+    for match in CATEGORY_RE.finditer(line):
+        key = (match.group(1), match.group(2))
+        if best is None or CATEGORY_PRIORITY[key] < CATEGORY_PRIORITY[best]:
+            best = key
+    return CATEGORY_NAMES[best] if best else None
+
+def match_product(line):
+    """줄에서 (제품명, 가격)을 찾음 (없으면 None). 가격 변환 실패 시 ValueError"""
+    if '삼성' not in line or '원' not in line:
+        return None
+    match = PRODUCT_RE.search(line)
+    if not match:
+        return None
+    alt = (match.lastindex - 1) // 3
+    capacity, speed, price_str = match.group(alt * 3 + 1, alt * 3 + 2, alt * 3 + 3)
+    name = PRODUCT_NAME_FORMATS[alt].format(capacity=capacity, speed=speed)
+    return name, parse_price(price_str)
+
+def parse_price_data(price_text, report=None):
+    """네이버 카페 RAM 시세 글 → {카테고리: [{"product", "price", "price_formatted"}]}
+
+    report(ParseReport)가 주어지면 줄 단위 진단 정보를 채움
+    """
+    start = time.perf_counter() if report is not None else 0
+    prices = {}
+    current_category = None
+    current_items = None
+    notebook = False
+
+    for line_no, line in enumerate(price_text.split('\n'), 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        category = detect_category(line)
+        if category:
+            current_category = category
+            current_items = prices.get(category)
+            notebook = '노트북' in category
+            if report is not None:
+                report.categories.append({"line": line_no, "category": category})
+
+        if current_category is None:
+            if report is not None and PRICE_LIKE_RE.search(line):
+                report.unmatched.append({"line": line_no, "category": None, "text": line})
+            continue
+
+        try:
+            found = match_product(line)
+        except ValueError as e:
+            if report is not None:
+                report.errors.append({"line": line_no, "text": line, "error": str(e)})
+            continue
+        if not found:
+            if report is not None and not category and PRICE_LIKE_RE.search(line):
+                report.unmatched.append({"line": line_no, "category": current_category, "text": line})
+            continue
+
+        product_name, price = found
+        if notebook:
+            product_name += " (노트북)"
+
+        if current_items is None:
+            current_items = prices[current_category] = {}
+        duplicate = product_name in current_items
+        if not duplicate:
+            current_items[product_name] = {
+                "product": product_name,
+                "price": price,
+                "price_formatted": f"{price:,}원"
+            }
+        if report is not None:
+            report.matched.append({"line": line_no, "category": current_category,
+                                   "product": product_name, "price": price, "duplicate": duplicate})
+
+    if report is not None:
+        report.line_count = line_no if price_text else 0
+        report.elapsed_ms = (time.perf_counter() - start) * 1000
+    return {cat: list(items.values()) for cat, items in prices.items()}
@@ -0,0 +1,68 @@
+"""
+시세 데이터 저장 구조 (main.py / 크롤러 공용)
+- price_data를 카테고리 → 제품명 → 항목 인덱스로 유지해 upsert가 O(1)
+- 파일/응답으로 내보낼 때만 기존 리스트 구조({카테고리: [항목, ...]})로 변환
+- 여러 시점을 한 번에 반영하는 apply_many 지원
+"""
+
+import os
+import json
+
+
+class PriceStore:
+    """price_data / price_history 를 담는 인덱스 구조"""
+
+    def __init__(self, price_data=None, price_history=None, extra=None):
+        # 파이썬 dict는 삽입 순서를 유지하므로 기존 항목 교체 시 위치가 그대로 남음
+        self.index = {
+            category: {item["product"]: item for item in items}
+            for category, items in (price_data or {}).items()
+        }
+        self.history = price_history if price_history is not None else {}
+        self.extra = extra or {}
+
+    @classmethod
+    def from_json(cls, full):
+        """{"price_data": {...}, "price_history": {...}, ...} 파일 구조에서 생성"""
+        full = dict(full or {})
+        price_data = full.pop("price_data", {})
+        # 히스토리 dict는 복사 (원본이 캐시된 데이터일 수 있음)
+        price_history = dict(full.pop("price_history", {}))
+        return cls(price_data, price_history, extra=full)
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_json(json.load(f))
+
+    def upsert(self, category, item):
+        products = self.index.get(category)
+        if products is None:
+            products = self.index[category] = {}
+        products[item["product"]] = item
+
+    def apply(self, history_key, parsed):
+        """한 시점의 파싱 결과를 히스토리와 최신 시세에 반영"""
+        self.history[history_key] = parsed
+        for category, items in parsed.items():
+            for item in items:
+                self.upsert(category, item)
+
+    def apply_many(self, updates):
+        """[(history_key, parsed), ...]를 시점 순서대로 반영"""
+        for history_key, parsed in sorted(updates, key=lambda u: u[0]):
+            self.apply(history_key, parsed)
+
+    def price_data(self):
+        return {category: list(products.values()) for category, products in self.index.items()}
+
+    def to_json(self):
+        full = {"price_data": self.price_data(), "price_history": self.history}
+        full.update(self.extra)
+        return full
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
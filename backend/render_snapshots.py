@@ -0,0 +1,127 @@
+"""
+API 응답 미리 렌더링 (크롤러 실행 후 워크플로우에서 실행)
+- 크롤러가 저장한 JSON으로 /api/ram-data, /api/ram-new-data, /api/compuzone-data,
+  /api/dramexchange-data 응답을 계산해 frontend/public/api-snapshots/ 에 저장
+- 전체 + days=7/30/90 변형, 각각 .json 과 미리 압축한 .json.gz
+  + 읽은 원본 파일명/내용 해시 (<이름>.source.json - main.py가 원본과 맞는지 확인)
+- vercel.json 라우트가 파라미터 없는 요청(또는 days만)을 이 파일로 바로 내려줌 (데이터셋 엔드포인트를 직접 부르는 클라이언트용)
+  since / epoch 증분 요청, NDJSON 요청, 나머지 days 값은 main.py가 계산
+  프론트엔드 화면은 /api/dashboard(실시간 시세 포함, 미리 렌더링하지 않음)로 받으므로 이 파일과 무관
+- 데이터를 커밋하는 워크플로우는 모두 렌더링 후 같이 커밋하고,
+  api-snapshots-check.yml이 --check로 원본과 어긋난 채 커밋된 경우(수동 수정 등)를 잡아냄
+- FastAPI 없이 실행 가능 (views.py만 사용)
+
+사용법: cd backend && python render_snapshots.py [ram-data ram-new-data compuzone-data dramexchange-data]
+        python render_snapshots.py --check [데이터셋...]   (원본과 어긋나면 종료 코드 1)
+"""
+
+import os
+import sys
+import glob
+import gzip
+import json
+
+from views import (BASE_DIR, PRERENDERED_DIR, RENDER_DAYS, build_trend_data, file_fingerprint, limit_days,
+                   render_json, snapshot_filename, source_filename)
+
+def read_json(filename):
+    path = os.path.join(BASE_DIR, filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def latest_ram_new():
+    files = sorted(glob.glob(os.path.join(BASE_DIR, "ram_new_*.json")))
+    return os.path.basename(files[-1]) if files else None
+
+# 엔드포인트 이름 → (원본 파일명, 응답 계산) (main.py의 스냅샷 소스와 같은 변환)
+DATASETS = {
+    "ram-data": (lambda: "ram_price_junggo.json", build_trend_data),
+    "ram-new-data": (latest_ram_new, build_trend_data),
+    "compuzone-data": (lambda: "compuzone_data.json", None),
+    "dramexchange-data": (lambda: "dram_exchange_data.json", None),
+}
+
+def write_atomic(path, body):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)
+
+def render(name):
+    """한 데이터셋의 전체/기간별 응답 파일 생성. 반환: 생성한 파일 목록"""
+    filename_fn, transform = DATASETS[name]
+    filename = filename_fn()
+    data = read_json(filename) if filename else None
+    if data is not None and transform:
+        data = transform(data)
+    if data is None:
+        print(f"⚠️ [{name}] 원본 데이터 없음 - 건너뜀")
+        return []
+
+    written = []
+    for days in [None] + RENDER_DAYS:
+        body = render_json(limit_days(data, days))
+        path = os.path.join(PRERENDERED_DIR, snapshot_filename(name, days))
+        write_atomic(path, body)
+        # mtime=0: 내용이 같으면 .gz 바이트도 같게 (불필요한 커밋 방지)
+        write_atomic(path + ".gz", gzip.compress(body, compresslevel=9, mtime=0))
+        written.append(path)
+        print(f"  📄 {os.path.basename(path)}: {len(body):,} bytes "
+              f"(gzip {os.path.getsize(path + '.gz'):,} bytes)")
+
+    # main.py가 원본과 같은 내용에서 렌더링한 파일인지 확인하는 데 씀
+    source = {"file": filename, "sha256": file_fingerprint(os.path.join(BASE_DIR, filename))}
+    write_atomic(os.path.join(PRERENDERED_DIR, source_filename(name)),
+                 json.dumps(source, ensure_ascii=False).encode("utf-8"))
+    return written
+
+def check(name):
+    """커밋된 응답 파일이 지금 원본에서 만든 것인지. 맞으면 None, 아니면 이유"""
+    filename = DATASETS[name][0]()
+    if not filename or not os.path.exists(os.path.join(BASE_DIR, filename)):
+        return None  # 원본이 없으면 render()도 건너뜀
+    try:
+        with open(os.path.join(PRERENDERED_DIR, source_filename(name)), "r", encoding="utf-8") as f:
+            source = json.load(f)
+    except (OSError, ValueError):
+        return f"{source_filename(name)} 없음"
+    if source.get("file") != filename:
+        return f"원본 파일이 다름 ({source.get('file')} → {filename})"
+    if source.get("sha256") != file_fingerprint(os.path.join(BASE_DIR, filename)):
+        return f"{filename} 내용이 렌더링 이후 바뀜"
+    missing = [snapshot_filename(name, days) for days in [None] + RENDER_DAYS
+               if not os.path.exists(os.path.join(PRERENDERED_DIR, snapshot_filename(name, days)))]
+    if missing:
+        return f"응답 파일 없음: {', '.join(missing)}"
+    return None
+
+def main():
+    args = sys.argv[1:]
+    check_only = "--check" in args
+    names = [arg for arg in args if arg != "--check"] or list(DATASETS)
+    unknown = [name for name in names if name not in DATASETS]
+    if unknown:
+        print(f"❌ 알 수 없는 데이터셋: {', '.join(unknown)} (가능: {', '.join(DATASETS)})")
+        return False
+
+    if check_only:
+        stale = {name: reason for name in names if (reason := check(name))}
+        for name, reason in stale.items():
+            print(f"❌ [{name}] 미리 렌더링한 응답이 오래됨: {reason}")
+        if stale:
+            print(f"   → cd backend && python render_snapshots.py {' '.join(stale)} 후 커밋")
+            return False
+        print(f"✅ 미리 렌더링한 응답이 원본과 일치: {', '.join(names)}")
+        return True
+
+    os.makedirs(PRERENDERED_DIR, exist_ok=True)
+    for name in names:
+        print(f"🧱 [{name}] 렌더링")
+        render(name)
+    print(f"✅ 저장 위치: {os.path.normpath(PRERENDERED_DIR)}")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,180 @@
+"""
+uvicorn 워커 간 스냅샷 공유 (snapshots.Scheduler용)
+- SHARED_SNAPSHOT_DIR가 있으면 켜짐 (예: SHARED_SNAPSHOT_DIR=/dev/shm/seondori uvicorn main:app --workers 4)
+  tmpfs(/dev/shm)에 두면 파일 페이지 자체가 공유 메모리
+- 리더 선출: DIR/leader.lock에 flock(LOCK_EX | LOCK_NB) - 잡은 워커 하나만 소스를 가져옴 (업스트림 I/O 1회)
+  리더 프로세스가 죽으면 커널이 잠금을 풀고, 다른 워커가 다음 확인 때 이어받음
+- 스냅샷 파일: DIR/<이름>.snap 을 고유한 tmp(mkstemp)에 쓰고 os.replace로 교체 → 읽는 쪽은 항상 완성된 파일만 봄
+  - 헤더(매직, 형식 버전, 스냅샷 버전, loaded_at, 메타 길이) + 메타 JSON(epoch 포함) + 8바이트 정렬된 배열 영역
+  - CompactHistory 배열은 mmap을 cast한 memoryview로 그대로 씀 (워커마다 복사 X)
+  - 나머지(현재 시세, trends, 시장 데이터 등)는 메타 JSON으로 워커마다 파싱
+- 교체 감지는 (inode, mtime, 크기) 비교. 이전 파일의 mmap은 참조하던 스냅샷이 GC되면 해제
+  (교체된 파일은 디렉토리에서 빠져도 매핑은 유효)
+"""
+
+import os
+import json
+import mmap
+import fcntl
+import struct
+import tempfile
+
+from timeseries import CompactHistory
+
+# SHARED_SNAPSHOT_DIR 미설정이면 워커마다 따로 로드 (기존 동작)
+SHARED_DIR = os.environ.get("SHARED_SNAPSHOT_DIR")
+
+MAGIC = b"SDRSNAP\0"
+FORMAT_VERSION = 2
+# 매직, 형식 버전, (예약), 스냅샷 버전, loaded_at, 메타 JSON 길이
+HEADER = struct.Struct("<8sIIQdQ")
+ALIGN = 8
+SUFFIX = ".snap"
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+def _filename(name):
+    # market-data:1개월 같은 이름도 그대로 파일명으로 (':'만 치환)
+    return name.replace(":", "~") + SUFFIX
+
+def _split(data, path, found):
+    """data 안의 CompactHistory를 (경로, 이력)으로 꺼내고 그 자리를 None으로 둔 사본 (dict 값만 따라감)"""
+    if isinstance(data, CompactHistory):
+        found.append((path, data))
+        return None
+    if isinstance(data, dict):
+        return {key: _split(value, path + [key], found) for key, value in data.items()}
+    return data
+
+
+# ============================================
+# 직렬화
+# ============================================
+def pack(version, loaded_at, data, epoch):
+    """스냅샷 → 파일에 순서대로 쓸 조각 목록 (배열은 복사 없이 memoryview)"""
+    found = []
+    plain = _split(data, [], found)
+
+    histories = []
+    buffers = []
+    offset = 0
+    for path, history in found:
+        meta, arrays = history.export()
+        meta["path"] = path
+        meta["arrays"] = []
+        for arr in arrays:
+            view = memoryview(arr)
+            meta["arrays"].append([offset, view.format, len(view)])
+            buffers.append((offset, view))
+            offset = _aligned(offset + view.nbytes)
+        histories.append(meta)
+
+    meta = json.dumps({"data": plain, "histories": histories, "epoch": epoch},
+                      ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    base = _aligned(HEADER.size + len(meta))
+    chunks = [HEADER.pack(MAGIC, FORMAT_VERSION, 0, version, loaded_at, len(meta)), meta,
+              b"\0" * (base - HEADER.size - len(meta))]
+    position = 0
+    for start, view in buffers:
+        chunks += [b"\0" * (start - position), view]
+        position = start + view.nbytes
+    return chunks
+
+def unpack(buffer):
+    """pack()한 파일 내용(mmap) → (버전, loaded_at, data, epoch). 형식이 다르면 ValueError"""
+    magic, fmt, _, version, loaded_at, meta_len = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or fmt != FORMAT_VERSION:
+        raise ValueError("스냅샷 파일 형식 아님")
+    meta = json.loads(bytes(buffer[HEADER.size:HEADER.size + meta_len]))
+    base = _aligned(HEADER.size + meta_len)
+    view = memoryview(buffer)
+
+    data = meta["data"]
+    for history in meta["histories"]:
+        arrays = [view[base + offset:base + offset + length * struct.calcsize(code)].cast(code)
+                  for offset, code, length in history["arrays"]]
+        value = CompactHistory.attach(history, arrays)
+        path = history["path"]
+        if not path:
+            data = value
+            continue
+        target = data
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = value
+    return version, loaded_at, data, meta["epoch"]
+
+
+# ============================================
+# 디렉토리 (리더 잠금 + 스냅샷 파일)
+# ============================================
+class SharedSnapshots:
+    def __init__(self, directory):
+        self.directory = directory
+        self.is_leader = False
+        self._lock_file = None
+        self._stamps = {}   # 이름 → 마지막으로 붙인 파일의 (inode, mtime, 크기)
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name):
+        return os.path.join(self.directory, _filename(name))
+
+    def try_lead(self):
+        """리더 잠금 시도 (이미 리더면 True)"""
+        if self.is_leader:
+            return True
+        lock_file = open(os.path.join(self.directory, "leader.lock"), "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._lock_file = lock_file
+        self.is_leader = True
+        return True
+
+    def release(self):
+        if self._lock_file:
+            self._lock_file.close()  # flock은 파일을 닫으면 풀림
+        self._lock_file = None
+        self.is_leader = False
+
+    def write(self, name, version, loaded_at, data, epoch):
+        path = self._path(name)
+        # 같은 디렉토리에 고유한 tmp (같은 프로세스의 동시 쓰기도 서로 덮어쓰지 않음)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in pack(version, loaded_at, data, epoch):
+                    f.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def attach(self, name):
+        """파일이 마지막으로 붙인 뒤 바뀌었으면 (버전, loaded_at, data, epoch), 아니면 None"""
+        path = self._path(name)
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+                if self._stamps.get(name) == stamp or st.st_size < HEADER.size:
+                    return None
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        result = unpack(buffer)
+        self._stamps[name] = stamp
+        return result
+
+
+def from_env():
+    """SHARED_SNAPSHOT_DIR가 있으면 SharedSnapshots, 없으면 None"""
+    return SharedSnapshots(SHARED_DIR) if SHARED_DIR else None
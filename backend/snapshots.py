@@ -0,0 +1,217 @@
+"""
+데이터 스냅샷 + 백그라운드 갱신 스케줄러 (main.py용)
+- 데이터 소스마다 크롤러 워크플로우(cron) 시각에 맞춰 미리 가져와 응답 형태로 변환까지 해둠
+- 스냅샷은 만든 뒤 수정하지 않고 새 스냅샷으로 통째로 교체 (dict 항목 대입은 원자적)
+- 요청 핸들러는 잠금 없이 현재 스냅샷을 읽기만 함
+- 로컬 파일 소스는 변경 여부(watch)를 짧은 주기로 폴링해 바뀌는 즉시 갱신
+- Vercel 같은 서버리스에서는 요청 사이에 백그라운드 작업이 돌지 않으므로 끄고,
+  스냅샷이 없으면 핸들러가 그때그때 직접 로드 (기존 동작)
+- SHARED_SNAPSHOT_DIR가 있으면 워커 중 리더 하나만 가져오고 나머지는 파일을 mmap으로 붙임
+  (shared_snapshot.py - 버전은 리더가 매긴 값을 모든 워커가 그대로 씀)
+- 스냅샷이 교체될 때마다 listeners(이전 스냅샷, 새 스냅샷)를 호출 (events.py 푸시용, 갱신 스레드에서 호출됨)
+- 갱신/공유 파일 연결은 소스별 잠금으로 직렬화 (주기 갱신과 watch가 같은 소스를 동시에 갱신하지 않도록)
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import threading
+import metrics
+import shared_snapshot
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+# SCHEDULER_ENABLED=0/1 로 강제 (기본: Vercel이면 끔)
+ENABLED = os.environ.get("SCHEDULER_ENABLED", "0" if os.environ.get("VERCEL") else "1") == "1"
+
+# 로드 실패 시 다음 시도까지 대기 (초)
+RETRY_DELAY = 60
+
+# watch가 있는 소스의 변경 확인 주기 (초)
+WATCH_INTERVAL = float(os.environ.get("SCHEDULER_WATCH_INTERVAL", "2"))
+
+# version: 소스별로 1부터 증가, loaded_at: epoch 초
+# epoch: 버전 번호 계열 id (새로 1부터 셀 때 새로 만듦 - 재시작 전후 버전을 구분, delta_sync.py)
+Snapshot = namedtuple("Snapshot", ["name", "version", "loaded_at", "data", "epoch"])
+
+
+class Source:
+    """갱신 주기 정보를 가진 데이터 소스
+
+    fetch: 인자 없이 응답 데이터를 반환하는 함수 (실패 시 None 또는 예외)
+    interval: cron 시각과 상관없이 최소 이 주기(초)로 다시 가져옴
+    cron: [(시 또는 None(매시), 분), ...] UTC - 크롤러 워크플로우 실행 시각
+    delay: cron 시각 이후 크롤링 + 커밋이 끝나길 기다리는 시간 (초)
+    watch: 원본 버전(예: 파일 mtime)을 반환하는 함수 - 값이 바뀌면 바로 갱신 (선택)
+    load: 스냅샷이 없을 때 요청 핸들러가 직접 부르는 함수 (기본: fetch)
+          fetch가 "기존 스냅샷을 덮어쓰지 않도록" None을 돌려주는 경우에도 응답은 있어야 할 때 따로 지정
+    """
+
+    def __init__(self, name, fetch, interval, cron=(), delay=0, watch=None, load=None):
+        self.name = name
+        self.fetch = fetch
+        self.load = load or fetch
+        self.interval = interval
+        self.cron = cron
+        self.delay = delay
+        self.watch = watch
+        # refresh / attach 직렬화 (publish 안에서 attach를 다시 부르므로 RLock)
+        self.lock = threading.RLock()
+
+    def next_run(self, now):
+        """now(UTC) 이후 다음 갱신 시각"""
+        best = now + timedelta(seconds=self.interval)
+        for hour, minute in self.cron:
+            step = timedelta(hours=1) if hour is None else timedelta(days=1)
+            t = now.replace(minute=minute, second=0, microsecond=0)
+            if hour is not None:
+                t = t.replace(hour=hour)
+            t += timedelta(seconds=self.delay)
+            while t <= now:
+                t += step
+            while t - step > now:
+                t -= step
+            best = min(best, t)
+        return best
+
+
+class Scheduler:
+    def __init__(self, shared=None):
+        self.sources = {}
+        self.snapshots = {}
+        self.shared = shared
+        self.listeners = []
+        self._tasks = []
+
+    def register(self, name, fetch, interval, cron=(), delay=0, watch=None, load=None):
+        self.sources[name] = Source(name, fetch, interval, cron, delay, watch, load)
+
+    def get(self, name):
+        """현재 스냅샷 (없으면 None)"""
+        return self.snapshots.get(name)
+
+    def publish(self, name, data):
+        prev = self.snapshots.get(name)
+        snapshot = Snapshot(name, prev.version + 1 if prev else 1, time.time(), data,
+                            prev.epoch if prev else uuid.uuid4().hex[:12])
+        if self.shared and self.shared.is_leader:
+            # 파일로 내보낸 뒤 리더도 그 파일을 붙여 씀 → 이력 배열은 모든 워커가 한 벌을 공유
+            self.shared.write(name, snapshot.version, snapshot.loaded_at, data, snapshot.epoch)
+            attached = self.attach(name)
+            if attached:
+                return attached
+        return self._swap(snapshot)
+
+    def _swap(self, snapshot):
+        prev = self.snapshots.get(snapshot.name)
+        self.snapshots[snapshot.name] = snapshot
+        for listener in self.listeners:
+            try:
+                listener(prev, snapshot)
+            except Exception as e:
+                print(f"❌ [{snapshot.name}] 리스너 실패: {e}")
+        return snapshot
+
+    def attach(self, name):
+        """공유 스냅샷 파일이 바뀌었으면 붙여서 교체 (없거나 그대로면 None)"""
+        with self.sources[name].lock:
+            try:
+                attached = self.shared.attach(name)
+            except Exception as e:
+                print(f"❌ [{name}] 공유 스냅샷 연결 실패: {e}")
+                return None
+            if attached is None:
+                return None
+            return self._swap(Snapshot(name, *attached))
+
+    def refresh(self, name):
+        """소스를 다시 가져와 스냅샷 교체. 실패하면 이전 스냅샷 유지하고 None 반환"""
+        source = self.sources[name]
+        with source.lock:
+            start = time.perf_counter()
+            try:
+                data = source.fetch()
+            except Exception as e:
+                print(f"❌ [{name}] 갱신 실패: {e}")
+                return None
+            if data is None:
+                print(f"❌ [{name}] 갱신 실패: 데이터 없음")
+                return None
+            snapshot = self.publish(name, data)
+        print(f"🔄 [{name}] v{snapshot.version} 갱신 ({(time.perf_counter() - start) * 1000:.0f}ms)")
+        return snapshot
+
+    async def get_or_load(self, name):
+        """스냅샷 데이터, 아직 없으면 (스케줄러 꺼짐/첫 로드 전) 직접 로드"""
+        snapshot = self.snapshots.get(name)
+        if snapshot is None and self.shared:
+            snapshot = await asyncio.to_thread(self.attach, name)
+        metrics.cache_lookup("snapshot", hit=snapshot is not None)
+        if snapshot is not None:
+            return snapshot.data
+        return await asyncio.to_thread(self.sources[name].load)
+
+    async def _run(self, source):
+        while True:
+            ok = await asyncio.to_thread(self.refresh, source.name)
+            now = datetime.now(timezone.utc)
+            wait = (source.next_run(now) - now).total_seconds() if ok else RETRY_DELAY
+            await asyncio.sleep(wait)
+
+    async def _watch(self, source):
+        try:
+            last = await asyncio.to_thread(source.watch)
+        except Exception:
+            last = None
+        while True:
+            await asyncio.sleep(WATCH_INTERVAL)
+            try:
+                current = await asyncio.to_thread(source.watch)
+            except Exception as e:
+                print(f"❌ [{source.name}] 변경 확인 실패: {e}")
+                continue
+            if current != last:
+                last = current
+                await asyncio.to_thread(self.refresh, source.name)
+
+    async def _follow(self):
+        """팔로워: 리더가 교체한 파일을 붙이고, 리더가 없어지면 이어받음"""
+        while True:
+            await asyncio.sleep(WATCH_INTERVAL)
+            for name in self.sources:
+                snapshot = await asyncio.to_thread(self.attach, name)
+                if snapshot:
+                    print(f"📎 [{name}] v{snapshot.version} 공유 스냅샷 연결")
+            if self.shared.try_lead():
+                print(f"👑 리더 이어받음 (pid {os.getpid()})")
+                self._start_sources()
+                return
+
+    def _start_sources(self):
+        self._tasks += [asyncio.create_task(self._run(source)) for source in self.sources.values()]
+        self._tasks += [asyncio.create_task(self._watch(source))
+                        for source in self.sources.values() if source.watch]
+
+    def start(self):
+        if not ENABLED or self._tasks:
+            return
+        if self.shared:
+            # 이전 리더가 남긴 파일부터 붙여 바로 응답 (버전도 이어서 증가)
+            for name in self.sources:
+                self.attach(name)
+            if not self.shared.try_lead():
+                print(f"⏰ 스케줄러 시작 (팔로워, pid {os.getpid()}): {self.shared.directory}")
+                self._tasks = [asyncio.create_task(self._follow())]
+                return
+            print(f"👑 리더 (pid {os.getpid()}): {self.shared.directory}")
+        print(f"⏰ 스케줄러 시작: {', '.join(self.sources)}")
+        self._start_sources()
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.shared:
+            self.shared.release()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# backend/ 모듈은 최상위 import (main.py와 같은 방식)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
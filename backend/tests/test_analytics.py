@@ -0,0 +1,40 @@
+import copy
+
+import analytics
+
+
+def trend_data():
+    return {"trends": {
+        "삼성 DDR5 16GB": [{"date": f"2026-08-{day:02d} 10:00", "price": 50000 + day * 100} for day in range(1, 21)],
+        "삼성 DDR4 8GB": [{"date": f"2026-08-{day:02d} 10:00", "price": 20000 - day * 50} for day in range(1, 21)],
+    }}
+
+
+def test_equal_content_hits_cache(monkeypatch):
+    calls = []
+    compute = analytics.compute
+    monkeypatch.setattr(analytics, "compute", lambda rows: calls.append(1) or compute(rows))
+    cache = analytics.AnalyticsCache()
+
+    first = trend_data()
+    second = copy.deepcopy(first)
+    assert first is not second
+
+    result, hit = cache.get("ram_price", first)
+    assert not hit
+    again, hit = cache.get("ram_price", second)
+    assert hit
+    assert again is result
+    assert len(calls) == 1
+
+
+def test_changed_content_recomputes():
+    cache = analytics.AnalyticsCache()
+    data = trend_data()
+    cache.get("ram_price", data)
+
+    changed = copy.deepcopy(data)
+    changed["trends"]["삼성 DDR5 16GB"][-1]["price"] = 99000
+    result, hit = cache.get("ram_price", changed)
+    assert not hit
+    assert result["products"]["삼성 DDR5 16GB"]["last"] == 99000
@@ -0,0 +1,21 @@
+import json
+
+import data_sources
+
+
+def compact(data):
+    return {"compact": data}
+
+
+def test_raw_and_converted_loads_do_not_evict_each_other(tmp_path, monkeypatch):
+    (tmp_path / "prices.json").write_text(json.dumps({"v": 1}))
+    source = data_sources.LocalSource(str(tmp_path))
+
+    raw = source.load("prices.json")
+    converted = source.load("prices.json", compact)
+
+    reads = []
+    monkeypatch.setattr(data_sources.json, "loads", lambda raw: reads.append(raw))
+    assert source.load("prices.json") is raw
+    assert source.load("prices.json", compact) is converted
+    assert reads == []
@@ -0,0 +1,62 @@
+import http.client
+
+import pytest
+
+import http_client
+
+URL = "https://raw.githubusercontent.com/seondori/Seondori.com/main/backend/x.json"
+
+
+def headers(**values):
+    message = http.client.HTTPMessage()
+    for key, value in values.items():
+        message[key.replace("_", "-")] = value
+    return message
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(http_client.time, "sleep", lambda seconds: None)
+    return http_client.HttpClient()
+
+
+def respond(monkeypatch, client, responses):
+    calls = []
+
+    def request_once(host, path):
+        calls.append(path)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    monkeypatch.setattr(client, "_request_once", request_once)
+    return calls
+
+
+def test_rate_limited_403_serves_cached_response(monkeypatch, client):
+    respond(monkeypatch, client, [(200, headers(), b'{"v": 1}')])
+    assert client.get_json(URL) == {"v": 1}
+
+    calls = respond(monkeypatch, client, [(403, headers(X_RateLimit_Remaining="0"), b"{}")])
+    assert client.get_json(URL) == {"v": 1}
+    assert len(calls) == 1
+    assert client.counters["served_from_cache"] == 1
+
+
+def test_plain_403_still_raises(monkeypatch, client):
+    respond(monkeypatch, client, [(200, headers(), b'{"v": 1}')])
+    client.get_json(URL)
+    respond(monkeypatch, client, [(403, headers(X_RateLimit_Remaining="42"), b"{}")])
+    with pytest.raises(http_client.FetchError):
+        client.get_json(URL)
+
+
+def test_truncated_body_is_retried(monkeypatch, client):
+    calls = respond(monkeypatch, client, [(200, headers(), b'{"v": '), (200, headers(), b'{"v": 2}')])
+    assert client.get_json(URL) == {"v": 2}
+    assert len(calls) == 2
+
+
+def test_truncated_body_falls_back_to_cache(monkeypatch, client):
+    respond(monkeypatch, client, [(200, headers(), b'{"v": 1}')])
+    client.get_json(URL)
+    respond(monkeypatch, client, [(200, headers(), b'{"v": ')])
+    assert client.get_json(URL) == {"v": 1}
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def empty_download(monkeypatch):
+    # 전 종목 다운로드 실패 (yfinance는 빈 데이터프레임을 돌려줌)
+    import yfinance
+    monkeypatch.setattr(yfinance, "download", lambda *args, **kwargs: pd.DataFrame())
+    for name in list(main.scheduler.snapshots):
+        if name.startswith("market-data:"):
+            monkeypatch.delitem(main.scheduler.snapshots, name)
+
+
+def test_all_tickers_empty_keeps_response_shape(empty_download):
+    client = TestClient(main.app)
+    res = client.get("/api/market-data", params={"period": "1개월"})
+    assert res.status_code == 200
+    assert res.json() == {"indices": [], "macro": [], "forex": [], "bonds": []}
+
+
+def test_all_tickers_empty_dashboard_market_section(empty_download):
+    client = TestClient(main.app)
+    res = client.get("/api/dashboard", params={"sections": "market"})
+    assert res.json()["market"] == {"indices": [], "macro": [], "forex": [], "bonds": []}
+
+
+def test_all_tickers_empty_does_not_replace_snapshot(empty_download):
+    assert main.fetch_market_snapshot("1개월") is None
+    assert main.scheduler.refresh("market-data:1개월") is None
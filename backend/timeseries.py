@@ -0,0 +1,378 @@
+"""
+price_history 압축 표현 (main.py / views.py용)
+- 파싱한 price_history({시점: {카테고리: [항목 dict]}})는 항목마다 dict + 같은 키 문자열/상품명 사본이라
+  원본 JSON의 10배 이상 메모리를 씀 → 서버가 들고 있는 동안은 배열 기반으로 변환해 둠
+  - 시점: int64 epoch (array 'q') + 키 형식 코드 → 원래 키 문자열 그대로 복원
+  - 카테고리/상품명/문자열 값: 값 테이블에 한 번만 저장하고 int32 id로 참조
+  - 숫자 필드: int32 / float32 열 (float32로 원래 값이 정확히 복원되지 않는 열만 float64)
+  - 항목별 키 순서/타입(int, float)은 shape(필드 목록) id로 보존
+- encode()는 FastAPI JSONResponse가 원본 dict를 직렬화한 것과 같은 바이트를 dict 없이 바로 만듦
+- 변환할 수 없는 형태면 compact()가 원본을 그대로 돌려줌
+- COMPACT_HISTORY=0 이면 변환하지 않음 (이전 동작, 메모리 비교용)
+- export() / attach()로 배열을 파일(mmap)에 두고 여러 워커가 공유 (shared_snapshot.py)
+"""
+
+import os
+import sys
+import json
+import time
+import calendar
+from array import array
+
+ENABLED = os.environ.get("COMPACT_HISTORY", "1") == "1"
+
+# 시점 키 형식 (코드 = 인덱스). 어느 형식으로도 정확히 복원되지 않는 키는 문자열로 따로 보관
+KEY_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d")
+RAW_KEY = -1
+
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+# 공유 메모리로 내보내는 고정 배열 (열 배열은 _columns 순서대로 뒤에 붙음)
+ARRAY_FIELDS = ("_epochs", "_key_codes", "_entry_start", "_group_cat", "_group_start", "_row_shape")
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+def _parse_key(key):
+    """(epoch, 형식 코드) - 복원했을 때 원래 문자열과 같은 형식만 인정"""
+    for code, fmt in enumerate(KEY_FORMATS):
+        try:
+            epoch = calendar.timegm(time.strptime(key, fmt))
+        except ValueError:
+            continue
+        if time.strftime(fmt, time.gmtime(epoch)) == key:
+            return epoch, code
+    return 0, RAW_KEY
+
+def _f32_restore(stored):
+    # float32에 저장된 값 → 원래 float (유효숫자 7자리 이내 값만 float32 열에 들어감)
+    return float(f"{stored:.7g}")
+
+def _numeric_column(values):
+    """숫자 값 목록 → (typecode, array). 정확히 복원할 수 없으면 None"""
+    if all(isinstance(v, int) for v in values):
+        code = "i" if all(INT32_MIN <= v <= INT32_MAX for v in values) else "q"
+        try:
+            return code, array(code, values)
+        except OverflowError:
+            return None
+    column = array("f", values)
+    restored = {stored: _f32_restore(stored) for stored in set(column)}
+    if all(restored[s] == v for s, v in zip(column, values)):
+        return "f", column
+    column = array("d", values)
+    if all(s == v for s, v in zip(column, values)):
+        return "d", column
+    return None
+
+
+class CompactHistory:
+    """{시점: {카테고리: [항목 dict]}} 의 배열 기반 표현 (읽기 전용)
+
+    since / last 는 배열을 공유하는 부분 보기(view)를 반환
+    """
+
+    def __init__(self):
+        self._epochs = array("q")
+        self._key_codes = array("b")
+        self._raw_keys = {}          # 시점 인덱스 → 키 문자열 (RAW_KEY)
+        self._entry_start = array("i", [0])   # 시점 → 그룹 범위
+        self._group_cat = array("i")          # 그룹 → 카테고리 값 id
+        self._group_start = array("i", [0])   # 그룹 → 항목 범위
+        self._row_shape = array("i")          # 항목 → shape id
+        self._shapes = []            # [((필드, 정수 여부), ...)]
+        self._columns = {}           # 필드 → (typecode, array). typecode "o" = 값 테이블 id
+        self._values = []            # 값 테이블 (카테고리, 문자열 등)
+        self._encoded = None         # 값 테이블 JSON 인코딩 (처음 encode 때 생성)
+        self._index = None           # 보기에 포함된 시점 인덱스 (None = 전체, 저장 순서)
+
+    # ----- 생성 -----
+    @classmethod
+    def from_dict(cls, history):
+        """price_history dict → CompactHistory. 형태가 다르면 ValueError"""
+        self = cls()
+        value_ids = {}
+        shape_ids = {}   # (필드 목록, 타입 목록) → shape id
+        items = []
+
+        def intern(value):
+            try:
+                # 0.0 == -0.0 이라 부호를 키에 포함 (JSON에서는 "-0.0"으로 구분됨)
+                key = (type(value), value, repr(value)) if value == 0 and type(value) is float else (type(value), value)
+                hash(key)
+            except TypeError:
+                key = _dumps(value)
+            if key not in value_ids:
+                value_ids[key] = len(self._values)
+                self._values.append(value)
+            return value_ids[key]
+
+        for n, (key, entry) in enumerate(history.items()):
+            if not isinstance(key, str) or not isinstance(entry, dict):
+                raise ValueError("price_history 형식 아님")
+            epoch, code = _parse_key(key)
+            self._epochs.append(epoch)
+            self._key_codes.append(code)
+            if code == RAW_KEY:
+                self._raw_keys[n] = key
+
+            for cat, cat_items in entry.items():
+                if not isinstance(cat_items, list):
+                    raise ValueError("price_history 형식 아님")
+                self._group_cat.append(intern(cat))
+                for item in cat_items:
+                    if type(item) is not dict:
+                        raise ValueError("price_history 형식 아님")
+                    shape = (tuple(item), tuple(map(type, item.values())))
+                    self._row_shape.append(shape_ids.setdefault(shape, len(shape_ids)))
+                    items.append(item)
+                self._group_start.append(len(items))
+            self._entry_start.append(len(self._group_cat))
+
+        names = {}
+        for (shape_names, types), _ in sorted(shape_ids.items(), key=lambda item: item[1]):
+            self._shapes.append(tuple((name, t is int) for name, t in zip(shape_names, types)))
+            names.update(dict.fromkeys(shape_names))
+
+        for name in names:
+            present_types = {t for shape_names, types in shape_ids
+                             for field, t in zip(shape_names, types) if field == name}
+            column = None
+            if present_types <= {int, float}:
+                column = _numeric_column([item.get(name, 0) for item in items])
+            if column is None:
+                column = ("o", array("i", [intern(item.get(name)) for item in items]))
+            self._columns[name] = column
+        return self
+
+    def _view(self, index):
+        view = object.__new__(CompactHistory)
+        view.__dict__.update(self.__dict__)
+        view._index = array("i", index)
+        return view
+
+    # ----- 조회 -----
+    def _indices(self):
+        return range(len(self._epochs)) if self._index is None else self._index
+
+    def __len__(self):
+        return len(self._epochs) if self._index is None else len(self._index)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def key(self, n):
+        code = self._key_codes[n]
+        if code == RAW_KEY:
+            return self._raw_keys[n]
+        return time.strftime(KEY_FORMATS[code], time.gmtime(self._epochs[n]))
+
+    def keys(self):
+        return [self.key(n) for n in self._indices()]
+
+    def latest_key(self):
+        """가장 늦은 시점 키 (max(price_history)와 같은 값)"""
+        return max(self.keys()) if len(self) else None
+
+    def _value(self, field, row, is_int):
+        code, column = self._columns[field]
+        stored = column[row]
+        if code == "o":
+            return self._values[stored]
+        if code == "f":
+            return int(stored) if is_int else _f32_restore(stored)
+        if code == "d" and is_int:
+            return int(stored)
+        return stored
+
+    def _row(self, row):
+        return {name: self._value(name, row, is_int) for name, is_int in self._shapes[self._row_shape[row]]}
+
+    def entry(self, n):
+        """시점 인덱스 n의 {카테고리: [항목 dict]} (새로 만든 dict)"""
+        return {
+            self._values[self._group_cat[g]]: [self._row(r) for r in range(self._group_start[g], self._group_start[g + 1])]
+            for g in range(self._entry_start[n], self._entry_start[n + 1])
+        }
+
+    def items(self):
+        for n in self._indices():
+            yield self.key(n), self.entry(n)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def points(self, *fields):
+        """시점 키 정렬 순서로 (키, 카테고리, 필드 값...) - 항목 dict를 만들지 않음"""
+        for n in sorted(self._indices(), key=self.key):
+            key = self.key(n)
+            for g in range(self._entry_start[n], self._entry_start[n + 1]):
+                cat = self._values[self._group_cat[g]]
+                for r in range(self._group_start[g], self._group_start[g + 1]):
+                    shape = dict(self._shapes[self._row_shape[r]])
+                    yield (key, cat) + tuple(self._value(f, r, shape[f]) if f in shape else None for f in fields)
+
+    def since(self, cutoff):
+        """키 날짜(앞 10자리)가 cutoff(YYYY-MM-DD) 이후인 시점만 (저장 순서 유지)"""
+        day = calendar.timegm(time.strptime(cutoff, "%Y-%m-%d"))
+        return self._view(n for n in self._indices()
+                          if (self._raw_keys[n][:10] >= cutoff if self._key_codes[n] == RAW_KEY
+                              else self._epochs[n] >= day))
+
+    def select(self, keys):
+        """keys에 든 시점만 (저장 순서 유지)"""
+        keys = set(keys)
+        return self._view(n for n in self._indices() if self.key(n) in keys)
+
+    def last(self, limit):
+        """키 정렬 기준 최근 limit개 시점 (키 정렬 순서)"""
+        return self._view(sorted(self._indices(), key=self.key)[-limit:])
+
+    # ----- 직렬화 -----
+    def _renderers(self, shape_id):
+        """shape의 필드별 (접두사, 값 → JSON 문자열)"""
+        encoded = self._encoded
+        memo = {}
+
+        def render(name, is_int):
+            code, column = self._columns[name]
+            if code == "o":
+                return lambda r: encoded[column[r]]
+            if code == "f":
+                if is_int:
+                    return lambda r: str(int(column[r]))
+                def f32(r):
+                    stored = column[r]
+                    if not stored:  # 0.0 / -0.0은 memo 키가 겹치므로 그대로
+                        return repr(stored)
+                    text = memo.get(stored)
+                    if text is None:
+                        text = memo[stored] = repr(_f32_restore(stored))
+                    return text
+                return f32
+            if code == "d" and is_int:
+                return lambda r: str(int(column[r]))
+            return lambda r: repr(column[r])
+
+        return [(("," if i else "") + _dumps(name) + ":", render(name, is_int))
+                for i, (name, is_int) in enumerate(self._shapes[shape_id])]
+
+    def _encode_entry(self, n, renderers):
+        groups = []
+        for g in range(self._entry_start[n], self._entry_start[n + 1]):
+            rows = []
+            for r in range(self._group_start[g], self._group_start[g + 1]):
+                fields = renderers[self._row_shape[r]]
+                rows.append("{" + "".join(prefix + fn(r) for prefix, fn in fields) + "}")
+            groups.append(self._encoded[self._group_cat[g]] + ":[" + ",".join(rows) + "]")
+        return "{" + ",".join(groups) + "}"
+
+    def iter_entries(self):
+        """저장 순서로 (시점 키, 그 시점의 JSON 문자열) - 스트리밍 응답용"""
+        if self._encoded is None:
+            self._encoded = [_dumps(value) for value in self._values]
+        renderers = [self._renderers(i) for i in range(len(self._shapes))]
+        for n in self._indices():
+            yield self.key(n), self._encode_entry(n, renderers)
+
+    def iter_encode(self):
+        """JSON 문자열 조각 - "{", 시점마다 '"키":{...}' (두 번째부터 ',' 포함), "}" """
+        yield "{"
+        for i, (key, entry) in enumerate(self.iter_entries()):
+            yield ("," if i else "") + _dumps(key) + ":" + entry
+        yield "}"
+
+    def encode(self):
+        return "".join(self.iter_encode())
+
+    # ----- 공유 메모리 -----
+    def _arrays(self):
+        arrays = [getattr(self, name) for name in ARRAY_FIELDS] + [column for _, column in self._columns.values()]
+        return arrays + ([self._index] if self._index is not None else [])
+
+    def export(self):
+        """(JSON으로 저장할 메타, 배열 목록) - attach(meta, 배열)로 같은 내용 복원"""
+        meta = {
+            "raw_keys": {str(n): key for n, key in self._raw_keys.items()},
+            "shapes": self._shapes,
+            "columns": [[name, code] for name, (code, _) in self._columns.items()],
+            "values": self._values,
+            "indexed": self._index is not None,
+        }
+        return meta, self._arrays()
+
+    @classmethod
+    def attach(cls, meta, arrays):
+        """export()의 메타 + 배열(array 또는 mmap을 cast한 memoryview)로 만든 읽기 전용 이력"""
+        self = cls()
+        arrays = list(arrays)
+        for name in ARRAY_FIELDS:
+            setattr(self, name, arrays.pop(0))
+        self._raw_keys = {int(n): key for n, key in meta["raw_keys"].items()}
+        self._shapes = [tuple((name, is_int) for name, is_int in shape) for shape in meta["shapes"]]
+        self._columns = {name: (code, arrays.pop(0)) for name, code in meta["columns"]}
+        self._values = meta["values"]
+        self._index = arrays.pop(0) if meta["indexed"] else None
+        return self
+
+    def nbytes(self):
+        """배열 + 값 테이블이 차지하는 대략의 바이트 수"""
+        arrays = [getattr(self, name) for name in ARRAY_FIELDS] + [column for _, column in self._columns.values()]
+        return (sum(a.itemsize * len(a) for a in arrays)
+                + sum(sys.getsizeof(v) for v in self._values)
+                + sum(sys.getsizeof(k) for k in self._raw_keys.values()))
+
+
+def compact(data):
+    """크롤러 JSON의 price_history를 CompactHistory로 바꾼 얕은 사본 (비활성화/변환 불가 시 원본)"""
+    if not ENABLED or not isinstance(data, dict) or not isinstance(data.get("price_history"), dict):
+        return data
+    try:
+        history = CompactHistory.from_dict(data["price_history"])
+    except ValueError as e:
+        print(f"⚠️ price_history 압축 생략: {e}")
+        return data
+    return {**data, "price_history": history}
+
+def points(history, *fields):
+    """dict 또는 CompactHistory에서 시점 키 정렬 순서로 (키, 카테고리, 필드 값...)"""
+    if isinstance(history, CompactHistory):
+        yield from history.points(*fields)
+        return
+    for key in sorted(history):
+        for cat, items in history[key].items():
+            for item in items:
+                yield (key, cat) + tuple(item.get(f) for f in fields)
+
+def history_keys(history):
+    """dict 또는 CompactHistory의 시점 키 목록 (저장 순서)"""
+    return history.keys() if isinstance(history, CompactHistory) else list(history)
+
+def select(history, keys):
+    """keys에 든 시점만 남긴 이력 (입력과 같은 종류, 저장 순서)"""
+    if isinstance(history, CompactHistory):
+        return history.select(keys)
+    keys = set(keys)
+    return {key: value for key, value in history.items() if key in keys}
+
+def iter_entries(history):
+    """dict 또는 CompactHistory의 (시점 키, 그 시점의 JSON 문자열) - 저장 순서"""
+    if isinstance(history, CompactHistory):
+        yield from history.iter_entries()
+        return
+    for key, entry in history.items():
+        yield key, _dumps(entry)
+
+def encode_json(data):
+    """render_json용 - CompactHistory가 들어 있는 dict는 그 부분만 직접 인코딩"""
+    if isinstance(data, CompactHistory):
+        return data.encode()
+    if isinstance(data, dict) and _holds_compact(data):
+        return "{" + ",".join(_dumps(str(key)) + ":" + encode_json(value) for key, value in data.items()) + "}"
+    return _dumps(data)
+
+def _holds_compact(data):
+    # dict 값만 따라 내려감 (리스트 안에는 CompactHistory가 들어가지 않음)
+    return any(isinstance(value, CompactHistory) or (isinstance(value, dict) and _holds_compact(value))
+               for value in data.values())
@@ -0,0 +1,172 @@
+"""
+API 응답 변환 (main.py / render_snapshots.py 공용)
+- 크롤러가 저장한 JSON → 엔드포인트 응답 형태로 변환
+- days / limit 으로 이력 범위를 줄인 사본 생성 (원본 스냅샷은 수정하지 않음)
+- 미리 렌더링한 응답 파일 이름/직렬화 규칙 (FastAPI JSONResponse와 같은 바이트)
+- price_history는 dict 또는 timeseries.CompactHistory 둘 다 받음
+- iter_json / iter_ndjson: 전체 이력 응답을 시점 단위로 나눠 스트리밍 (응답 전체를 메모리에 만들지 않음)
+"""
+
+import os
+import hashlib
+from datetime import datetime, timedelta
+
+from timeseries import CompactHistory, encode_json, iter_entries, points
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 스트리밍 응답 조각 크기 (시점별 문자열을 이만큼 모아서 전송)
+STREAM_CHUNK = 64 * 1024
+
+# 미리 렌더링한 응답 (frontend/public 아래라 정적 빌드 시 CDN으로 배포됨)
+PRERENDERED_DIR = os.environ.get(
+    "PRERENDERED_DIR", os.path.join(BASE_DIR, "..", "frontend", "public", "api-snapshots"))
+
+# 미리 렌더링하는 days 값 (그 외 값은 main.py가 직접 계산)
+RENDER_DAYS = [7, 30, 90]
+
+def build_trend_data(json_data):
+    """ram_price_junggo.json / ram_new_*.json → 현재 시세 + 제품별 추이 (/api/ram-data, /api/ram-new-data 응답)"""
+    if json_data is None:
+        return None
+
+    product_history = {}
+    raw_history = json_data.get("price_history", {})
+    sorted_dates = sorted(raw_history.keys())
+
+    for date, cat, p_name, price in points(raw_history, "product", "price"):
+        if p_name not in product_history:
+            product_history[p_name] = []
+        product_history[p_name].append({"date": date, "price": price})
+
+    return {
+        "current": json_data.get("price_data", {}),
+        "trends": product_history,
+        "total_days": len(sorted_dates),
+        "date_range": f"{sorted_dates[0]} ~ {sorted_dates[-1]}" if sorted_dates else ""
+    }
+
+def _cutoff(latest, days):
+    """가장 최근 날짜(YYYY-MM-DD...)부터 days일 범위의 시작 날짜"""
+    start = datetime.strptime(latest[:10], "%Y-%m-%d") - timedelta(days=days - 1)
+    return start.strftime("%Y-%m-%d")
+
+def limit_days(data, days):
+    """이력을 가장 최근 데이터 기준 days일로 줄인 사본
+
+    - trends 형식(ram-data / ram-new-data): 제품별 추이와 total_days / date_range 재계산
+    - price_history 형식(compuzone-data / dramexchange-data): 시점 키로 필터
+    """
+    if not days or days <= 0 or not isinstance(data, dict):
+        return data
+
+    if isinstance(data.get("trends"), dict):
+        dates = {point["date"] for points in data["trends"].values() for point in points}
+        if not dates:
+            return data
+        cutoff = _cutoff(max(dates), days)
+        trends = {}
+        for name, points in data["trends"].items():
+            recent = [point for point in points if point["date"][:10] >= cutoff]
+            if recent:
+                trends[name] = recent
+        kept = sorted(date for date in dates if date[:10] >= cutoff)
+        return {
+            **data,
+            "trends": trends,
+            "total_days": len(kept),
+            "date_range": f"{kept[0]} ~ {kept[-1]}" if kept else "",
+        }
+
+    history = data.get("price_history")
+    if isinstance(history, CompactHistory) and history:
+        return {**data, "price_history": history.since(_cutoff(history.latest_key(), days))}
+    if isinstance(history, dict) and history:
+        cutoff = _cutoff(max(history), days)
+        return {**data, "price_history": {key: value for key, value in history.items() if key[:10] >= cutoff}}
+
+    return data
+
+def limit_history(data, limit):
+    """이력 데이터를 최근 limit개 시점으로 줄인 사본"""
+    if not isinstance(data, dict):
+        return data
+    data = dict(data)
+    if isinstance(data.get("trends"), dict):
+        data["trends"] = {name: points[-limit:] for name, points in data["trends"].items()}
+    if isinstance(data.get("price_history"), CompactHistory):
+        data["price_history"] = data["price_history"].last(limit)
+    elif isinstance(data.get("price_history"), dict):
+        keys = sorted(data["price_history"])[-limit:]
+        data["price_history"] = {key: data["price_history"][key] for key in keys}
+    for key, items in data.items():
+        # market-data: {카테고리: [{..., "chart": [...]}]}
+        if isinstance(items, list) and items and isinstance(items[0], dict) and "chart" in items[0]:
+            data[key] = [{**item, "chart": item["chart"][-limit:]} for item in items]
+    return data
+
+def snapshot_filename(name, days=None):
+    """미리 렌더링한 응답 파일 이름 (예: ram-data.json, ram-data.days-30.json)"""
+    return f"{name}.days-{days}.json" if days else f"{name}.json"
+
+def source_filename(name):
+    """미리 렌더링할 때 읽은 원본 파일 기록 (예: ram-data.source.json) - {"file": 원본 파일명, "sha256": 내용 해시}"""
+    return f"{name}.source.json"
+
+def file_fingerprint(path):
+    """원본 파일 내용 해시 (git 체크아웃은 mtime이 매번 달라 내용으로 비교)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def render_json(data):
+    """FastAPI(Starlette) JSONResponse와 같은 직렬화 (CompactHistory는 dict로 풀지 않고 바로 인코딩)"""
+    return encode_json(data).encode("utf-8")
+
+def _chunked(pieces):
+    """문자열 조각 → STREAM_CHUNK 정도로 묶은 UTF-8 bytes"""
+    buffer, size = [], 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+def _json_pieces(data):
+    history = data.get("price_history") if isinstance(data, dict) else None
+    if not isinstance(history, (dict, CompactHistory)):
+        yield encode_json(data)
+        return
+    yield "{"
+    for i, (key, value) in enumerate(data.items()):
+        yield ("," if i else "") + encode_json(str(key)) + ":"
+        if key != "price_history":
+            yield encode_json(value)
+            continue
+        yield "{"
+        for j, (time_key, entry) in enumerate(iter_entries(history)):
+            yield ("," if j else "") + encode_json(time_key) + ":" + entry
+        yield "}"
+    yield "}"
+
+def iter_json(data):
+    """render_json(data)와 같은 바이트를 price_history 시점 단위로 나눠 생성"""
+    return _chunked(_json_pieces(data))
+
+def _ndjson_pieces(data):
+    history = data.get("price_history") if isinstance(data, dict) else None
+    if not isinstance(history, (dict, CompactHistory)):
+        yield encode_json(data) + "\n"
+        return
+    yield encode_json({key: value for key, value in data.items() if key != "price_history"}) + "\n"
+    for time_key, entry in iter_entries(history):
+        yield '{"time":' + encode_json(time_key) + ',"data":' + entry + "}\n"
+
+def iter_ndjson(data):
+    """NDJSON - 첫 줄은 price_history를 뺀 나머지 필드, 이후 시점마다 {"time": 키, "data": {카테고리: [...]}}"""
+    return _chunked(_ndjson_pieces(data))
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import axios from 'axios';
 import { 
   LineChart, Line, ResponsiveContainer, YAxis, XAxis, Tooltip, AreaChart, Area, CartesianGrid 
@@ -42,16 +42,29 @@ const App = () => {
   const [adminText, setAdminText] = useState("");
   const [parseLog, setParseLog] = useState("");
 
+  // 현재 기간 (실시간 갱신 이벤트 핸들러는 마운트 때 한 번만 등록되므로 ref로 참조)
+  const periodRef = useRef(globalPeriod);
+  periodRef.current = globalPeriod;
+
   const fetchData = async () => {
     setLoading(true);
     try {
-      const [marketRes, ramRes, dramRes, newPriceRes, czRes] = await Promise.all([
-        axios.get(`${API_URL}/api/market-data?period=${globalPeriod}`),
-        axios.get(`${API_URL}/api/ram-data`),
-        axios.get(`${API_URL}/api/dramexchange-data`),
-        axios.get(`${API_URL}/api/ram-new-data`).catch(() => ({ data: { current: {}, trends: {} } })),
-        axios.get(`${API_URL}/api/compuzone-data`).catch(() => ({ data: { products: {}, price_history: {}, last_updated: "" } }))
-      ]);
+      // ✅ 5개 데이터를 /api/dashboard 한 번으로 받음
+      const dashRes = await axios.get(`${API_URL}/api/dashboard`, { params: { period: globalPeriod } });
+      // 실패한 섹션은 {"error": ...}로 옴 → 섹션별 기본값 사용 (차트가 읽는 키가 없을 때도)
+      const section = (name, key, fallback) => {
+        const value = dashRes.data[name];
+        if (!value || value.error || (key && !(key in value))) {
+          if (value?.error) console.error(`Dashboard section error (${name}):`, value.error);
+          return { data: fallback };
+        }
+        return { data: value };
+      };
+      const marketRes = section('market', null, {});
+      const ramRes = section('ram', 'current', {});
+      const dramRes = section('dramexchange', 'price_history', { current_data: {}, price_history: {} });
+      const newPriceRes = section('ram_new', 'trends', { current: {}, trends: {} });
+      const czRes = section('compuzone', 'price_history', { products: {}, price_history: {}, last_updated: "" });
       
       setData({
         market: marketRes.data,
@@ -113,6 +126,79 @@ const App = () => {
 
   useEffect(() => { fetchData(); }, []);
 
+  // ✅ 실시간 갱신 (/api/events) - 변경분만 받아 상태에 반영, 반영할 수 없으면(reset) 다시 받음
+  const mergeHistory = (prev, delta) => ({
+    ...prev,
+    ...(delta.set || {}),
+    price_history: { ...(prev.price_history || {}), ...(delta.history || {}) }
+  });
+
+  const mergeTrends = (history, delta) => {
+    const next = { ...history, ...(delta.replace || {}) };
+    Object.entries(delta.append || {}).forEach(([product, points]) => {
+      next[product] = [...(next[product] || []), ...points];
+    });
+    return next;
+  };
+
+  const mergeMarket = (market, changes) => {
+    const next = { ...market };
+    Object.entries(changes).forEach(([cat, ticks]) => {
+      next[cat] = (next[cat] || []).map(item => {
+        const tick = ticks.find(t => t.name === item.name);
+        if (!tick) return item;
+        const { append, length, ...values } = tick;
+        return { ...item, ...values, chart: [...(item.chart || []), ...append].slice(-length) };
+      });
+    });
+    return next;
+  };
+
+  const applySnapshotDelta = (delta) => {
+    if (delta.reset) { fetchData(); return; }
+    switch (delta.dataset) {
+      case 'dramexchange-data':
+        setDramData(prev => mergeHistory(prev, delta));
+        break;
+      case 'compuzone-data':
+        setCompuzoneData(prev => mergeHistory(prev, delta));
+        break;
+      case 'ram-data':
+        setData(prev => ({
+          ...prev,
+          ram: delta.set?.current || prev.ram,
+          history: mergeTrends(prev.history, delta)
+        }));
+        break;
+      case 'ram-new-data':
+        setNewPriceData(prev => ({
+          current: delta.set?.current || prev.current,
+          history: mergeTrends(prev.history, delta)
+        }));
+        break;
+      case 'market-data':
+        if (delta.period === periodRef.current && delta.market) {
+          setData(prev => ({ ...prev, market: mergeMarket(prev.market, delta.market) }));
+        }
+        break;
+      default:
+        break;
+    }
+  };
+
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') return;
+    const source = new EventSource(`${API_URL}/api/events`);
+    let connected = false;
+    source.addEventListener('hello', () => {
+      // 재연결이면 끊긴 동안 놓친 변경분이 있을 수 있으니 전체를 다시 받음
+      if (connected) fetchData();
+      connected = true;
+    });
+    source.addEventListener('snapshot', (e) => applySnapshotDelta(JSON.parse(e.data)));
+    return () => source.close();
+  }, []);
+
   useEffect(() => {
     if (activeTab === 'tradingview') {
       const script = document.createElement('script');